@@ -0,0 +1,122 @@
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import discord
+
+ZERO_WIDTH = frozenset("\u200b\u200c\u200d\u2060\ufeff")
+
+# Fastest plausible human answer: seeing the prompt, then typing each character
+HUMAN_REACTION = 0.15
+HUMAN_KEYSTROKE = 0.04
+MIN_SAMPLES = 20 # answers before a player's own history is trusted
+MIN_POPULATION = 200
+MAX_SKETCHES = 10000
+MAX_FLAGGED = 10000 # players whose flags are remembered, least recently flagged are forgotten
+
+class QuantileSketch:
+    """DDSketch-style quantile sketch: log-spaced buckets with a bounded bucket count.
+
+    Quantiles are within `accuracy` relative error. Past the bucket limit the slowest buckets
+    are merged, so memory stays constant and only the slow tail loses accuracy.
+    """
+    __slots__ = ("gamma", "log_gamma", "max_bins", "bins", "count")
+
+    def __init__(self, accuracy: float = 0.05, max_bins: int = 128):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.bins: Dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value: float):
+        key = math.ceil(math.log(max(value, 1e-3)) / self.log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + 1
+        self.count += 1
+        if len(self.bins) > self.max_bins:
+            # Fold the two slowest buckets together, fast answers are the ones that matter here
+            high = sorted(self.bins)[-2:]
+            self.bins[high[0]] += self.bins.pop(high[1])
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return None
+
+class AntiCheat:
+    """Streams minigame answers into per-player and per-game sketches and counts suspicious ones.
+
+    Only sketches and flag counters are kept, never the answers themselves. Both are bounded
+    LRUs, so memory stays constant however many players the bot sees.
+    """
+
+    def __init__(self):
+        self.sketches: "OrderedDict[Tuple[int, str], QuantileSketch]" = OrderedDict() # (user id, game), least recently used first
+        self.population: Dict[str, QuantileSketch] = {}
+        self.flags: "OrderedDict[int, Dict[str, int]]" = OrderedDict() # user id -> reason -> count, least recently flagged first
+        self.last_flag: Dict[int, str] = {} # evicted together with flags
+
+    def sketch(self, user_id: int, game: str) -> QuantileSketch:
+        key = (user_id, game)
+        sketch = self.sketches.get(key)
+        if sketch is None:
+            sketch = self.sketches[key] = QuantileSketch()
+            if len(self.sketches) > MAX_SKETCHES:
+                self.sketches.popitem(last=False)
+        else:
+            self.sketches.move_to_end(key)
+        return sketch
+
+    def flag(self, user_id: int, game: str, reason: str, detail: str):
+        reasons = self.flags.get(user_id)
+        if reasons is None:
+            reasons = self.flags[user_id] = {}
+            if len(self.flags) > MAX_FLAGGED:
+                evicted, _ = self.flags.popitem(last=False)
+                self.last_flag.pop(evicted, None)
+        else:
+            self.flags.move_to_end(user_id)
+        reasons[reason] = reasons.get(reason, 0) + 1
+        self.last_flag[user_id] = f"{game}: {detail}"
+
+    def inspect(self, game: str, message: discord.Message):
+        """Checks a candidate answer for characters nobody types by hand."""
+        if not ZERO_WIDTH.isdisjoint(message.content):
+            self.flag(message.author.id, game, "zero-width", "pasted text with zero-width characters")
+
+    def record(self, game: str, user_id: int, elapsed: float, typed: int = 0) -> Optional[str]:
+        """Adds a winning answer time and returns the reason it was flagged, if it was."""
+        floor = HUMAN_REACTION + typed * HUMAN_KEYSTROKE
+        if elapsed < floor:
+            self.flag(user_id, game, "inhuman", f"{elapsed:.3f}s for {typed} characters")
+            return "inhuman"
+
+        reason = None
+        sketch = self.sketch(user_id, game)
+        if sketch.count >= MIN_SAMPLES and elapsed < sketch.quantile(0.05) / 2:
+            reason = "personal"
+            self.flag(user_id, game, reason, f"{elapsed:.3f}s, usually {sketch.quantile(0.5):.2f}s")
+        population = self.population.setdefault(game, QuantileSketch())
+        if not reason and population.count >= MIN_POPULATION and elapsed < population.quantile(0.01) / 2:
+            reason = "outlier"
+            self.flag(user_id, game, reason, f"{elapsed:.3f}s, fastest 1% is {population.quantile(0.01):.2f}s")
+
+        sketch.add(elapsed)
+        population.add(elapsed)
+        return reason
+
+    def top_flagged(self, limit: int = 10) -> List[Tuple[int, Dict[str, int]]]:
+        return sorted(self.flags.items(), key=lambda item: sum(item[1].values()), reverse=True)[:limit]
+
+    def profile(self, user_id: int) -> Dict[str, Tuple[int, float, float]]:
+        """Returns game -> (answers, median, fastest 5%) for a player."""
+        report = {}
+        for (uid, game), sketch in self.sketches.items():
+            if uid == user_id:
+                report[game] = (sketch.count, sketch.quantile(0.5), sketch.quantile(0.05))
+        return report
@@ -2,33 +2,49 @@ import discord
 from discord.ext import commands
 import os
 import json
+import time
+import asyncio
+from typing import Optional
 from .logger import Logger
 from .storage import Storage
 from .manager import GameManager
+from .puzzles import PuzzlePool
+from .anticheat import AntiCheat
+from .members import MemberResolver, DEFAULT_CAPACITY
+from . import metrics
 from games import GAMES_REGISTRY
 
 class DiscordGameBot(commands.Bot):
     def __init__(self, config: dict):
         intents = discord.Intents.default()
         intents.message_content = True
+        # Needed to request members by id, but none are cached or chunked: see core/members.py
         intents.members = True
         
         super().__init__(
             command_prefix=config.get("prefix", "!"),
             intents=intents,
-            help_command=None
+            help_command=None,
+            member_cache_flags=discord.MemberCacheFlags.none(),
+            chunk_guilds_at_startup=False,
+            http_trace=metrics.http_trace()
         )
         self.config = config
         self.logger = Logger.setup_logger()
         self.game_manager = GameManager(self)
+        self.puzzle_pool = PuzzlePool()
+        self.anticheat = AntiCheat()
+        self.members = MemberResolver(self, config.get("member_cache_size", DEFAULT_CAPACITY))
+        self.metrics_server: Optional[metrics.MetricsServer] = None
+        self.lag_watcher: Optional[asyncio.Task] = None
 
     async def setup_hook(self):
+        await self.start_metrics()
         self.logger.info("Setting up bot extensions...")
-        await self.game_manager.restore_games()
         
         # Load core commands
         try:
-            await self.load_extension("core.commands")
+            await self.timed_load("core.commands")
             self.logger.info("Loaded core commands.")
         except Exception as e:
             self.logger.error(f"Failed to load core commands: {e}")
@@ -36,17 +52,49 @@ class DiscordGameBot(commands.Bot):
         # Load all registered games
         for game_key, info in GAMES_REGISTRY.items():
             try:
-                await self.load_extension(info['cog_path'])
+                await self.timed_load(info['cog_path'])
                 self.logger.info(f"Loaded game extension: {info['name']}")
             except Exception as e:
                 self.logger.error(f"Failed to load game {info['name']}: {e}")
                 
+        # Restore after the games are loaded so every game type is registered
+        await self.game_manager.restore_games()
+        # Start filling puzzle queues for every game that registered a generator
+        self.puzzle_pool.start()
         await self.sync_commands()
 
+    async def timed_load(self, path: str):
+        started = time.perf_counter()
+        await self.load_extension(path)
+        metrics.COG_LOAD_SECONDS.labels(path).set(time.perf_counter() - started)
+
+    async def start_metrics(self):
+        metrics.watch_games(self.game_manager)
+        self.lag_watcher = asyncio.create_task(metrics.watch_loop_lag())
+        port = self.config.get("metrics_port", metrics.DEFAULT_PORT)
+        if not port:
+            return
+        self.metrics_server = metrics.MetricsServer(port)
+        try:
+            await self.metrics_server.start()
+            self.logger.info(f"Serving metrics on http://127.0.0.1:{port}/metrics")
+        except OSError as e:
+            self.logger.error(f"Failed to start the metrics endpoint on port {port}: {e}")
+            self.metrics_server = None
+
+    async def close(self):
+        if self.lag_watcher:
+            self.lag_watcher.cancel()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        await super().close()
+
     async def sync_commands(self):
         try:
             self.logger.info("Syncing slash commands...")
+            started = time.perf_counter()
             synced = await self.tree.sync()
+            metrics.SYNC_SECONDS.set(time.perf_counter() - started)
             self.logger.info(f"Synced {len(synced)} global commands.")
         except Exception as e:
             self.logger.error(f"Failed to sync commands: {e}")
@@ -54,3 +102,7 @@ class DiscordGameBot(commands.Bot):
     async def on_ready(self):
         self.logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
         await self.change_presence(activity=discord.Game(name="🎮 Games | /help"))
+
+    async def on_interaction(self, interaction: discord.Interaction):
+        # Commands, components and modals alike, timed until the response acknowledges them
+        metrics.interaction_timer.received(interaction)
@@ -1,8 +1,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
+from typing import Optional
 from .embeds import EmbedFactory
 from .views import BaseLobbyView
+from .timing import jitter_stats
+from .lifecycle import live_objects
 from games import GAMES_REGISTRY
 
 class GameCommands(commands.Cog):
@@ -42,15 +45,92 @@ class GameCommands(commands.Cog):
 
     @app_commands.command(name="stop", description="Stop the current game in this channel.")
     async def stop(self, interaction: discord.Interaction):
-        game = self.bot.game_manager.get_game_in_channel(interaction.channel_id)
+        manager = self.bot.game_manager
+        game = manager.get_game_in_channel(interaction.channel_id) or manager.get_user_game(interaction.user.id)
         if not game:
             return await interaction.response.send_message("No active game in this channel.", ephemeral=True)
             
         if interaction.user != game.host and not interaction.user.guild_permissions.manage_messages:
             return await interaction.response.send_message("Only the host or a moderator can stop the game.", ephemeral=True)
             
-        await self.bot.game_manager.unregister_game(game.game_id)
-        await interaction.response.send_message(f"Game '{game.game_id}' has been stopped.")
+        await game.end_game("stopped")
+        await interaction.response.send_message(f"{game.display_name} game '{game.game_id}' has been stopped.")
+
+    @app_commands.command(name="stopall", description="Stop every game and lobby in this server.")
+    @app_commands.default_permissions(manage_guild=True)
+    async def stopall(self, interaction: discord.Interaction):
+        manager = self.bot.game_manager
+        by_state = {}
+        for game in manager.games_in_guild(interaction.guild_id):
+            by_state[game.state] = by_state.get(game.state, 0) + 1
+        stopped = await manager.stop_guild(interaction.guild_id)
+        if not stopped:
+            return await interaction.response.send_message("No games are running in this server.", ephemeral=True)
+        summary = ", ".join(f"{count} {state}" for state, count in sorted(by_state.items()))
+        await interaction.response.send_message(f"Stopped {stopped} game{'s' if stopped != 1 else ''} ({summary}).")
+
+    @app_commands.command(name="gamestats", description="Show running games and the game objects still in memory.")
+    @app_commands.default_permissions(manage_guild=True)
+    async def gamestats(self, interaction: discord.Interaction):
+        manager = self.bot.game_manager
+        states = ", ".join(f"{len(ids)} {state}" for state, ids in sorted(manager.state_games.items())) or "none"
+        live = {}
+        for (name, kind), count in live_objects.snapshot().items():
+            live.setdefault(name, []).append(f"{count} {kind}{'s' if count != 1 else ''}")
+        lines = [f"**Registered:** {len(manager.active_games)} ({states})", ""]
+        lines += [f"**{name}**: {', '.join(kinds)}" for name, kinds in sorted(live.items())]
+        members = self.bot.members.stats()
+        lines += ["", f"**Members cached:** {members['cached']}/{members['capacity']} ({members['hits']} hits, {members['misses']} misses, {members['fetched']} fetched)"]
+        embed = EmbedFactory.create_embed("🧮 Games", "\n".join(lines))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="puzzlestats", description="Show puzzle pool hit and miss rates.")
+    @app_commands.default_permissions(manage_guild=True)
+    async def puzzlestats(self, interaction: discord.Interaction):
+        stats = self.bot.puzzle_pool.stats()
+        if not stats:
+            return await interaction.response.send_message("No puzzles have been generated yet.", ephemeral=True)
+
+        lines = [
+            f"**{key}**: {s['ready']} ready | {s['hits']} hits, {s['misses']} misses ({s['hit_rate']:.0%} hit rate)"
+            for key, s in sorted(stats.items())
+        ]
+        embed = EmbedFactory.create_embed("🧩 Puzzle Pool", "\n".join(lines))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="timingstats", description="Show how much lag snowflake timing removes from reaction times.")
+    @app_commands.default_permissions(manage_guild=True)
+    async def timingstats(self, interaction: discord.Interaction):
+        stats = jitter_stats.summary()
+        desc = (
+            f"**Answers timed:** {stats['count']}\n"
+            f"**Mean jitter removed:** {stats['mean'] * 1000:.0f} ms\n"
+            f"**Max jitter removed:** {stats['max'] * 1000:.0f} ms"
+        )
+        embed = EmbedFactory.create_embed("⏱️ Timing", desc)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="anticheat", description="Show players flagged for suspicious minigame answers.")
+    @app_commands.describe(user="Show one player's answer times and flags")
+    @app_commands.default_permissions(manage_guild=True)
+    async def anticheat(self, interaction: discord.Interaction, user: Optional[discord.Member] = None):
+        tracker = self.bot.anticheat
+        if user:
+            flags = tracker.flags.get(user.id, {})
+            lines = [f"**{game}:** {count} answers, median {median:.2f}s, fastest 5% {fast:.2f}s" for game, (count, median, fast) in tracker.profile(user.id).items()]
+            lines.append("")
+            lines.append("**Flags:** " + (", ".join(f"{reason} x{count}" for reason, count in flags.items()) or "none"))
+            if user.id in tracker.last_flag:
+                lines.append(f"**Last flag:** {tracker.last_flag[user.id]}")
+            embed = EmbedFactory.create_embed(f"🛡️ Anti-cheat: {user.display_name}", "\n".join(lines))
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        lines = []
+        for user_id, flags in tracker.top_flagged():
+            summary = ", ".join(f"{reason} x{count}" for reason, count in flags.items())
+            lines.append(f"<@{user_id}> - {summary}\n╰ {tracker.last_flag.get(user_id, '')}")
+        embed = EmbedFactory.create_embed("🛡️ Anti-cheat", "\n".join(lines) or "No suspicious answers so far.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="help", description="Show help information.")
     async def help(self, interaction: discord.Interaction):
@@ -59,6 +139,7 @@ class GameCommands(commands.Cog):
 - `/play <game>`: Start a new game lobby.
 - `/games`: List all available games.
 - `/stop`: Stop the current game in the channel.
+- `/stopall`: Stop every game in the server (admins).
 - `/help`: Show this message.
 
 **How to play:**
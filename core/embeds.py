@@ -2,6 +2,8 @@ import discord
 from typing import Optional, List
 from .utils import get_emoji
 
+LOBBY_LIST_LIMIT = 30
+
 class EmbedFactory:
     @staticmethod
     def create_embed(
@@ -75,7 +77,10 @@ class EmbedFactory:
         if rules:
             desc += f"**Rules:**\n{rules}\n\n"
             
-        player_list = "\n".join([f"{i+1}. {p.mention}" for i, p in enumerate(players)])
+        # Big lobbies list the first few, a full list would overflow the embed
+        player_list = "\n".join([f"{i+1}. {p.mention}" for i, p in enumerate(players[:LOBBY_LIST_LIMIT])])
+        if player_count > LOBBY_LIST_LIMIT:
+            player_list += f"\n...and {player_count - LOBBY_LIST_LIMIT} more"
         desc += f"**Current Players:**\n{player_list}"
         
         return EmbedFactory.create_embed(
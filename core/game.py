@@ -1,22 +1,52 @@
 import uuid
 import asyncio
-import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Type
 import discord
 from .storage import Storage
+from .lifecycle import Lifecycle
+
+# game_type -> game class, filled automatically by BaseGame subclasses
+GAME_TYPES: Dict[str, Type["BaseGame"]] = {}
 
 class BaseGame:
+    game_type = "base"
+    display_name = "Game"
+    # Only one active game of an exclusive kind per channel
+    exclusive = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        GAME_TYPES[cls.game_type] = cls
+
     def __init__(self, game_id: str, host: discord.Member, channel: discord.TextChannel):
         self.game_id = game_id or str(uuid.uuid4())
         self.host = host
         self.players: List[discord.Member] = [host]
         self.channel = channel
         self.state = "lobby"
-        self.game_data: Dict[str, Any] = {}
+        self.manager = None # set by GameManager.register_game
+        self.lifecycle = Lifecycle(self)
+
+    @property
+    def members(self):
+        """The bot's MemberResolver, once the game is registered."""
+        return self.manager.bot.members if self.manager else None
+
+    @property
+    def guild_id(self) -> Optional[int]:
+        guild = getattr(self.channel, "guild", None)
+        return guild.id if guild else None
+
+    async def set_state(self, state: str):
+        # Through the manager while registered, so its state index follows
+        if self.manager:
+            await self.manager.set_state(self, state)
+        else:
+            self.state = state
+            await self.save_game()
 
     async def create_lobby(self):
-        self.state = "lobby"
-        await self.save_game()
+        await self.set_state("lobby")
 
     async def join_player(self, player: discord.Member):
         if player not in self.players:
@@ -29,25 +59,34 @@ class BaseGame:
             await self.save_game()
 
     async def start_game(self):
-        self.state = "active"
-        await self.save_game()
+        await self.set_state("active")
+        self.lifecycle.start()
 
     async def end_game(self, reason: str = "finished"):
-        self.state = reason
-        await self.save_game()
-        # Clean up storage
-        storage_path = f"storage/active_games/{self.game_id}.json"
-        if os.path.exists(storage_path):
-            os.remove(storage_path)
+        # Stops views, cancels timers, unregisters and removes the saved state
+        await self.lifecycle.end(reason)
+
+    def to_state(self) -> Dict[str, Any]:
+        """Returns the subclass specific state to persist. Must be JSON serializable."""
+        return {}
+
+    def from_state(self, state: Dict[str, Any]):
+        """Applies a state produced by to_state to a freshly built game."""
+        pass
+
+    async def on_restore(self, bot: discord.Client):
+        """Called once a game has been rebuilt from storage, e.g. to re-arm timers."""
+        pass
 
     async def save_game(self):
         data = {
             "game_id": self.game_id,
+            "game_type": self.game_type,
             "host_id": self.host.id,
             "player_ids": [p.id for p in self.players],
             "channel_id": self.channel.id,
             "state": self.state,
-            "game_data": self.game_data
+            "type_state": self.to_state()
         }
         await Storage.save_json(f"storage/active_games/{self.game_id}.json", data)
 
@@ -56,15 +95,67 @@ class BaseGame:
         data = await Storage.load_json(f"storage/active_games/{game_id}.json")
         if not data:
             return None
-        
-        channel = bot.get_channel(data["channel_id"])
-        host = bot.get_user(data["host_id"])
-        if not channel or not host:
+
+        # Rebuild the class that saved the game, not the one load_game was called on
+        game_cls = restorable_type(data)
+        if game_cls is None:
+            return None
+
+        channel = await _resolve(bot.get_channel, bot.fetch_channel, data["channel_id"])
+        if not channel:
             return None
-            
-        game = cls(data["game_id"], host, channel)
+        # Members are not cached, fetch the host and players in one batch
+        members = await bot.members.prefetch(getattr(channel, "guild", None), [data["host_id"], *data["player_ids"]])
+        host = members.get(data["host_id"])
+        if not host:
+            return None
+
+        game = game_cls(data["game_id"], host, channel)
         game.state = data["state"]
-        game.game_data = data["game_data"]
-        # Note: we might need to fetch players here if they aren't in cache
-        game.players = [bot.get_user(pid) for pid in data["player_ids"]]
+        game.players = [members[pid] for pid in data["player_ids"] if pid in members]
+        game.from_state(data.get("type_state", {}))
         return game
+
+GAME_TYPES[BaseGame.game_type] = BaseGame
+
+class GameSession(BaseGame):
+    """A lobby and the game it starts, for games that keep their state in views.
+
+    Sessions are registered with the GameManager like any game, so players, quotas and
+    /stop work the same, but nothing is persisted.
+    """
+    game_type = "session"
+    exclusive = False
+
+    def __init__(self, display_name: str, host: discord.Member, channel: Optional[discord.abc.Messageable] = None):
+        self.display_name = display_name
+        super().__init__(None, host, channel)
+        self.lobby: Optional[discord.ui.View] = None
+
+    async def save_game(self):
+        pass
+
+    async def leave_player(self, player: discord.Member):
+        # Once the game runs, knocked out players leave the session, the host included
+        if self.state != "lobby" and player in self.players:
+            self.players.remove(player)
+        else:
+            await super().leave_player(player)
+
+def restorable_type(data: Dict[str, Any]) -> Optional[Type[BaseGame]]:
+    """The game class a save rebuilds into. None for saves without a registered subclass,
+    e.g. untyped lobbies saved before game types existed, which nothing could resume."""
+    game_cls = GAME_TYPES.get(data.get("game_type"))
+    if game_cls is None or game_cls in (BaseGame, GameSession):
+        return None
+    return game_cls
+
+async def _resolve(get, fetch, object_id: int):
+    # The cache is still empty while setup_hook runs, so fall back to the API
+    obj = get(object_id)
+    if obj:
+        return obj
+    try:
+        return await fetch(object_id)
+    except discord.HTTPException:
+        return None
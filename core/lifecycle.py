@@ -0,0 +1,194 @@
+"""Lifecycle of a game: hooks, owned resources and live-object counts.
+
+Every game (persisted games and lobby sessions alike) owns a Lifecycle. Views and tasks a game
+creates are handed to it, and ending the game, however it ends, stops the views (which also
+drops them from discord.py's view store), cancels the tasks, runs cleanup callbacks and
+unregisters the game from the GameManager. Ending twice is a no-op.
+
+Hooks: `created`, `started`, `ended` and `errored` are emitted for every game, listeners are
+added with `hooks.listen(name, callback)`.
+
+Games, views and tasks are counted per game with weakrefs. Once a game has ended and been
+collected its counts drop back, so a soak test can check that memory returns to baseline,
+as tests/test_lifecycle.py does.
+"""
+import asyncio
+import os
+import weakref
+from collections import Counter
+from typing import Callable, Dict, List, Set, Tuple
+from .logger import Logger
+
+HOOKS = ("created", "started", "ended", "errored")
+
+class LifecycleHooks:
+    """Listeners called as callback(game, *args) for each lifecycle event. They must not block."""
+
+    def __init__(self):
+        self.listeners: Dict[str, List[Callable]] = {hook: [] for hook in HOOKS}
+        self.logger = Logger.setup_logger()
+
+    def listen(self, hook: str, callback: Callable):
+        self.listeners[hook].append(callback)
+
+    def emit(self, hook: str, game, *args):
+        for callback in self.listeners[hook]:
+            try:
+                callback(game, *args)
+            except Exception as e:
+                self.logger.error(f"Lifecycle hook {hook} failed for {game.display_name} {game.game_id}: {e}")
+
+class LiveObjects:
+    """Number of live games, views and tasks per game, kept with weakref finalizers."""
+
+    def __init__(self):
+        self.live: Counter = Counter() # (game name, kind) -> objects alive
+        self.created: Counter = Counter() # (game name, kind) -> objects ever tracked
+
+    def track(self, name: str, kind: str, obj):
+        key = (name, kind)
+        self.live[key] += 1
+        self.created[key] += 1
+        weakref.finalize(obj, self._release, key)
+
+    def _release(self, key: Tuple[str, str]):
+        self.live[key] -= 1
+
+    def snapshot(self) -> Dict[Tuple[str, str], int]:
+        return {key: count for key, count in self.live.items() if count}
+
+    def total(self, kind: str = "game") -> int:
+        return sum(count for (_, k), count in self.live.items() if k == kind)
+
+hooks = LifecycleHooks()
+live_objects = LiveObjects()
+
+class Lifecycle:
+    """Owns a game's views, tasks and cleanup callbacks and releases them when it ends."""
+
+    def __init__(self, game):
+        # A weak reference, so the lifecycle never keeps its own game alive
+        self._game = weakref.ref(game)
+        self.name = game.display_name
+        self.views: List = []
+        self.tasks: Set[asyncio.Task] = set()
+        self.cleanups: List[Callable] = []
+        self.started = False
+        self.ended = False
+        live_objects.track(self.name, "game", game)
+        hooks.emit("created", game)
+
+    @property
+    def game(self):
+        return self._game()
+
+    def own_view(self, view, expires: bool = True):
+        """Stops the view when the game ends. Returns it, for `view = lifecycle.own_view(View(...))`.
+
+        The view gets `view.lifecycle` to spawn its timers with. Unless expires is False, the view
+        timing out ends the game as "expired", so an abandoned game does not keep its players.
+        Pass False for side views (role reveals, prompts) that may time out while the game goes on.
+        """
+        view.lifecycle = self
+        if self.ended:
+            view.stop()
+            return view
+        if expires and view.timeout is not None:
+            on_timeout = view.on_timeout
+            async def expire():
+                try:
+                    await on_timeout()
+                finally:
+                    await self.end("expired")
+            view.on_timeout = expire
+        self.views.append(view)
+        live_objects.track(self.name, "view", view)
+        return view
+
+    def own_task(self, task: asyncio.Task) -> asyncio.Task:
+        """Cancels the task when the game ends, unless it is the one ending it."""
+        if self.ended:
+            task.cancel()
+            return task
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        live_objects.track(self.name, "task", task)
+        return task
+
+    def spawn(self, coro) -> asyncio.Task:
+        """Runs a coroutine as an owned task. An exception in it ends the game as errored."""
+        async def guarded():
+            try:
+                await coro
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await self.error(e)
+        task = asyncio.create_task(guarded())
+        # Cancelled before it ran, the coroutine would warn it was never awaited
+        task.add_done_callback(lambda _: coro.close())
+        return self.own_task(task)
+
+    async def release(self, player):
+        """Frees a player knocked out of the game for other games, the game goes on without them."""
+        game = self.game
+        if game is None:
+            return
+        if game.manager:
+            await game.manager.remove_player(game, player)
+        else:
+            await game.leave_player(player)
+
+    def on_cleanup(self, callback: Callable):
+        """Calls callback() (sync or async) when the game ends."""
+        self.cleanups.append(callback)
+
+    def start(self):
+        if not self.started and not self.ended:
+            self.started = True
+            hooks.emit("started", self.game)
+
+    async def error(self, error: Exception):
+        game = self.game
+        if game is None or self.ended:
+            return
+        Logger.setup_logger().error(f"{self.name} game {game.game_id} failed: {error!r}")
+        hooks.emit("errored", game, error)
+        await game.end_game("errored")
+
+    async def end(self, reason: str = "finished"):
+        """Releases everything the game owns. Safe to call more than once."""
+        if self.ended:
+            return
+        self.ended = True
+        game = self.game
+
+        current = asyncio.current_task()
+        for task in list(self.tasks):
+            if task is not current:
+                task.cancel()
+        self.tasks.clear()
+
+        for view in self.views:
+            if not view.is_finished():
+                view.stop()
+        self.views.clear()
+
+        for callback in self.cleanups:
+            try:
+                result = callback()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                Logger.setup_logger().error(f"Cleanup of {self.name} game failed: {e}")
+        self.cleanups.clear()
+
+        if game is None:
+            return
+        if game.manager:
+            await game.manager.unregister_game(game.game_id)
+        game.state = reason
+        storage_path = f"storage/active_games/{game.game_id}.json"
+        if os.path.exists(storage_path):
+            os.remove(storage_path)
+        hooks.emit("ended", game, reason)
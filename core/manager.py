@@ -1,44 +1,136 @@
 import discord
-from typing import Dict, Optional, List
-from .game import BaseGame
+from typing import Dict, Optional, List, Set
+from .game import BaseGame, restorable_type
 from .logger import Logger
 from .storage import Storage
 import os
 
+DEFAULT_GUILD_LIMIT = 10 # concurrent games per guild, lobbies included
+
+class GameConflict(Exception):
+    """A game could not be registered or joined. The message is meant for the user."""
+
 class GameManager:
+    """Every lobby and game, indexed by id, channel, user, guild and state.
+
+    The indexes are only changed here, on register, join, leave, state change and unregister,
+    so they never drift apart. A user is in at most one game at a time.
+    """
+
     def __init__(self, bot: discord.Client):
         self.bot = bot
         self.active_games: Dict[str, BaseGame] = {} # game_id -> game
-        self.channel_games: Dict[int, str] = {} # channel_id -> game_id
+        self.channel_games: Dict[int, Set[str]] = {} # channel_id -> game_ids
+        self.user_games: Dict[int, str] = {} # user_id -> game_id
+        self.guild_games: Dict[int, Set[str]] = {} # guild_id -> game_ids
+        self.state_games: Dict[str, Set[str]] = {} # state -> game_ids
+        self.guild_limit = getattr(bot, "config", {}).get("max_games_per_guild", DEFAULT_GUILD_LIMIT)
         self.logger = Logger.setup_logger()
 
+    def get_game(self, game_id: str) -> Optional[BaseGame]:
+        return self.active_games.get(game_id)
+
     def get_game_in_channel(self, channel_id: int) -> Optional[BaseGame]:
-        game_id = self.channel_games.get(channel_id)
-        if game_id:
-            return self.active_games.get(game_id)
-        return None
+        """The channel's game, a persisted one (Mafia, HotXO) first if lobbies share the channel."""
+        games = [self.active_games[gid] for gid in self.channel_games.get(channel_id, ())]
+        if not games:
+            return None
+        return next((g for g in games if g.exclusive), games[0])
 
-    async def register_game(self, game: BaseGame):
-        if game.channel.id in self.channel_games:
-            existing_game = self.get_game_in_channel(game.channel.id)
-            if existing_game and existing_game.state == "active":
-                raise Exception("A game is already active in this channel!")
-        
+    def get_user_game(self, user_id: int) -> Optional[BaseGame]:
+        game_id = self.user_games.get(user_id)
+        return self.active_games.get(game_id) if game_id else None
+
+    def games_in_guild(self, guild_id: int) -> List[BaseGame]:
+        return [self.active_games[gid] for gid in self.guild_games.get(guild_id, ())]
+
+    def games_in_state(self, state: str) -> List[BaseGame]:
+        return [self.active_games[gid] for gid in self.state_games.get(state, ())]
+
+    def check_players(self, game: BaseGame, players: List[discord.abc.User]):
+        for player in players:
+            other = self.get_user_game(player.id)
+            if other and other.game_id != game.game_id:
+                raise GameConflict(f"{player.mention} is already in a game of {other.display_name}! Finish or leave it first.")
+
+    def _index(self, game: BaseGame):
         self.active_games[game.game_id] = game
-        self.channel_games[game.channel.id] = game.game_id
+        self.channel_games.setdefault(game.channel.id, set()).add(game.game_id)
+        if game.guild_id:
+            self.guild_games.setdefault(game.guild_id, set()).add(game.game_id)
+        self.state_games.setdefault(game.state, set()).add(game.game_id)
+        for player in game.players:
+            self.user_games[player.id] = game.game_id
+
+    def _unindex(self, game: BaseGame):
+        self.active_games.pop(game.game_id, None)
+        for index, key in ((self.channel_games, game.channel.id), (self.guild_games, game.guild_id), (self.state_games, game.state)):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(game.game_id)
+                if not ids:
+                    del index[key]
+        for player in game.players:
+            if self.user_games.get(player.id) == game.game_id:
+                del self.user_games[player.id]
+
+    async def register_game(self, game: BaseGame):
+        if game.exclusive:
+            for other in self.channel_games.get(game.channel.id, ()):
+                existing = self.active_games[other]
+                if existing.exclusive and existing.state == "active":
+                    raise GameConflict("A game is already active in this channel!")
+        if game.guild_id and len(self.guild_games.get(game.guild_id, ())) >= self.guild_limit:
+            raise GameConflict(f"This server already has {self.guild_limit} games running, wait for one to finish!")
+        self.check_players(game, game.players)
+
+        self._index(game)
+        game.manager = self
+        await game.save_game()
+
+    async def hand_over(self, lobby: BaseGame, game: BaseGame):
+        """Replaces a lobby with the persisted game it started, the players move along."""
+        await lobby.end_game("handed over")
+        await self.register_game(game)
+
+    async def add_player(self, game: BaseGame, player: discord.abc.User):
+        self.check_players(game, [player])
+        self.user_games[player.id] = game.game_id
+        await game.join_player(player)
+
+    async def remove_player(self, game: BaseGame, player: discord.abc.User):
+        await game.leave_player(player)
+        if player not in game.players and self.user_games.get(player.id) == game.game_id:
+            del self.user_games[player.id]
+
+    async def set_state(self, game: BaseGame, state: str):
+        if game.game_id in self.active_games:
+            ids = self.state_games.get(game.state)
+            if ids is not None:
+                ids.discard(game.game_id)
+                if not ids:
+                    del self.state_games[game.state]
+            self.state_games.setdefault(state, set()).add(game.game_id)
+        game.state = state
         await game.save_game()
 
     async def unregister_game(self, game_id: str):
         game = self.active_games.get(game_id)
         if game:
-            if game.channel.id in self.channel_games:
-                del self.channel_games[game.channel.id]
-            del self.active_games[game_id]
-            
+            self._unindex(game)
+
             storage_path = f"storage/active_games/{game_id}.json"
             if os.path.exists(storage_path):
                 os.remove(storage_path)
 
+    async def stop_guild(self, guild_id: int, reason: str = "stopped") -> int:
+        """Ends every game and lobby in a guild and returns how many there were."""
+        games = self.games_in_guild(guild_id)
+        for game in games:
+            await game.end_game(reason)
+            await self.unregister_game(game.game_id) # in case end_game is overridden
+        return len(games)
+
     async def restore_games(self):
         self.logger.info("Restoring active games...")
         storage_dir = "storage/active_games"
@@ -48,11 +140,18 @@ class GameManager:
         for filename in os.listdir(storage_dir):
             if filename.endswith(".json"):
                 game_id = filename[:-5]
+                path = os.path.join(storage_dir, filename)
                 try:
+                    if restorable_type(await Storage.load_json(path)) is None:
+                        # Restored as a bare BaseGame it would only hold its players hostage
+                        os.remove(path)
+                        self.logger.info(f"Dropped save {game_id}, it has no restorable game type")
+                        continue
                     game = await BaseGame.load_game(game_id, self.bot)
                     if game:
-                        self.active_games[game_id] = game
-                        self.channel_games[game.channel.id] = game_id
-                        self.logger.info(f"Restored game {game_id}")
+                        self._index(game)
+                        game.manager = self
+                        await game.on_restore(self.bot)
+                        self.logger.info(f"Restored {game.game_type} game {game_id}")
                 except Exception as e:
                     self.logger.error(f"Failed to restore game {game_id}: {e}")
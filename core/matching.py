@@ -0,0 +1,140 @@
+import re
+import json
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+COUNTRY_ALIASES = "data/country_aliases.json"
+MAX_TYPOS = 2 # the most max_typos allows, the deletion index is built that deep
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+def normalize(text: str) -> str:
+    """Folds an answer to a comparable form: NFKC, casefolded, no accents, punctuation or extra spaces."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    text = _SPACES.sub(" ", _PUNCTUATION.sub("", text)).strip()
+    if text.startswith("the "):
+        text = text[4:]
+    return text
+
+def typo_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Edit distance where swapping two neighbouring letters (frnace) is a single typo.
+
+    With a limit only the diagonal band the answer can lie in is filled, anything further
+    away comes back as limit + 1.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is None:
+        limit = len(a)
+    far = limit + 1
+    if len(a) - len(b) > limit:
+        return far
+    before, previous = None, [min(j, far) for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        current = [min(i, far)] + [far] * len(b)
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cb = b[j - 1]
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb), far)
+            if before and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current[j] = cost
+        before, previous = previous, current
+    return previous[-1]
+
+def max_typos(text: str) -> int:
+    """Short answers must be exact, longer ones may have a typo or two."""
+    if len(text) <= 3:
+        return 0
+    return 1 if len(text) <= 7 else 2
+
+def deletions(word: str, depth: int) -> Set[str]:
+    """The word and everything left of it after deleting up to depth letters."""
+    found = frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        found = found | frontier
+    return found
+
+class DeletionIndex:
+    """Finds the words within a few typos of a query, SymSpell style.
+
+    Two strings within k typos of each other (insertions, deletions, substitutions or swaps)
+    leave a common string once at most k letters are deleted from each. Every word is filed
+    under its deletions when the index is built, so a search is a few dozen dict lookups on the
+    query's own deletions, then typo_distance on the handful of words they turn up.
+    """
+
+    def __init__(self, depth: int = MAX_TYPOS):
+        self.depth = depth
+        self.words: Dict[str, Set[str]] = {} # deletion -> words it was left by
+
+    def add(self, word: str):
+        for variant in deletions(word, self.depth):
+            self.words.setdefault(variant, set()).add(word)
+
+    def search(self, word: str, tolerance: int) -> List[Tuple[int, str]]:
+        if tolerance > self.depth:
+            raise ValueError(f"The index only finds words within {self.depth} typos")
+        candidates = set()
+        for variant in deletions(word, tolerance):
+            candidates.update(self.words.get(variant, ()))
+        found = []
+        for candidate in candidates:
+            distance = typo_distance(word, candidate, tolerance)
+            if distance <= tolerance:
+                found.append((distance, candidate))
+        return found
+
+class AnswerIndex:
+    """Maps anything a player might type for an answer back to its canonical name.
+
+    Built once per dataset. Exact and alias hits are a dict lookup, typos go through a deletion index.
+    A typo that is as close to two different answers (Irak: Iran or Iraq?) matches neither.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Iterable[str]]]):
+        self.aliases: Dict[str, str] = {} # normalized alias -> canonical name
+        self.typos = DeletionIndex()
+        for name, aliases in entries:
+            for alias in (name, *aliases):
+                key = normalize(alias)
+                if key:
+                    self.aliases.setdefault(key, name)
+                    self.typos.add(key)
+
+    def match(self, text: str) -> Optional[str]:
+        key = normalize(text)
+        name = self.aliases.get(key)
+        if name or not key:
+            return name
+
+        tolerance = max_typos(key)
+        if not tolerance:
+            return None
+        candidates = self.typos.search(key, tolerance)
+        if not candidates:
+            return None
+        best = min(distance for distance, _ in candidates)
+        names = {self.aliases[alias] for distance, alias in candidates if distance == best}
+        return names.pop() if len(names) == 1 else None
+
+    def matches(self, text: str, name: str) -> bool:
+        return self.match(text) == name
+
+@lru_cache(maxsize=1)
+def load_country_aliases() -> Dict[str, List[str]]:
+    with open(COUNTRY_ALIASES, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+@lru_cache(maxsize=8)
+def country_index(names: Tuple[str, ...]) -> AnswerIndex:
+    """Index of a game's countries plus every other known country, so a typo is never
+    accepted for the answer when it is closer to a different country."""
+    aliases = load_country_aliases()
+    entries = {name: aliases.get(name, []) for name in aliases}
+    for name in names:
+        entries.setdefault(name, aliases.get(name, []))
+    return AnswerIndex(entries.items())
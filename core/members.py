@@ -0,0 +1,124 @@
+"""Members on demand, for running without discord.py's member cache.
+
+The bot does not cache or chunk guild members, so memory follows the number of players rather
+than the size of the servers. Games resolve the people they talk about through
+`bot.members`: a bounded LRU of the members seen in lobbies and games, filled from
+interactions for free and from the API when an id is all we have. Lobbies prefetch their
+players in one gateway request per 100 members when a game starts. Before the gateway is
+connected (restoring games in setup_hook) members are fetched over HTTP instead.
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import discord
+from .logger import Logger
+
+DEFAULT_CAPACITY = 5000
+QUERY_BATCH = 100 # Discord's limit on user ids per member request
+
+User = Union[discord.Member, discord.User]
+
+class MemberResolver:
+    """LRU of (guild id, user id) -> member. Users outside a guild are kept under guild id 0."""
+
+    def __init__(self, bot: discord.Client, capacity: int = DEFAULT_CAPACITY):
+        self.bot = bot
+        self.capacity = capacity
+        self.cache: "OrderedDict[Tuple[int, int], User]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.fetched = 0
+        self.logger = Logger.setup_logger()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def _store(self, guild_id: int, user: User):
+        key = (guild_id, user.id)
+        self.cache[key] = user
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.capacity:
+            self.cache.popitem(last=False)
+
+    def remember(self, *users: User):
+        """Keeps members that arrived with an interaction or message, no request needed."""
+        for user in users:
+            guild = getattr(user, "guild", None)
+            self._store(guild.id if guild else 0, user)
+
+    def get(self, guild: Optional[discord.Guild], user_id: int) -> Optional[User]:
+        """A member from the LRU or whatever discord.py still caches, without any request."""
+        key = (guild.id if guild else 0, user_id)
+        user = self.cache.get(key)
+        if user is None:
+            user = guild.get_member(user_id) if guild else self.bot.get_user(user_id)
+            if user is None:
+                self.misses += 1
+                return None
+            self._store(key[0], user)
+        else:
+            self.cache.move_to_end(key)
+        self.hits += 1
+        return user
+
+    def mention(self, guild: Optional[discord.Guild], user_id: int) -> str:
+        # A mention renders fine from the id alone
+        user = self.get(guild, user_id)
+        return user.mention if user else f"<@{user_id}>"
+
+    def name(self, guild: Optional[discord.Guild], user_id: int) -> str:
+        user = self.get(guild, user_id)
+        return user.display_name if user else f"User({user_id})"
+
+    async def resolve(self, guild: Optional[discord.Guild], user_id: int) -> Optional[User]:
+        """Like get, but asks the API when the member is not known yet."""
+        user = self.get(guild, user_id)
+        if user is not None:
+            return user
+        try:
+            user = await (guild.fetch_member(user_id) if guild else self.bot.fetch_user(user_id))
+        except discord.HTTPException:
+            return None
+        self.fetched += 1
+        self._store(guild.id if guild else 0, user)
+        return user
+
+    async def prefetch(self, guild: Optional[discord.Guild], user_ids: Iterable[int]) -> Dict[int, User]:
+        """Resolves many members at once, unknown ones in batches of 100 over the gateway."""
+        found: Dict[int, User] = {}
+        missing: List[int] = []
+        for user_id in user_ids:
+            user = self.get(guild, user_id)
+            if user is None:
+                missing.append(user_id)
+            else:
+                found[user_id] = user
+
+        if guild is None or getattr(self.bot, "ws", None) is None:
+            # No gateway yet while setup_hook restores games, ask the API for each one
+            for user_id in missing:
+                user = await self.resolve(guild, user_id)
+                if user:
+                    found[user_id] = user
+            return found
+
+        for i in range(0, len(missing), QUERY_BATCH):
+            batch = missing[i:i + QUERY_BATCH]
+            try:
+                members = await guild.query_members(user_ids=batch, limit=len(batch), cache=False)
+            except (asyncio.TimeoutError, discord.ClientException, RuntimeError) as e:
+                # No gateway connection for this guild yet, fall back to one request each (resolve counts them)
+                self.logger.warning(f"Member query failed in guild {guild.id}, fetching one by one: {e}")
+                for user_id in batch:
+                    user = await self.resolve(guild, user_id)
+                    if user:
+                        found[user_id] = user
+                continue
+            self.fetched += len(members)
+            for member in members:
+                self._store(guild.id, member)
+                found[member.id] = member
+        return found
+
+    def stats(self) -> Dict[str, int]:
+        return {"cached": len(self.cache), "capacity": self.capacity, "hits": self.hits, "misses": self.misses, "fetched": self.fetched}
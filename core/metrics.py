@@ -0,0 +1,285 @@
+"""Prometheus-style metrics for the bot's internals, served on a local HTTP endpoint.
+
+Metrics are declared once at import time. A labelled metric hands out a child per label value,
+and hot paths look the child up once and keep it, so an update is a bisect and an in-place add
+on a preallocated array: no dicts, tuples or strings are built per update. Values that are
+cheaper to read than to track (games by state, open lobbies) come from collectors that run
+only when the endpoint is scraped.
+
+Scrape with `curl http://127.0.0.1:9108/metrics` (the port is `metrics_port` in config.json,
+0 turns the endpoint off).
+"""
+import array
+import asyncio
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import aiohttp
+from aiohttp import web
+import discord
+from .logger import Logger
+
+DEFAULT_PORT = 9108
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+LAG_INTERVAL = 0.5 # seconds between event loop lag probes
+MAX_PENDING = 1000 # interactions waiting for their response, the oldest are forgotten
+
+def _format(value: float) -> str:
+    return str(int(value)) if value == int(value) else repr(value)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+class CounterChild:
+    __slots__ = ("cell",)
+
+    def __init__(self):
+        self.cell = array.array("d", [0.0])
+
+    def inc(self, amount: float = 1.0):
+        self.cell[0] += amount
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        return [f"{name}{labels} {_format(self.cell[0])}"]
+
+class GaugeChild(CounterChild):
+    __slots__ = ()
+
+    def set(self, value: float):
+        self.cell[0] = value
+
+    def dec(self, amount: float = 1.0):
+        self.cell[0] -= amount
+
+class HistogramChild:
+    """Fixed buckets, counts[i] holds observations <= bounds[i], the last one the rest."""
+    __slots__ = ("bounds", "counts", "total")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = array.array("Q", [0]) * (len(bounds) + 1)
+        self.total = array.array("d", [0.0])
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total[0] += value
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        lines = []
+        inner = labels[1:-1] + "," if labels else ""
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{inner}le="{_format(bound)}"}} {cumulative}')
+        cumulative += self.counts[-1]
+        lines.append(f'{name}_bucket{{{inner}le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum{labels} {_format(self.total[0])}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+        return lines
+
+class Metric:
+    """A metric family. With one label the children are keyed by the plain value, so
+    `metric.labels("read")` builds nothing on a hit; hot paths should still keep the child."""
+
+    def __init__(self, kind: str, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = ()):
+        self.kind = kind
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.children: Dict[object, object] = {}
+        self._default = None if self.labelnames else self.labels()
+
+    def _new_child(self):
+        if self.kind == "histogram":
+            return HistogramChild(self.buckets)
+        return GaugeChild() if self.kind == "gauge" else CounterChild()
+
+    def labels(self, *values: str):
+        key = values[0] if len(values) == 1 else values
+        child = self.children.get(key)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {values}")
+            child = self.children[key] = self._new_child()
+        return child
+
+    def clear(self):
+        """Drops every child, for gauges a collector rebuilds on each scrape."""
+        self.children.clear()
+
+    # Unlabelled metrics are used directly
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in self.children.items():
+            values = (key,) if len(self.labelnames) == 1 else key
+            labels = ",".join(f'{label}="{_escape(str(value))}"' for label, value in zip(self.labelnames, values))
+            lines += child.samples(self.name, f"{{{labels}}}" if labels else "")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.collectors: List[Callable[[], None]] = []
+        self.logger = Logger.setup_logger()
+
+    def _add(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Metric:
+        return self._add(Metric("counter", name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Metric:
+        return self._add(Metric("gauge", name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Metric:
+        return self._add(Metric("histogram", name, help, labelnames, buckets))
+
+    def collector(self, callback: Callable[[], None]):
+        """Runs callback() before every scrape, to set gauges from live state."""
+        self.collectors.append(callback)
+
+    def render(self) -> str:
+        for callback in self.collectors:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Metrics collector {callback.__name__} failed: {e}")
+        lines = []
+        for metric in self.metrics.values():
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+GAMES_ACTIVE = registry.gauge("bot_games", "Registered games by game and state.", ("game", "state"))
+LOBBIES_OPEN = registry.gauge("bot_lobbies_open", "Lobbies waiting for players.")
+LOOP_LAG = registry.histogram("bot_event_loop_lag_seconds", "How late the event loop woke up a sleeping task.", buckets=LAG_BUCKETS)
+INTERACTIONS = registry.histogram("bot_interaction_seconds", "Time to acknowledge an interaction, by slash command or interaction type.", ("command",))
+STORAGE_SECONDS = registry.histogram("bot_storage_seconds", "Storage JSON read and write time.", ("op",))
+MESSAGES_SENT = registry.counter("bot_messages_sent_total", "Messages sent: channel messages, interaction replies and followups. Defers and edits are not counted.", ("kind",))
+HTTP_REQUESTS = registry.counter("bot_http_requests_total", "Requests made to the Discord API.")
+HTTP_429 = registry.counter("bot_http_429_total", "Discord API responses with status 429 (rate limited).")
+COG_LOAD_SECONDS = registry.gauge("bot_cog_load_seconds", "Time to load each extension at startup.", ("cog",))
+SYNC_SECONDS = registry.gauge("bot_command_sync_seconds", "Duration of the last slash command sync.")
+
+STORAGE_READ = STORAGE_SECONDS.labels("read")
+STORAGE_WRITE = STORAGE_SECONDS.labels("write")
+SENT_CHANNEL = MESSAGES_SENT.labels("channel")
+SENT_INTERACTION = MESSAGES_SENT.labels("interaction")
+SENT_FOLLOWUP = MESSAGES_SENT.labels("followup")
+
+def watch_games(manager):
+    """Reads game counts from the GameManager's state index when scraped."""
+    def collect():
+        GAMES_ACTIVE.clear()
+        for state, ids in manager.state_games.items():
+            for game_id in ids:
+                GAMES_ACTIVE.labels(manager.active_games[game_id].display_name, state).inc()
+        LOBBIES_OPEN.set(len(manager.state_games.get("lobby", ())))
+    registry.collector(collect)
+
+async def watch_loop_lag(interval: float = LAG_INTERVAL):
+    """Sleeps in a loop and records how much later than asked each wake-up came."""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        LOOP_LAG.observe(max(0.0, loop.time() - started - interval))
+
+class InteractionTimer:
+    """Times every interaction, from the gateway event to the callback that acknowledges it.
+
+    Slash commands, buttons, selects and modals are all timed, through the public
+    on_interaction event and the HTTP trace. A defer is an acknowledgement too, it is what
+    stops Discord's three second clock.
+    """
+
+    def __init__(self):
+        self.pending: "OrderedDict[int, Tuple[float, str]]" = OrderedDict() # interaction id -> (received, label)
+
+    def received(self, interaction: discord.Interaction):
+        command = interaction.command if interaction.type == discord.InteractionType.application_command else None
+        self.pending[interaction.id] = (time.perf_counter(), command.qualified_name if command else interaction.type.name)
+        if len(self.pending) > MAX_PENDING:
+            # Never answered, a click on a finished game for one
+            self.pending.popitem(last=False)
+
+    def acknowledged(self, interaction_id: int):
+        entry = self.pending.pop(interaction_id, None)
+        if entry:
+            started, label = entry
+            INTERACTIONS.labels(label).observe(time.perf_counter() - started)
+
+interaction_timer = InteractionTimer()
+
+async def callback_type(response: aiohttp.ClientResponse) -> Optional[int]:
+    """The kind of interaction response, from the body discord.py asks for with with_response.
+    aiohttp keeps the body once read, so the library still gets it."""
+    try:
+        return (await response.json(content_type=None))["resource"]["type"]
+    except Exception:
+        return None
+
+def http_trace() -> aiohttp.TraceConfig:
+    """Counts Discord API requests, 429s and sent messages from the client's HTTP session."""
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_end(session, context, params):
+        HTTP_REQUESTS.inc()
+        if params.response.status == 429:
+            HTTP_429.inc()
+        if params.method != "POST" or params.response.status >= 300:
+            return
+        path = params.url.path
+        if path.endswith("/messages"):
+            SENT_CHANNEL.inc()
+        elif path.endswith("/callback"):
+            # /interactions/{id}/{token}/callback
+            interaction_timer.acknowledged(int(path.split("/")[-3]))
+            # Only a reply is a message, not a defer, an edit or a modal
+            if await callback_type(params.response) == discord.InteractionResponseType.channel_message.value:
+                SENT_INTERACTION.inc()
+        elif "/webhooks/" in path:
+            SENT_FOLLOWUP.inc()
+
+    trace.on_request_end.append(on_request_end)
+    return trace
+
+class MetricsServer:
+    """Serves registry.render() at /metrics. Bound to localhost, it is not meant to be public."""
+
+    def __init__(self, port: int = DEFAULT_PORT, host: str = "127.0.0.1"):
+        self.host = host
+        self.port = port
+        self.runner: Optional[web.AppRunner] = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        return web.Response(text=registry.render(), content_type="text/plain", charset="utf-8",
+                            headers={"X-Content-Type-Options": "nosniff"})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
@@ -0,0 +1,108 @@
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
+from .logger import Logger
+
+class Puzzle:
+    def __init__(self, answer: str, display: str, data: Optional[Dict[str, Any]] = None, image: Optional[bytes] = None):
+        self.answer = answer # normalized answer the check compares against
+        self.display = display # pre-rendered text shown to players
+        self.data = data or {}
+        self.image = image # optional pre-rendered PNG
+
+# game -> (generator(difficulty) -> Puzzle, difficulties)
+PUZZLE_GENERATORS: Dict[str, Tuple[Callable[[str], Puzzle], Tuple[str, ...]]] = {}
+# Games whose generator is called as generator(difficulty, channel_id) when a puzzle is taken
+PER_CHANNEL: Set[str] = set()
+
+def register_generator(game: str, difficulties: Tuple[str, ...] = ("normal",), per_channel: bool = False):
+    """Decorator registering a puzzle generator so the pool keeps puzzles ready for that game.
+
+    per_channel generators are not pooled, they get the channel the puzzle is for so a channel
+    does not see the same puzzle again before it has seen them all.
+    """
+    def decorator(func: Callable[..., Puzzle]):
+        PUZZLE_GENERATORS[game] = (func, difficulties)
+        if per_channel:
+            PER_CHANNEL.add(game)
+        return func
+    return decorator
+
+class PuzzlePool:
+    """Keeps a bounded queue of ready puzzles per game and difficulty, refilled in the background."""
+
+    def __init__(self, capacity: int = 20, low_water: int = 5):
+        self.capacity = capacity
+        self.low_water = low_water
+        self.queues: Dict[Tuple[str, str], Deque[Puzzle]] = {}
+        self.hits: Dict[Tuple[str, str], int] = {}
+        self.misses: Dict[Tuple[str, str], int] = {}
+        self.logger = Logger.setup_logger()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if not self._task:
+            self._task = asyncio.create_task(self._refill_loop())
+        self._wake.set()
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def take(self, game: str, difficulty: str = "normal", channel_id: Optional[int] = None) -> Puzzle:
+        """Pops a ready puzzle. On a miss one is generated in a worker thread, off the event loop."""
+        if game in PER_CHANNEL:
+            # A pooled puzzle was drawn for no channel in particular and could repeat
+            generator, _ = PUZZLE_GENERATORS[game]
+            return await asyncio.to_thread(generator, difficulty, channel_id)
+
+        key = (game, difficulty)
+        queue = self.queues.get(key)
+        if queue:
+            self.hits[key] = self.hits.get(key, 0) + 1
+            puzzle = queue.popleft()
+            if len(queue) <= self.low_water:
+                self._wake.set()
+            return puzzle
+
+        self.misses[key] = self.misses.get(key, 0) + 1
+        self._wake.set()
+        return (await asyncio.to_thread(self._generate_batch, game, difficulty, 1))[0]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for key in set(self.hits) | set(self.misses) | set(self.queues):
+            hits, misses = self.hits.get(key, 0), self.misses.get(key, 0)
+            total = hits + misses
+            report[f"{key[0]}:{key[1]}"] = {
+                "ready": len(self.queues.get(key, ())),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / total if total else 0.0
+            }
+        return report
+
+    def _generate_batch(self, game: str, difficulty: str, count: int):
+        generator, _ = PUZZLE_GENERATORS[game]
+        return [generator(difficulty) for _ in range(count)]
+
+    async def _refill_loop(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            for game, (_, difficulties) in list(PUZZLE_GENERATORS.items()):
+                if game in PER_CHANNEL:
+                    continue
+                for difficulty in difficulties:
+                    queue = self.queues.setdefault((game, difficulty), deque())
+                    missing = self.capacity - len(queue)
+                    if len(queue) > self.low_water or missing <= 0:
+                        continue
+                    try:
+                        # Generation may render images, keep it off the event loop
+                        batch = await asyncio.to_thread(self._generate_batch, game, difficulty, missing)
+                        queue.extend(batch)
+                    except Exception as e:
+                        self.logger.error(f"Failed to generate {game} puzzles: {e}")
@@ -0,0 +1,82 @@
+"""Compact game state: slotted classes holding integer ids, small enums and arrays.
+
+Discord objects are large and shared with the client's cache, so game state keeps only user ids
+and resolves members when it has to mention someone. A player is addressed by their seat, the
+index of their id in `Seats`, and per-player values live in arrays indexed by seat. Every model
+packs to bytes with `to_bytes`/`from_bytes`, `pack`/`unpack` wrap that in text for JSON saves.
+
+tests/test_state.py checks the round trips and that models stay well below the dicts they replaced.
+"""
+import array
+import base64
+import struct
+import sys
+from typing import Iterable, Iterator, Tuple, Type, TypeVar
+
+NO_SEAT = -1
+COUNT = struct.Struct("<H")
+
+T = TypeVar("T")
+
+def array_bytes(values: array.array) -> bytes:
+    # Saved little-endian whatever the host is
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def read_array(typecode: str, data: bytes, offset: int, count: int) -> Tuple[array.array, int]:
+    """An array of count items read from data at offset, and the offset after it."""
+    values = array.array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values.byteswap()
+    return values, end
+
+def write_array(values: array.array) -> bytes:
+    """The array prefixed with its length, the counterpart of read_counted."""
+    return COUNT.pack(len(values)) + array_bytes(values)
+
+def read_counted(typecode: str, data: bytes, offset: int) -> Tuple[array.array, int]:
+    (count,) = COUNT.unpack_from(data, offset)
+    return read_array(typecode, data, offset + COUNT.size, count)
+
+class Seats:
+    """Player ids in seat order, one unsigned 64-bit int each."""
+    __slots__ = ("ids",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self.ids = array.array("Q", ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.ids
+
+    def seat(self, user_id: int) -> int:
+        """The user's seat, NO_SEAT if they are not playing."""
+        try:
+            return self.ids.index(user_id)
+        except ValueError:
+            return NO_SEAT
+
+    def to_bytes(self) -> bytes:
+        return write_array(self.ids)
+
+    @classmethod
+    def read(cls, data: bytes, offset: int = 0) -> Tuple["Seats", int]:
+        seats = cls()
+        seats.ids, offset = read_counted("Q", data, offset)
+        return seats, offset
+
+def pack(state) -> str:
+    """A model's bytes as text, for the JSON save files."""
+    return base64.b64encode(state.to_bytes()).decode("ascii")
+
+def unpack(cls: Type[T], text: str) -> T:
+    return cls.from_bytes(base64.b64decode(text))
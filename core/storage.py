@@ -2,7 +2,9 @@ import json
 import os
 import aiofiles
 import asyncio
+import time
 from typing import Any, Dict
+from .metrics import STORAGE_READ, STORAGE_WRITE
 
 class Storage:
     @staticmethod
@@ -10,6 +12,7 @@ class Storage:
         """Loads a JSON file asynchronously."""
         if not os.path.exists(file_path):
             return {}
+        started = time.perf_counter()
         try:
             async with aiofiles.open(file_path, mode='r', encoding='utf-8') as f:
                 content = await f.read()
@@ -17,16 +20,21 @@ class Storage:
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
             return {}
+        finally:
+            STORAGE_READ.observe(time.perf_counter() - started)
 
     @staticmethod
     async def save_json(file_path: str, data: Dict[str, Any]):
         """Saves a dictionary to a JSON file asynchronously."""
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        started = time.perf_counter()
         try:
             async with aiofiles.open(file_path, mode='w', encoding='utf-8') as f:
                 await f.write(json.dumps(data, indent=4, ensure_ascii=False))
         except Exception as e:
             print(f"Error saving {file_path}: {e}")
+        finally:
+            STORAGE_WRITE.observe(time.perf_counter() - started)
 
     @staticmethod
     async def update_json(file_path: str, key: str, value: Any):
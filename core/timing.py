@@ -0,0 +1,63 @@
+import asyncio
+from typing import Callable, Optional
+import discord
+
+DISCORD_EPOCH = 1420070400000
+# How long to keep listening after the first correct answer so near-simultaneous answers are ordered fairly
+ARBITRATION_WINDOW = 0.25
+
+def snowflake_ms(snowflake: int) -> int:
+    """Returns the creation time of a snowflake (message, interaction...) in unix milliseconds."""
+    return (snowflake >> 22) + DISCORD_EPOCH
+
+def datetime_ms(dt) -> int:
+    return int(dt.timestamp() * 1000)
+
+class JitterStats:
+    """Running summary of the lag removed by snowflake timing, in seconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, jitter: float):
+        self.count += 1
+        self.total += jitter
+        self.max = max(self.max, abs(jitter))
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max
+        }
+
+jitter_stats = JitterStats()
+
+def reaction_time(start_ms: int, answer_snowflake: int, host_elapsed: Optional[float] = None) -> float:
+    """Time between the prompt and the answer as seen by Discord, not by our host.
+
+    host_elapsed is what the game measured locally; the difference is recorded as jitter.
+    """
+    elapsed = max(0, snowflake_ms(answer_snowflake) - start_ms) / 1000
+    if host_elapsed is not None:
+        jitter_stats.record(host_elapsed - elapsed)
+    return elapsed
+
+async def arbitrate(bot: discord.Client, first: discord.Message, check: Callable, window: float = ARBITRATION_WINDOW) -> discord.Message:
+    """Collects other correct answers for a short window and returns the one Discord received first."""
+    best = first
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + window
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            msg = await bot.wait_for('message', check=check, timeout=remaining)
+        except asyncio.TimeoutError:
+            break
+        if msg.id < best.id:
+            best = msg
+    return best
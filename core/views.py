@@ -1,5 +1,7 @@
 import discord
 from typing import List, Optional, Callable, Any
+from .game import GameSession
+from .manager import GameConflict
 
 class BaseLobbyView(discord.ui.View):
     def __init__(
@@ -16,7 +18,46 @@ class BaseLobbyView(discord.ui.View):
         self.on_start = on_start
         self.min_players = min_players
         self.max_players = max_players
-        self.players: List[discord.Member] = [host]
+        # Registered with the GameManager by open(), the game started from it ends it with finish()
+        self.session = GameSession(game_name, host)
+        self.session.lobby = self
+        self.session.lifecycle.own_view(self)
+        self.players: List[discord.Member] = self.session.players
+        self.manager = None
+
+    async def open(self, interaction: discord.Interaction, embed: discord.Embed):
+        """Registers the lobby and sends it, or tells the host why it cannot be opened."""
+        self.manager = interaction.client.game_manager
+        interaction.client.members.remember(self.host)
+        self.session.channel = interaction.channel
+        try:
+            await self.manager.register_game(self.session)
+        except GameConflict as e:
+            self.stop()
+            return await interaction.response.send_message(str(e), ephemeral=True)
+        await interaction.response.send_message(embed=embed, view=self)
+
+    async def finish(self, reason: str = "finished"):
+        """Ends the session, frees its players for other games."""
+        await self.session.end_game(reason)
+
+    def own(self, view: discord.ui.View) -> discord.ui.View:
+        """Ties a game's view to the session, it is stopped when the session ends."""
+        return self.session.lifecycle.own_view(view)
+
+    async def run(self, game):
+        """Plays a game that lasts as long as the coroutine, the session ends however it exits."""
+        try:
+            await game
+        except Exception as e:
+            await self.session.lifecycle.error(e)
+            raise
+        finally:
+            await self.finish()
+
+    async def on_timeout(self):
+        if self.session.state == "lobby":
+            await self.finish("expired")
 
     @discord.ui.button(label="Join", style=discord.ButtonStyle.green)
     async def join(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -25,8 +66,12 @@ class BaseLobbyView(discord.ui.View):
         
         if self.max_players and len(self.players) >= self.max_players:
             return await interaction.response.send_message("The lobby is full!", ephemeral=True)
-            
-        self.players.append(interaction.user)
+
+        try:
+            await self.manager.add_player(self.session, interaction.user)
+        except GameConflict as e:
+            return await interaction.response.send_message(str(e), ephemeral=True)
+        interaction.client.members.remember(interaction.user)
         await self.update_lobby(interaction)
 
     @discord.ui.button(label="Leave", style=discord.ButtonStyle.red)
@@ -37,7 +82,7 @@ class BaseLobbyView(discord.ui.View):
         if interaction.user not in self.players:
             return await interaction.response.send_message("You are not in the lobby!", ephemeral=True)
             
-        self.players.remove(interaction.user)
+        await self.manager.remove_player(self.session, interaction.user)
         await self.update_lobby(interaction)
 
     @discord.ui.button(label="Start", style=discord.ButtonStyle.blurple)
@@ -49,14 +94,21 @@ class BaseLobbyView(discord.ui.View):
             return await interaction.response.send_message(f"You need at least {self.min_players} players to start!", ephemeral=True)
             
         self.stop()
-        await self.on_start(interaction, self.players)
+        # Players who joined through the buttons are known already, only strays are fetched
+        await interaction.client.members.prefetch(interaction.guild, [p.id for p in self.players])
+        await self.session.start_game()
+        try:
+            await self.on_start(interaction, self.players)
+        except Exception as e:
+            await self.session.lifecycle.error(e)
+            raise
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.gray)
     async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
         if interaction.user != self.host:
             return await interaction.response.send_message("Only the host can cancel the lobby!", ephemeral=True)
             
-        self.stop()
+        await self.finish("cancelled")
         await interaction.response.edit_message(content="Lobby cancelled.", embed=None, view=None)
 
     async def update_lobby(self, interaction: discord.Interaction):
@@ -5,7 +5,7 @@ GAMES_REGISTRY: Dict[str, Dict[str, Any]] = {
         "name": "XO",
         "min_players": 2,
         "max_players": 2,
-        "rules": "3x3 board. Align 3 to win.",
+        "rules": "3x3 to 15x15 boards. Align 3 to 5 in a row to win.",
         "cog_path": "games.xo.commands"
     },
     "dice": {
@@ -32,8 +32,8 @@ GAMES_REGISTRY: Dict[str, Dict[str, Any]] = {
     "rps": {
         "name": "Rock Paper Scissors",
         "min_players": 2,
-        "max_players": 2,
-        "rules": "Classic Rock Paper Scissors.",
+        "max_players": 500,
+        "rules": "Classic Rock Paper Scissors, or a battle royale for up to 500 players.",
         "cog_path": "games.rps.commands"
     },
     "chairs": {
@@ -161,5 +161,12 @@ GAMES_REGISTRY: Dict[str, Dict[str, Any]] = {
         "max_players": 10,
         "rules": "Guess the word as it reveals!",
         "cog_path": "games.minigames.textreveal.commands"
+    },
+    "marathon": {
+        "name": "Minigame Marathon",
+        "min_players": 2,
+        "max_players": 10,
+        "rules": "Several minigame rounds in a row, scores add up!",
+        "cog_path": "games.minigames.marathon.commands"
     }
 }
@@ -13,12 +13,15 @@ class ChairsCommands(commands.Cog):
     async def chairs(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Musical Chairs...", embed=None, view=None)
-            view = ChairsView(players, lambda inter, winner: None)
+            async def on_end(game_inter, winner):
+                await lobby.finish()
+
+            view = lobby.own(ChairsView(players, on_end))
             await view.start_round(inter.channel)
 
         lobby = BaseLobbyView(interaction.user, "Musical Chairs", start_game, min_players=3)
         embed = EmbedFactory.game_lobby_embed("Musical Chairs", interaction.user, [interaction.user], rules="Wait for the music to stop, then be the first to sit on a chair!")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(ChairsCommands(bot))
@@ -2,7 +2,11 @@ import discord
 import asyncio
 import random
 import time
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
+from core.timing import ARBITRATION_WINDOW
+
+# Discord allows 25 buttons per message, bigger rounds get a single "grab any chair" button
+MAX_CHAIR_BUTTONS = 25
 
 class ChairsView(discord.ui.View):
     def __init__(self, players: List[discord.Member], on_end: Callable):
@@ -10,13 +14,26 @@ class ChairsView(discord.ui.View):
         self.players = players
         self.on_end = on_end
         self.alive_players = players.copy()
-        self.seated_players = []
-        self.state = "waiting" # waiting, music, stop
+        self.alive_ids = {p.id for p in players}
+        self.seated: Dict[int, int] = {} # user id -> chair
+        self.claimed = 0 # bitmap of taken chairs
+        self.all_chairs = 0
+        self.chair_buttons: Dict[int, discord.ui.Button] = {}
+        self.claims: List[Tuple[int, int, Optional[int]]] = [] # (interaction id, user id, chair or None for any)
+        self.tick_task: Optional[asyncio.Task] = None
+        self.lifecycle = None # set when the game owns the view, its timers go through it
+        self.message: Optional[discord.Message] = None
+        self.channel: Optional[discord.TextChannel] = None
+        self.state = "waiting" # waiting, music, stop, ended
         self.round_num = 1
 
     async def start_round(self, channel: discord.TextChannel):
         self.clear_items()
-        self.seated_players = []
+        self.channel = channel
+        self.seated = {}
+        self.claimed = 0
+        self.chair_buttons = {}
+        self.claims = []
         self.state = "music"
         
         # Add a single dummy button during music
@@ -30,6 +47,7 @@ class ChairsView(discord.ui.View):
             discord.Color.blue()
         )
         msg = await channel.send(embed=embed, view=self)
+        self.message = msg
         
         await asyncio.sleep(random.uniform(3, 8))
         
@@ -37,63 +55,95 @@ class ChairsView(discord.ui.View):
         self.clear_items()
         
         num_chairs = len(self.alive_players) - 1
-        for i in range(num_chairs):
-            chair_btn = discord.ui.Button(label=f"CHAIR {i+1} 🪑", style=discord.ButtonStyle.success, custom_id=f"chair_{i}")
-            chair_btn.callback = self.make_sit_callback(i)
-            self.add_item(chair_btn)
+        self.all_chairs = (1 << num_chairs) - 1
+        if num_chairs <= MAX_CHAIR_BUTTONS:
+            for i in range(num_chairs):
+                chair_btn = discord.ui.Button(label=f"CHAIR {i+1} 🪑", style=discord.ButtonStyle.success, custom_id=f"chair_{i}")
+                chair_btn.callback = self.make_sit_callback(i)
+                self.chair_buttons[i] = chair_btn
+                self.add_item(chair_btn)
+        else:
+            sit_btn = discord.ui.Button(label=f"SIT 🪑 ({num_chairs} left)", style=discord.ButtonStyle.success, custom_id="chair_any")
+            sit_btn.callback = self.make_sit_callback(None)
+            self.add_item(sit_btn)
         
-        stop_embed = EmbedFactory.create_embed(
-            f"Musical Chairs - Round {self.round_num}",
-            "🛑 **THE MUSIC STOPPED! CLICK A CHAIR!**",
-            discord.Color.red()
-        )
-        await msg.edit(embed=stop_embed, view=self)
+        await msg.edit(embed=self.board_embed(), view=self)
 
-    def make_sit_callback(self, chair_idx: int):
+    def board_embed(self) -> discord.Embed:
+        from core.embeds import EmbedFactory
+        desc = "🛑 **THE MUSIC STOPPED! CLICK A CHAIR!**"
+        if self.seated:
+            taken = sorted(self.seated.items(), key=lambda item: item[1])
+            desc += "\n\n" + "\n".join(f"🪑 {chair + 1}: <@{user_id}>" for user_id, chair in taken)
+        return EmbedFactory.create_embed(f"Musical Chairs - Round {self.round_num}", desc, discord.Color.red())
+
+    def make_sit_callback(self, chair_idx: Optional[int]):
         async def callback(interaction: discord.Interaction):
-            if interaction.user not in self.alive_players:
+            if interaction.user.id not in self.alive_ids:
                 return await interaction.response.send_message("You are not in this game!", ephemeral=True)
             
-            if interaction.user in self.seated_players:
-                return await interaction.response.send_message("You already found a chair!", ephemeral=True)
-            
-            if self.state != "stop":
+            # Claims are only acknowledged here, the next arbitration tick decides who sits
+            await interaction.response.defer()
+            if self.state != "stop" or interaction.user.id in self.seated:
                 return
             
-            # Check if this specific chair is already taken
-            # (In this simple implementation, any chair button works until all chairs are full)
-            # But the user asked for "more than one sit button", so I'll let each button be a chair.
-            # To be more realistic, I'll disable the button once clicked.
-            
-            # Find the button in self.children and disable it
-            for item in self.children:
-                if isinstance(item, discord.ui.Button) and item.custom_id == f"chair_{chair_idx}":
-                    if item.disabled:
-                        return await interaction.response.send_message("This chair is already taken!", ephemeral=True)
-                    item.disabled = True
-                    item.label = "TAKEN 🪑"
-                    item.style = discord.ButtonStyle.secondary
-                    break
-            
-            self.seated_players.append(interaction.user)
-            await interaction.response.send_message("You found a chair! ✅", ephemeral=True)
-            await interaction.edit_original_response(view=self) # Update board to show disabled chair
-            
-            num_chairs = len(self.alive_players) - 1
-            if len(self.seated_players) == num_chairs:
-                await self.end_round(interaction.channel)
+            self.claims.append((interaction.id, interaction.user.id, chair_idx))
+            if not self.tick_task:
+                self.tick_task = self.lifecycle.spawn(self.arbitrate())
         
         return callback
 
+    def seat(self, user_id: int, chair: Optional[int]) -> bool:
+        if user_id in self.seated:
+            return False
+        if chair is None:
+            free = self.all_chairs & ~self.claimed
+            if not free:
+                return False
+            chair = (free & -free).bit_length() - 1
+        elif self.claimed >> chair & 1:
+            return False
+        
+        self.claimed |= 1 << chair
+        self.seated[user_id] = chair
+        button = self.chair_buttons.get(chair)
+        if button:
+            button.disabled = True
+            button.label = "TAKEN 🪑"
+            button.style = discord.ButtonStyle.secondary
+        return True
+
+    async def arbitrate(self):
+        while self.claims and self.state == "stop":
+            await asyncio.sleep(ARBITRATION_WINDOW)
+            # Whoever Discord received first gets the chair, however the clicks reached us
+            claims, self.claims = sorted(self.claims), []
+            for _, user_id, chair in claims:
+                self.seat(user_id, chair)
+            
+            round_over = self.claimed == self.all_chairs
+            if round_over:
+                self.state = "ended"
+                self.clear_items()
+            elif not self.chair_buttons:
+                self.children[0].label = f"SIT 🪑 ({bin(self.all_chairs & ~self.claimed).count('1')} left)"
+            # One board edit per tick, however many claims it settled
+            await self.message.edit(embed=self.board_embed(), view=self)
+            if round_over:
+                self.tick_task = None
+                return await self.end_round(self.channel)
+        self.tick_task = None
+
     async def end_round(self, channel: discord.TextChannel):
         # The player who didn't sit
-        remaining = [p for p in self.alive_players if p not in self.seated_players]
+        remaining = [p for p in self.alive_players if p.id not in self.seated]
         if not remaining:
              # Should not happen but for safety
              return
         
         eliminated = remaining[0]
         self.alive_players.remove(eliminated)
+        self.alive_ids.discard(eliminated.id)
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
@@ -13,7 +13,10 @@ class DeathWheelCommands(commands.Cog):
     async def deathwheel(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Death Wheel...", embed=None, view=None)
-            view = DeathWheelView(players, lambda inter, winner: None)
+            async def on_end(game_inter, winner):
+                await lobby.finish()
+
+            view = lobby.own(DeathWheelView(players, on_end))
             await view.start_turn(inter.channel)
 
         lobby = BaseLobbyView(interaction.user, "Death Wheel", start_game, min_players=2)
@@ -23,7 +26,7 @@ class DeathWheelCommands(commands.Cog):
             [interaction.user], 
             rules="1. A player is randomly chosen each turn.\n2. Chosen player must pick a box.\n3. Safe boxes let you live, Traps eliminate you.\n4. Last survivor wins!"
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(DeathWheelCommands(bot))
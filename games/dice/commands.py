@@ -13,10 +13,9 @@ class DiceCommands(commands.Cog):
     async def dice(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             async def on_end(game_inter, winners):
-                # Game ended
-                pass
+                await lobby.finish()
 
-            view = DiceView(players, on_end)
+            view = lobby.own(DiceView(players, on_end))
             embed = EmbedFactory.create_embed("Dice Battle", "Everyone, click the button to roll your dice!")
             await inter.response.edit_message(embed=embed, view=view)
 
@@ -32,7 +31,7 @@ class DiceCommands(commands.Cog):
             [interaction.user],
             rules="Highest roll wins! Multiple players can play."
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(DiceCommands(bot))
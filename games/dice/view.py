@@ -31,12 +31,12 @@ class DiceView(discord.ui.View):
     async def calculate_winner(self, interaction: discord.Interaction):
         results = sorted(self.rolls.items(), key=lambda x: x[1], reverse=True)
         max_roll = results[0][1]
-        winners = [interaction.client.get_user(uid) for uid, roll in self.rolls.items() if roll == max_roll]
+        members = interaction.client.members
+        winners = [p for p in self.players if self.rolls.get(p.id) == max_roll]
         
         desc = "**Results:**\n"
         for uid, roll in self.rolls.items():
-            user = interaction.client.get_user(uid)
-            desc += f"{user.mention}: {roll}\n"
+            desc += f"{members.mention(interaction.guild, uid)}: {roll}\n"
             
         if len(winners) > 1:
             winner_text = "It's a tie between: " + ", ".join([w.mention for w in winners])
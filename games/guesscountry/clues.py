@@ -0,0 +1,162 @@
+"""Country table and ranked clues for Guess The Country.
+
+data/countries.json holds the facts for every country. They are compiled into
+data/countries.bin: a header, one record per country, one record per clue and a UTF-8 text
+blob. Clue texts are written out at build time and each country's clues are stored hardest
+first, so a round only slices them. The table loads with a single read and a few struct
+unpacks. It is rebuilt automatically when the JSON is newer.
+"""
+import json
+import os
+import random
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+from core.matching import normalize
+
+COUNTRIES_PATH = "data/countries.json"
+TABLE_PATH = "data/countries.bin"
+MAGIC = b"CTRY"
+CONTINENTS = ("Africa", "Asia", "Europe", "North America", "South America", "Oceania")
+
+HEADER = struct.Struct("<4sHHI") # magic, countries, clues, text bytes
+COUNTRY = struct.Struct("<IHBBH") # name offset, name length, continent, clue count, first clue
+CLUE = struct.Struct("<BxHI") # kind, text length, text offset
+
+# Clue kinds from hardest to easiest, the order clues are revealed in
+KINDS = (
+    "calling_code", "currency", "regions", "hemisphere", "tld", "area", "population",
+    "languages", "borders", "subregion", "native_name", "clue", "demonym", "continent", "capital"
+)
+
+def _rounded(value: int, unit: str) -> str:
+    if value >= 1_000_000:
+        return f"about {value / 1_000_000:.1f} million {unit}".replace(".0 ", " ")
+    if value >= 1000:
+        return f"about {value // 1000:,} thousand {unit}"
+    return f"{value:,} {unit}"
+
+def _listing(items: List[str]) -> str:
+    return items[0] if len(items) == 1 else ", ".join(items[:-1]) + " and " + items[-1]
+
+def clue_texts(country: dict) -> List[Tuple[int, str]]:
+    """Every clue that can be written for a country, as (kind, text), hardest first.
+
+    Clues that give the name away (Perú, Peruvian, Luxembourg City) are left out.
+    """
+    texts = {}
+    if "calling_code" in country:
+        texts["calling_code"] = f"International calling code: **{country['calling_code']}**"
+    if country.get("currencies"):
+        texts["currency"] = f"Currency code: **{_listing(country['currencies'])}**"
+    if country.get("regions"):
+        picks = random.Random(country["name"]).sample(country["regions"], min(3, len(country["regions"])))
+        texts["regions"] = f"Has regions called **{_listing(picks)}**"
+    if "latlng" in country:
+        lat, lng = country["latlng"]
+        texts["hemisphere"] = f"Lies in the **{'northern' if lat >= 0 else 'southern'}** and **{'eastern' if lng >= 0 else 'western'}** hemispheres"
+    if "tld" in country:
+        texts["tld"] = f"Internet domain: **{country['tld']}**"
+    if country.get("area"):
+        texts["area"] = f"Area: **{_rounded(country['area'], 'km²')}**"
+    texts["population"] = f"Population: **{_rounded(country['population'], 'people')}**"
+    if country.get("languages"):
+        texts["languages"] = f"Official language{'s' if len(country['languages']) > 1 else ''}: **{_listing(country['languages'])}**"
+    if country.get("borders"):
+        texts["borders"] = f"Borders **{_listing(country['borders'])}**"
+    else:
+        texts["borders"] = "Has **no land borders**"
+    texts["subregion"] = f"Located in **{country['subregion']}**"
+    if country.get("native_name"):
+        texts["native_name"] = f"Locals call it **{country['native_name']}**"
+    if country.get("clue"):
+        texts["clue"] = country["clue"]
+    if country.get("demonym"):
+        texts["demonym"] = f"Its people are called **{country['demonym']}**"
+    texts["continent"] = f"Continent: **{country['continent']}**"
+    texts["capital"] = f"Capital: **{country['capital']}**"
+
+    name = normalize(country["name"])
+    return [(KINDS.index(kind), text) for kind, text in sorted(texts.items(), key=lambda item: KINDS.index(item[0]))
+            if name not in normalize(text)]
+
+def build(path: str = TABLE_PATH, source: str = COUNTRIES_PATH):
+    with open(source, "r", encoding="utf-8") as f:
+        countries = json.load(f)
+
+    text = bytearray()
+    country_records = []
+    clue_records = []
+
+    def add_text(value: str) -> Tuple[int, int]:
+        encoded = value.encode("utf-8")
+        text.extend(encoded)
+        return len(text) - len(encoded), len(encoded)
+
+    for country in countries:
+        clues = clue_texts(country)
+        offset, length = add_text(country["name"])
+        country_records.append(COUNTRY.pack(offset, length, CONTINENTS.index(country["continent"]), len(clues), len(clue_records)))
+        for kind, clue in clues:
+            offset, length = add_text(clue)
+            clue_records.append(CLUE.pack(kind, length, offset))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(country_records), len(clue_records), len(text)))
+        f.write(b"".join(country_records))
+        f.write(b"".join(clue_records))
+        f.write(text)
+
+class CountryTable:
+    """In-memory view of the compiled table, indexed by name and by continent."""
+
+    def __init__(self, path: str = TABLE_PATH):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, count, clue_count, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a country table")
+        clues_at = HEADER.size + count * COUNTRY.size
+        text_at = clues_at + clue_count * CLUE.size
+        self._text = memoryview(data)[text_at:]
+        self._countries = list(COUNTRY.iter_unpack(data[HEADER.size:clues_at]))
+        self._clues = list(CLUE.iter_unpack(data[clues_at:text_at]))
+
+        self.names: List[str] = [self._string(offset, length) for offset, length, *_ in self._countries]
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.by_continent: Dict[str, List[int]] = {continent: [] for continent in CONTINENTS}
+        for i, (_, _, continent, _, _) in enumerate(self._countries):
+            self.by_continent[CONTINENTS[continent]].append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _string(self, offset: int, length: int) -> str:
+        return str(self._text[offset:offset + length], "utf-8")
+
+    def continent(self, country: int) -> str:
+        return CONTINENTS[self._countries[country][2]]
+
+    def clues(self, country: int) -> List[Tuple[str, str]]:
+        """A country's clues as (kind, text), hardest first."""
+        _, _, _, count, first = self._countries[country]
+        return [(KINDS[kind], self._string(offset, length)) for kind, length, offset in self._clues[first:first + count]]
+
+    def sample(self, continent: Optional[str] = None) -> int:
+        pool = self.by_continent[continent] if continent else range(len(self.names))
+        return random.choice(pool)
+
+_table: Optional[CountryTable] = None
+_table_lock = threading.Lock()
+
+def get_table() -> CountryTable:
+    """Loads the table once, rebuilding it first if data/countries.json changed."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                if not os.path.exists(TABLE_PATH) or os.path.getmtime(COUNTRIES_PATH) > os.path.getmtime(TABLE_PATH):
+                    build()
+                _table = CountryTable()
+    return _table
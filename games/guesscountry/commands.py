@@ -13,12 +13,15 @@ class GuessCountryCommands(commands.Cog):
     async def guesscountry(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Guess The Country...", embed=None, view=None)
-            game = GuessTheCountryGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = GuessTheCountryGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Guess The Country", start_game, min_players=1)
-        embed = EmbedFactory.game_lobby_embed("Guess The Country", interaction.user, [interaction.user], rules="Guess the country based on the clues provided.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        embed = EmbedFactory.game_lobby_embed("Guess The Country", interaction.user, [interaction.user], rules="Clues appear one by one, hardest first. Guess the country early for more points!")
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(GuessCountryCommands(bot))
@@ -3,40 +3,103 @@ import time
 import asyncio
 import random
 from typing import List, Optional, Callable
-from core.storage import Storage
+from core.matching import country_index
+from core.puzzles import Puzzle
+from core.timing import arbitrate, reaction_time, snowflake_ms
+from .clues import get_table
+
+ROUND_TIME = 60 # seconds
+MAX_HINTS = 6
+MAX_POINTS = 100
+MIN_POINTS = 10
+
+def points_at(elapsed: float) -> int:
+    """Points for a correct answer, decaying linearly over the round."""
+    share = min(max(elapsed / ROUND_TIME, 0.0), 1.0)
+    return round(MAX_POINTS - (MAX_POINTS - MIN_POINTS) * share)
 
 class GuessTheCountryGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
-        self.country_data = {}
+        # Marathon sessions pass a prepared puzzle, a round here picks its own country instead
+        self.puzzle = puzzle
+        self.country = ""
+        self.hints: List[str] = []
+        self.revealed = 0
+        self.points = 0
+        self.credit = 0.0 # share of a point the winner earns in a marathon, decays like the points
+        self.message: Optional[discord.Message] = None
         self.start_time = None
 
+    def pick_hints(self, clues: List[str]) -> List[str]:
+        """Up to MAX_HINTS clues, still hardest first and always ending on the easiest one."""
+        if len(clues) <= MAX_HINTS:
+            return clues
+        keep = sorted(random.sample(range(len(clues) - 1), MAX_HINTS - 1))
+        return [clues[i] for i in keep] + [clues[-1]]
+
+    def hint_time(self, i: int) -> float:
+        return ROUND_TIME * i / len(self.hints)
+
+    def render(self) -> discord.Embed:
+        from core.embeds import EmbedFactory
+        lines = [f"**{i + 1}.** {hint}" for i, hint in enumerate(self.hints[:self.revealed])]
+        if self.revealed < len(self.hints):
+            # Discord counts the timestamp down on its own, no edits needed in between
+            next_at = int(self.start_time + self.hint_time(self.revealed))
+            lines.append(f"\nNext clue <t:{next_at}:R>")
+        embed = EmbedFactory.create_embed("Guess The Country", "\n".join(lines), discord.Color.blue())
+        embed.set_footer(text=f"Clue {self.revealed}/{len(self.hints)} · worth up to {points_at(self.hint_time(self.revealed - 1))} points")
+        return embed
+
+    async def reveal_hints(self):
+        """The round's only update path: one message edit per scheduled reveal."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(1, len(self.hints)):
+            await asyncio.sleep(max(0.0, started + self.hint_time(i) - loop.time()))
+            self.revealed = i + 1
+            await self.message.edit(embed=self.render())
+
     async def start(self):
-        countries = await Storage.load_json("data/countries.json")
-        self.country_data = random.choice(countries)
-        
+        table = get_table()
+        country = table.sample()
+        self.country = table.names[country]
+        self.hints = self.pick_hints([text for _, text in table.clues(country)])
+        self.revealed = 1
+
         from core.embeds import EmbedFactory
-        embed = EmbedFactory.create_embed(
-            "Guess The Country",
-            f"**Clue:** {self.country_data['clue']}\n**Capital:** {self.country_data['capital']}\n**Continent:** {self.country_data['continent']}",
-            discord.Color.blue()
-        )
-        await self.channel.send(embed=embed)
         self.start_time = time.time()
-        
+        self.message = await self.channel.send(embed=self.render())
+        reveals = asyncio.create_task(self.reveal_hints())
+
+        # Aliases (USA, Türkiye) and small typos count too
+        index = country_index(tuple(table.names))
+
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().lower() == self.country_data['name'].lower()
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("guesscountry", m)
+            return index.matches(m.content, self.country)
 
         try:
-            msg = await self.bot.wait_for('message', check=check, timeout=45)
-            elapsed = time.time() - self.start_time
-            
-            result_embed = EmbedFactory.success_embed(f"{msg.author.mention} guessed it in **{elapsed:.2f}s**! It's **{self.country_data['name']}**.")
+            msg = await self.bot.wait_for('message', check=check, timeout=ROUND_TIME)
+            host_elapsed = time.time() - self.start_time
+            msg = await arbitrate(self.bot, msg, check)
+            elapsed = reaction_time(snowflake_ms(self.message.id), msg.id, host_elapsed)
+            reveals.cancel()
+            self.points = points_at(elapsed)
+            self.credit = self.points / MAX_POINTS
+
+            clues = f"{self.revealed} clue{'s' if self.revealed > 1 else ''}"
+            result_embed = EmbedFactory.success_embed(f"{msg.author.mention} guessed it in **{elapsed:.2f}s** with {clues} for **{self.points} points**! It's **{self.country}**.")
             await self.channel.send(embed=result_embed)
             await self.on_end(msg, msg.author)
         except asyncio.TimeoutError:
-            await self.channel.send(f"Time's up! The country was **{self.country_data['name']}**.")
+            await self.channel.send(f"Time's up! The country was **{self.country}**.")
             await self.on_end(None, None)
+        finally:
+            reveals.cancel()
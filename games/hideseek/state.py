@@ -0,0 +1,87 @@
+import array
+import struct
+from typing import Iterable, List
+from core.state import NO_SEAT, Seats, array_bytes, read_array
+
+class HideSeekState:
+    """One round: the seeker's seat and the hiding spot index of every seat, NO_SEAT if not hidden.
+
+    The occupancy index chains the seats hiding in a spot: `first` holds a spot's first seat and
+    `next_seat` the seat after it, so a search walks only the players it finds. It is rebuilt
+    from the spots on load.
+    """
+    __slots__ = ("seats", "seeker", "spots", "first", "next_seat", "hidden")
+
+    HEADER = struct.Struct("<hH") # seeker seat, number of spots
+
+    def __init__(self, player_ids: Iterable[int] = (), seeker: int = 0, spot_count: int = 0):
+        self.seats = Seats(player_ids)
+        self.seeker = self.seats.seat(seeker)
+        self.spots = array.array("h", [NO_SEAT]) * len(self.seats)
+        self.first = array.array("h", [NO_SEAT]) * spot_count
+        self.next_seat = array.array("h", [NO_SEAT]) * len(self.seats)
+        self.hidden = 0
+
+    def _link(self, seat: int, spot: int):
+        self.spots[seat] = spot
+        self.next_seat[seat] = self.first[spot]
+        self.first[spot] = seat
+        self.hidden += 1
+
+    def _unlink(self, seat: int):
+        spot = self.spots[seat]
+        if spot == NO_SEAT:
+            return
+        # Only the seats sharing the old spot are walked
+        if self.first[spot] == seat:
+            self.first[spot] = self.next_seat[seat]
+        else:
+            prev = self.first[spot]
+            while self.next_seat[prev] != seat:
+                prev = self.next_seat[prev]
+            self.next_seat[prev] = self.next_seat[seat]
+        self.spots[seat] = NO_SEAT
+        self.hidden -= 1
+
+    def hide(self, user_id: int, spot: int):
+        """Hides a player, moving them if they already had a spot."""
+        seat = self.seats.seat(user_id)
+        if seat != NO_SEAT and seat != self.seeker:
+            self._unlink(seat)
+            self._link(seat, spot)
+
+    def is_hidden(self, user_id: int) -> bool:
+        seat = self.seats.seat(user_id)
+        return seat != NO_SEAT and self.spots[seat] != NO_SEAT
+
+    def hidden_count(self) -> int:
+        return self.hidden
+
+    def search(self, spot: int) -> List[int]:
+        """Ids of the players hiding in the spot, who are found and lose it."""
+        found = []
+        seat = self.first[spot]
+        while seat != NO_SEAT:
+            found.append(self.seats.ids[seat])
+            self.spots[seat] = NO_SEAT
+            seat = self.next_seat[seat]
+        self.first[spot] = NO_SEAT
+        self.hidden -= len(found)
+        return found
+
+    def to_bytes(self) -> bytes:
+        return self.HEADER.pack(self.seeker, len(self.first)) + self.seats.to_bytes() + array_bytes(self.spots)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HideSeekState":
+        seeker, spot_count = cls.HEADER.unpack_from(data, 0)
+        state = cls(spot_count=spot_count)
+        state.seeker = seeker
+        state.seats, offset = Seats.read(data, cls.HEADER.size)
+        spots, _ = read_array("h", data, offset, len(state.seats))
+        state.spots = array.array("h", [NO_SEAT]) * len(state.seats)
+        state.next_seat = array.array("h", [NO_SEAT]) * len(state.seats)
+        for seat, spot in enumerate(spots):
+            if spot != NO_SEAT:
+                state._link(seat, spot)
+        return state
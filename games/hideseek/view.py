@@ -1,32 +1,86 @@
 import discord
 import random
 import asyncio
-from typing import List, Dict, Optional, Callable
+from typing import List, Optional, Callable
+from .state import HideSeekState
+
+HIDE_TIME = 30
+PAGE_SIZE = 25 # Discord's limit on select options
+
+ROOMS = ["Kitchen", "Attic", "Garage", "Garden", "Basement", "Library", "Bathroom", "Hallway", "Office", "Shed"]
+FURNITURE = ["Cupboard", "Wardrobe", "Sofa", "Table", "Chest", "Shelf", "Barrel", "Rug", "Piano", "Plant"]
+# The classic five come first so small lobbies keep the original spots
+HIDING_PLACES = ["Tree", "Box", "Closet", "Bed", "Curtain"] + [f"{room} {item}" for room in ROOMS for item in FURNITURE]
+SPOT_INDEX = {spot: i for i, spot in enumerate(HIDING_PLACES)}
+
+def spot_count(players: int) -> int:
+    """Roughly one and a half spots per player, never fewer than the classic five."""
+    return min(len(HIDING_PLACES), max(5, players * 3 // 2))
+
+class SpotPicker(discord.ui.View):
+    """One page of the spot list. The pages are built once per round and shared by every player."""
+
+    def __init__(self, game: "HideSeekView", page: int, spots: List[str], pages: int):
+        super().__init__(timeout=None)
+        self.game = game
+        self.page = page
+        self.select = discord.ui.Select(
+            placeholder=f"Choose a hiding place ({page + 1}/{pages})",
+            options=[discord.SelectOption(label=spot) for spot in spots],
+            custom_id=f"hideseek_spot_{page}"
+        )
+        self.select.callback = self.select_callback
+        self.add_item(self.select)
+        if pages > 1:
+            prev_btn = discord.ui.Button(label="◀", style=discord.ButtonStyle.secondary, disabled=page == 0, custom_id=f"hideseek_prev_{page}")
+            next_btn = discord.ui.Button(label="▶", style=discord.ButtonStyle.secondary, disabled=page == pages - 1, custom_id=f"hideseek_next_{page}")
+            prev_btn.callback = self.make_page_callback(page - 1)
+            next_btn.callback = self.make_page_callback(page + 1)
+            self.add_item(prev_btn)
+            self.add_item(next_btn)
+
+    async def select_callback(self, interaction: discord.Interaction):
+        # Read the value before awaiting, the select object is shared between players
+        spot = self.select.values[0]
+        await self.game.pick_spot(interaction, spot)
+
+    def make_page_callback(self, page: int):
+        async def callback(interaction: discord.Interaction):
+            await interaction.response.edit_message(view=self.game.picker_pages[page])
+        return callback
 
 class HideSeekView(discord.ui.View):
     def __init__(self, players: List[discord.Member], on_end: Callable):
         super().__init__(timeout=600)
-        self.players = players
+        self.players = list(players) # still in the game, the session's list is left to the manager
         self.on_end = on_end
-        self.hiding_places = ["Tree", "Box", "Closet", "Bed", "Curtain"]
+        self.hiding_places: List[str] = []
         self.alive_hiders: List[discord.Member] = []
-        self.hider_locations: Dict[int, str] = {}
+        self.hiders: Optional[HideSeekState] = None # who hides where this round
+        self.picker_pages: List[SpotPicker] = []
         self.seeker: Optional[discord.Member] = None
-        self.state = "hiding" # hiding, seeking
+        self.deadline_task: Optional[asyncio.Task] = None
+        self.lifecycle = None # set when the game owns the view, its timers go through it
+        self.channel: Optional[discord.TextChannel] = None
+        self.state = "hiding" # hiding, seeking, searched
 
     async def start_round(self, channel: discord.TextChannel):
         self.state = "hiding"
-        self.hider_locations = {}
+        self.channel = channel
         self.clear_items()
         
         # Randomly assign seeker
         self.seeker = random.choice(self.players)
         self.alive_hiders = [p for p in self.players if p != self.seeker]
+        self.hiding_places = HIDING_PLACES[:spot_count(len(self.players))]
+        self.hiders = HideSeekState([p.id for p in self.players], self.seeker.id, len(self.hiding_places))
+        self.build_picker()
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Hide and Seek",
-            f"🕵️ **{self.seeker.mention} is the seeker!**\nEveryone else, click the button to choose your hiding spot!",
+            f"🕵️ **{self.seeker.mention} is the seeker!**\nEveryone else, click the button to choose your hiding spot!\n"
+            f"**Spots:** {len(self.hiding_places)} | You have {HIDE_TIME} seconds to hide.",
             discord.Color.blue()
         )
         
@@ -35,32 +89,62 @@ class HideSeekView(discord.ui.View):
         self.add_item(hide_btn)
         
         self.msg = await channel.send(embed=embed, view=self)
+        self.deadline_task = self.lifecycle.spawn(self.hiding_deadline())
+
+    def build_picker(self):
+        for page in self.picker_pages:
+            page.stop()
+        spots = self.hiding_places
+        pages = (len(spots) + PAGE_SIZE - 1) // PAGE_SIZE
+        self.picker_pages = [
+            SpotPicker(self, i, spots[i * PAGE_SIZE:(i + 1) * PAGE_SIZE], pages)
+            for i in range(pages)
+        ]
 
     async def hide_callback(self, interaction: discord.Interaction):
         if interaction.user == self.seeker:
+            if self.state == "seeking":
+                return await interaction.response.send_message("Pick a spot to check:", view=self.picker_pages[0], ephemeral=True)
             return await interaction.response.send_message("You are the seeker! Wait for hiders.", ephemeral=True)
         
         if self.state != "hiding":
             return await interaction.response.send_message("Hiding time is over!", ephemeral=True)
             
-        view = discord.ui.View()
-        select = discord.ui.Select(placeholder="Choose a hiding place", options=[
-            discord.SelectOption(label=p) for p in self.hiding_places
-        ])
-        
-        async def select_callback(inter: discord.Interaction):
-            self.hider_locations[inter.user.id] = select.values[0]
-            await inter.response.edit_message(content=f"You are hidden in the **{select.values[0]}**! 🤫", view=None)
+        if interaction.user not in self.alive_hiders:
+            return await interaction.response.send_message("You are not in this game!", ephemeral=True)
             
-            if len(self.hider_locations) == len(self.alive_hiders):
-                await self.start_seeking(interaction.channel)
+        await interaction.response.send_message("Choose your hiding place:", view=self.picker_pages[0], ephemeral=True)
 
-        select.callback = select_callback
-        view.add_item(select)
-        await interaction.response.send_message("Choose your hiding place:", view=view, ephemeral=True)
+    async def pick_spot(self, interaction: discord.Interaction, spot: str):
+        if self.state == "seeking" and interaction.user == self.seeker:
+            await interaction.response.edit_message(content=f"You search the **{spot}**...", view=None)
+            return await self.search(spot)
+        
+        if self.state != "hiding" or interaction.user not in self.alive_hiders:
+            return await interaction.response.edit_message(content="Hiding time is over!", view=None)
+        
+        self.hiders.hide(interaction.user.id, SPOT_INDEX[spot])
+        await interaction.response.edit_message(content=f"You are hidden in the **{spot}**! 🤫", view=None)
+        
+        if self.hiders.hidden_count() == len(self.alive_hiders):
+            await self.start_seeking()
+
+    async def hiding_deadline(self):
+        await asyncio.sleep(HIDE_TIME)
+        if self.state != "hiding":
+            return
+        # Players who didn't choose in time are hidden somewhere at random
+        for hider in self.alive_hiders:
+            if not self.hiders.is_hidden(hider.id):
+                self.hiders.hide(hider.id, random.randrange(len(self.hiding_places)))
+        await self.start_seeking()
 
-    async def start_seeking(self, channel: discord.TextChannel):
+    async def start_seeking(self):
+        if self.state != "hiding":
+            return
         self.state = "seeking"
+        if self.deadline_task and self.deadline_task is not asyncio.current_task():
+            self.deadline_task.cancel()
         self.clear_items()
         
         from core.embeds import EmbedFactory
@@ -70,64 +154,59 @@ class HideSeekView(discord.ui.View):
             discord.Color.orange()
         )
         
-        for place in self.hiding_places:
-            btn = discord.ui.Button(label=f"Check {place}", style=discord.ButtonStyle.secondary)
-            btn.callback = self.make_search_callback(place)
-            self.add_item(btn)
+        search_btn = discord.ui.Button(label="SEARCH 🔎", style=discord.ButtonStyle.danger)
+        search_btn.callback = self.hide_callback
+        self.add_item(search_btn)
             
         await self.msg.edit(embed=embed, view=self)
 
-    def make_search_callback(self, place: str):
-        async def callback(interaction: discord.Interaction):
-            if interaction.user != self.seeker:
-                return await interaction.response.send_message("Only the seeker can search!", ephemeral=True)
-            
-            found_ids = [hid for hid, loc in self.hider_locations.items() if loc == place]
-            found_members = [interaction.guild.get_member(uid) for uid in found_ids]
-            
-            from core.embeds import EmbedFactory
-            if found_members:
-                mentions = ", ".join([m.mention for m in found_members])
-                # These players are kicked (removed from players list)
-                for m in found_members:
-                    self.players.remove(m)
-                
-                res_embed = EmbedFactory.create_embed(
-                    "GOTCHA! 🔎",
-                    f"🔎 {self.seeker.mention} searched the **{place}** and found: {mentions}!\nThey have been eliminated.",
-                    discord.Color.red()
-                )
-            else:
-                res_embed = EmbedFactory.create_embed(
-                    "Empty Spot 🔎",
-                    f"🔎 {self.seeker.mention} searched the **{place}** but it was empty.",
-                    discord.Color.blue()
-                )
-            
-            await interaction.response.send_message(embed=res_embed)
+    async def search(self, place: str):
+        if self.state != "seeking":
+            return
+        self.state = "searched"
+        
+        # Only the players in that spot are touched
+        found_ids = set(self.hiders.search(SPOT_INDEX[place]))
+        found_members = [p for p in self.alive_hiders if p.id in found_ids]
+        
+        from core.embeds import EmbedFactory
+        if found_members:
+            mentions = ", ".join([m.mention for m in found_members])
+            # These players are kicked and free to join other games
+            for m in found_members:
+                self.players.remove(m)
+                await self.lifecycle.release(m)
             
-            # Check win condition
-            if len(self.players) <= 2: # One seeker, one hider left (or just seeker)
-                 # Actually user said "Remaining players wins if one spot or player is remaining"
-                 # I'll interpret as: if only one hider remains, they win? Or if seeker finds everyone, seeker wins.
-                 # Let's say if seeker finds everyone, seeker wins. If hider(s) remain after all spots checked? 
-                 # User said "Remaining players wins if one spot or player is remaining".
-                 # I'll just end when only 1 player or 1 spot is left as requested.
-                 
-                 winner = self.players[0] if len(self.players) == 1 else None # Should be at least seeker
-                 win_text = f"🏆 Game over! "
-                 if len(self.players) > 1:
-                     win_text += "Hiders survived!"
-                 else:
-                     win_text += f"{self.seeker.mention} found everyone!"
-                 
-                 win_embed = EmbedFactory.success_embed(win_text)
-                 await interaction.channel.send(embed=win_embed)
-                 await self.on_end(None, winner)
-            else:
-                # Next round? User said "Each round a seeker is randomly assigned"
-                # So we reset and start again with remaining players
-                await asyncio.sleep(3)
-                await self.start_round(interaction.channel)
+            res_embed = EmbedFactory.create_embed(
+                "GOTCHA! 🔎",
+                f"🔎 {self.seeker.mention} searched the **{place}** and found: {mentions}!\nThey have been eliminated.",
+                discord.Color.red()
+            )
+        else:
+            res_embed = EmbedFactory.create_embed(
+                "Empty Spot 🔎",
+                f"🔎 {self.seeker.mention} searched the **{place}** but it was empty.",
+                discord.Color.blue()
+            )
         
-        return callback
+        await self.msg.edit(view=None)
+        await self.channel.send(embed=res_embed)
+        
+        # One seeker and one hider left (or just the seeker) ends the game
+        if len(self.players) <= 2:
+             winner = self.players[0] if len(self.players) == 1 else None
+             win_text = f"🏆 Game over! "
+             if len(self.players) > 1:
+                 win_text += "Hiders survived!"
+             else:
+                 win_text += f"{self.seeker.mention} found everyone!"
+             
+             for page in self.picker_pages:
+                 page.stop()
+             win_embed = EmbedFactory.success_embed(win_text)
+             await self.channel.send(embed=win_embed)
+             await self.on_end(None, winner)
+        else:
+            # Each round a new seeker is picked among the remaining players
+            await asyncio.sleep(3)
+            await self.start_round(self.channel)
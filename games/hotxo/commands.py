@@ -2,63 +2,121 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from core.views import BaseLobbyView
+from core.manager import GameConflict
 from core.embeds import EmbedFactory
 from .view import HotXOView
+from .tournament import HotXOTournament
+from .solver import HotXOTable, WIN, LOSS, DRAW, RESULT_NAMES
+from typing import Dict, Optional
+import asyncio
 import random
 
 class HotXOCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.players = []
-        self.on_game = False
+        self.ai_matches: Dict[int, HotXOView] = {} # user_id -> match against the bot
+        self.table = None
+
+    async def cog_load(self):
+        # Builds the solved table on first run, then it is only memory-mapped
+        self.table = await asyncio.to_thread(HotXOTable.load_or_build)
+
+    async def cog_unload(self):
+        if self.table:
+            self.table.close()
 
     @app_commands.command(name="hotxo", description="Start a tournament of HotXO.")
-    async def hotxo(self, interaction: discord.Interaction):
+    @app_commands.describe(vs_ai="Play a single match against the bot.")
+    async def hotxo(self, interaction: discord.Interaction, vs_ai: bool = False):
+        if vs_ai:
+            return await self.start_ai_match(interaction)
+
         async def start_game(inter, players):
+            tournament = HotXOTournament(str(random.randint(1000, 9999)), interaction.user, inter.channel)
+            tournament.players = list(players)
+            try:
+                # The tournament takes over the lobby's players and is persisted from here on
+                await self.bot.game_manager.hand_over(lobby.session, tournament)
+            except GameConflict as e:
+                return await inter.response.send_message(str(e), ephemeral=True)
+
             await inter.response.edit_message(content="Starting HotXO Tournament...", embed=None, view=None)
-            self.players = players
-            self.on_game = True
-            await self.start_tournament_round(inter.channel)
+            await tournament.start(players)
 
         lobby = BaseLobbyView(interaction.user, "HotXO", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed(
             "HotXO Tournament", 
             interaction.user, 
             [interaction.user], 
-            rules="1. Two players chosen randomly each round.\n2. Compete in HotXO (oldest mark deleted after 3 moves).\n3. Last player standing wins!"
+            rules="1. Players are paired into a bracket, all matches of a round are played at once.\n2. Compete in HotXO (oldest mark deleted after 3 moves).\n3. Winners advance, last player standing wins!"
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
-
-    async def start_tournament_round(self, channel: discord.TextChannel):
-        if len(self.players) < 2:
-            winner = self.players[0] if self.players else None
-            if winner:
-                embed = EmbedFactory.success_embed(f"🏆 {winner.mention} is the HotXO Tournament Champion!")
-                await channel.send(embed=embed)
-            self.on_game = False
-            return
-
-        p1, p2 = random.sample(self.players, 2)
-        
+        await lobby.open(interaction, embed)
+
+    def find_match(self, interaction: discord.Interaction) -> Optional[HotXOView]:
+        view = self.ai_matches.get(interaction.user.id)
+        if view and not view.game_over:
+            return view
+        game = self.bot.game_manager.get_game_in_channel(interaction.channel_id)
+        if isinstance(game, HotXOTournament):
+            return game.find_view(interaction.user)
+        return None
+
+    async def start_ai_match(self, interaction: discord.Interaction):
+        player, bot_user = interaction.user, self.bot.user
+
         async def on_win(game_inter, winner, status):
-            loser = p1 if winner == p2 else p2
-            self.players.remove(loser)
-            embed = EmbedFactory.success_embed(f"{status}\n\n🏆 {winner.mention} won the match! {loser.mention} has been eliminated.")
+            self.ai_matches.pop(player.id, None)
+            result = "You beat the bot! 🎉" if winner == player else "The bot wins! 🤖"
+            embed = EmbedFactory.success_embed(f"{status}\n\n🏆 {winner.mention} won the match! {result}")
             await game_inter.response.edit_message(embed=embed, view=None)
-            await asyncio.sleep(3)
-            await self.start_tournament_round(channel)
-            
+
         async def on_draw(game_inter, status):
-            # In case of draw, maybe just replay?
-            embed = EmbedFactory.info_embed(f"{status}\n\n🤝 Draw! Replaying match...")
+            self.ai_matches.pop(player.id, None)
+            embed = EmbedFactory.info_embed(f"{status}\n\n🤝 Draw!")
             await game_inter.response.edit_message(embed=embed, view=None)
-            await asyncio.sleep(3)
-            await self.start_tournament_round(channel)
 
-        view = HotXOView(p1, p2, on_win, on_draw)
-        embed = EmbedFactory.create_embed("HotXO Match", f"**{p1.mention} (❌) vs {p2.mention} (⭕)**\n\n**Turn:** {p1.mention}")
-        await channel.send(embed=embed, view=view)
+        view = HotXOView(player, bot_user, on_win, on_draw, ai_table=self.table)
+        self.ai_matches[player.id] = view
+        embed = EmbedFactory.create_embed("HotXO Match", f"**{player.mention} (❌) vs {bot_user.mention} (⭕)**\n\n**Turn:** {player.mention}")
+        await interaction.response.send_message(embed=embed, view=view)
+
+    @app_commands.command(name="hint", description="Get the best move for your current HotXO match.")
+    async def hint(self, interaction: discord.Interaction):
+        view = self.find_match(interaction)
+        if not view:
+            return await interaction.response.send_message("You are not playing a HotXO match in this channel!", ephemeral=True)
+
+        if interaction.user != view.turn:
+            return await interaction.response.send_message("Wait for your turn to ask for a hint!", ephemeral=True)
+
+        board = view.board
+        scores = self.table.score_moves(board.history(board.turn), board.history(1 - board.turn))
+        best = self.table.best_move(board.history(board.turn), board.history(1 - board.turn))
+        result, plies = scores[best]
+        if result == WIN:
+            outlook = f"you can force a win in **{(plies + 1) // 2}** of your moves"
+        elif result == LOSS:
+            outlook = f"perfect play beats you in **{plies // 2}** moves, this delays it the longest"
+        else:
+            outlook = "perfect play from here is a draw"
+        await interaction.response.send_message(f"💡 Play position **{best + 1}**: {outlook}.", ephemeral=True)
+
+    @app_commands.command(name="hotxo_fairness", description="Show who is favoured in HotXO under perfect play.")
+    async def hotxo_fairness(self, interaction: discord.Interaction):
+        report = self.table.fairness_report()
+        opening = RESULT_NAMES[report["opening_result"]]
+        openings = self.table.score_moves((), ())
+        winning = [str(cell + 1) for cell, (result, _) in openings.items() if result == WIN]
+
+        desc = f"With perfect play the first player (❌) gets a **{opening}**"
+        if report["opening_result"] != DRAW:
+            desc += f" in **{report['opening_plies']}** moves"
+        desc += ".\n"
+        if winning:
+            desc += f"Winning first moves: positions {', '.join(winning)}\n"
+        desc += f"\n**Reachable positions (side to move):**\nWins: {report['win']}\nLosses: {report['loss']}\nDraws: {report['draw']}"
+        embed = EmbedFactory.create_embed("⚖️ HotXO Fairness Report", desc)
+        await interaction.response.send_message(embed=embed)
 
-import asyncio
 async def setup(bot):
     await bot.add_cog(HotXOCommands(bot))
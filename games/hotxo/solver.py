@@ -0,0 +1,182 @@
+"""Retrograde analysis of HotXO.
+
+Every position is described from the side to move as (my marks, their marks), each an
+ordered tuple of up to 3 cells, oldest first. The table in data/hotxo_table.bin is built
+on first use, delete it to rebuild.
+"""
+import mmap
+import os
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from games.xo.engine import FULL_BOARD, iter_cells, is_win
+
+TABLE_PATH = "data/hotxo_table.bin"
+MAX_MARKS = 3
+
+# Result codes stored in the top 2 bits of each table byte, the low 6 bits hold the
+# number of plies until the result (0 for draws). 0 means the position is unreachable.
+WIN = 1
+LOSS = 2
+DRAW = 3
+RESULT_NAMES = {WIN: "win", LOSS: "loss", DRAW: "draw"}
+RESULT_OF_BYTE = bytes(value >> 6 for value in range(256))
+
+# A queue of n cells gets code (9**n - 1) // 8 + its base 9 value, so codes fit in 0..819
+QUEUE_CODES = 820
+
+History = Tuple[int, ...]
+
+def queue_code(history: History) -> int:
+    code = 0
+    for cell in history:
+        code = code * 9 + cell
+    return (9 ** len(history) - 1) // 8 + code
+
+def state_index(me: History, opp: History) -> int:
+    return queue_code(me) * QUEUE_CODES + queue_code(opp)
+
+def to_bits(history: History) -> int:
+    bits = 0
+    for cell in history:
+        bits |= 1 << cell
+    return bits
+
+def play(me: History, opp: History, cell: int) -> Tuple[History, History]:
+    """Plays a cell for the side to move and returns the next position, seen from the other side."""
+    me = me + (cell,)
+    if len(me) > MAX_MARKS:
+        me = me[1:]
+    return opp, me
+
+def moves(me: History, opp: History) -> List[int]:
+    return list(iter_cells(FULL_BOARD & ~(to_bits(me) | to_bits(opp))))
+
+def solve() -> bytearray:
+    # Forward pass: every position reachable from the empty board
+    start = ((), ())
+    index: Dict[Tuple[History, History], int] = {start: 0}
+    states = [start]
+    children: List[List[int]] = []
+    frontier = deque([start])
+    while frontier:
+        me, opp = frontier.popleft()
+        kids = []
+        # The previous move completed a line, the game is over
+        if not is_win(to_bits(opp)):
+            for cell in moves(me, opp):
+                child = play(me, opp, cell)
+                if child not in index:
+                    index[child] = len(states)
+                    states.append(child)
+                    frontier.append(child)
+                kids.append(index[child])
+        children.append(kids)
+
+    parents: List[List[int]] = [[] for _ in states]
+    for i, kids in enumerate(children):
+        for kid in kids:
+            parents[kid].append(i)
+
+    # Backward pass from the lost positions, in order of distance
+    result = [0] * len(states)
+    distance = [0] * len(states)
+    unresolved = [len(kids) for kids in children]
+    queue = deque(i for i, kids in enumerate(children) if not kids)
+    for i in queue:
+        result[i] = LOSS
+    while queue:
+        i = queue.popleft()
+        for parent in parents[i]:
+            if result[parent]:
+                continue
+            if result[i] == LOSS:
+                result[parent] = WIN
+                distance[parent] = distance[i] + 1
+                queue.append(parent)
+            else:
+                unresolved[parent] -= 1
+                if not unresolved[parent]:
+                    result[parent] = LOSS
+                    distance[parent] = distance[i] + 1
+                    queue.append(parent)
+
+    table = bytearray(QUEUE_CODES * QUEUE_CODES)
+    for i, (me, opp) in enumerate(states):
+        code = result[i] or DRAW
+        dist = distance[i] if result[i] else 0
+        if dist > 63:
+            raise ValueError(f"Distance {dist} does not fit in the table")
+        table[state_index(me, opp)] = code << 6 | dist
+    return table
+
+class HotXOTable:
+    """Read-only, memory-mapped view of the solved table."""
+
+    def __init__(self, path: str = TABLE_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.counts = self._count_results()
+
+    @classmethod
+    def load_or_build(cls, path: str = TABLE_PATH) -> "HotXOTable":
+        if not os.path.exists(path):
+            build(path)
+        return cls(path)
+
+    def lookup(self, me: History, opp: History) -> Tuple[int, int]:
+        """Returns (result, plies) for the side to move."""
+        value = self._map[state_index(me, opp)]
+        return value >> 6, value & 63
+
+    def score_moves(self, me: History, opp: History) -> Dict[int, Tuple[int, int]]:
+        """Returns (result, plies) for the side to move after each legal cell."""
+        scores = {}
+        for cell in moves(me, opp):
+            next_opp, next_me = play(me, opp, cell)
+            if is_win(to_bits(next_me)):
+                scores[cell] = (WIN, 1)
+                continue
+            result, plies = self.lookup(next_opp, next_me)
+            mine = {WIN: LOSS, LOSS: WIN}.get(result, DRAW)
+            scores[cell] = (mine, plies + 1 if mine != DRAW else 0)
+        return scores
+
+    def best_move(self, me: History, opp: History) -> Optional[int]:
+        scores = self.score_moves(me, opp)
+        if not scores:
+            return None
+
+        def rank(item):
+            result, plies = item[1]
+            # Win fastest, then draw, then lose as slowly as possible
+            if result == WIN:
+                return (2, -plies)
+            if result == DRAW:
+                return (1, 0)
+            return (0, plies)
+
+        return max(scores.items(), key=rank)[0]
+
+    def _count_results(self) -> Dict[str, int]:
+        # Reachable positions by result, counted once: each byte is mapped to its result code in C
+        results = self._map[:].translate(RESULT_OF_BYTE)
+        return {name: results.count(code) for code, name in RESULT_NAMES.items()}
+
+    def fairness_report(self) -> Dict[str, int]:
+        """Counts reachable positions by result, plus the value of the opening position."""
+        counts = dict(self.counts)
+        result, plies = self.lookup((), ())
+        counts["opening_result"] = result
+        counts["opening_plies"] = plies
+        return counts
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+def build(path: str = TABLE_PATH):
+    table = solve()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(table)
@@ -0,0 +1,160 @@
+import discord
+import random
+import asyncio
+from typing import List, Dict, Optional, Any
+from core.game import BaseGame
+from core.embeds import EmbedFactory
+from .view import HotXOView
+
+class HotXOTournament(BaseGame):
+    """Single elimination bracket. Every match of a round is played at the same time."""
+    game_type = "hotxo"
+    display_name = "HotXO"
+
+    def __init__(self, game_id: str, host: discord.Member, channel: discord.TextChannel):
+        super().__init__(game_id, host, channel)
+        # rounds[r][m] = [p1_id, p2_id, winner_id], p2_id is None for a bye
+        self.rounds: List[List[List[Optional[int]]]] = []
+        self.views: Dict[int, HotXOView] = {} # match index in the current round -> view
+        self.manager = None
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"rounds": self.rounds}
+
+    def from_state(self, state: Dict[str, Any]):
+        self.rounds = state.get("rounds", [])
+
+    async def on_restore(self, bot: discord.Client):
+        self.manager = bot.game_manager
+        if self.state == "active" and self.rounds:
+            # The match boards were lost with the old process, replay the unfinished ones
+            self.lifecycle.spawn(self.play_round(restored=True))
+
+    def member(self, player_id: int) -> Optional[discord.abc.User]:
+        """The player, None if they could not be fetched when the tournament was restored."""
+        return next((p for p in self.players if p.id == player_id), None)
+
+    def mention(self, player_id: int) -> str:
+        player = self.member(player_id)
+        return player.mention if player else self.members.mention(self.channel.guild, player_id)
+
+    async def leave_player(self, player: discord.abc.User):
+        # Knocked out players leave the bracket, the host included
+        if player in self.players:
+            self.players.remove(player)
+            await self.save_game()
+
+    def build_round(self, player_ids: List[int]):
+        random.shuffle(player_ids)
+        matches = []
+        for i in range(0, len(player_ids) - 1, 2):
+            matches.append([player_ids[i], player_ids[i + 1], None])
+        if len(player_ids) % 2:
+            # Odd player out gets a bye straight into the next round
+            matches.append([player_ids[-1], None, player_ids[-1]])
+        self.rounds.append(matches)
+
+    async def start(self, players: List[discord.Member]):
+        self.players = players
+        self.build_round([p.id for p in players])
+        await self.start_game()
+        await self.play_round()
+
+    async def play_round(self, restored: bool = False):
+        round_num = len(self.rounds)
+        matches = self.rounds[-1]
+        self.views = {}
+
+        lines = []
+        for p1_id, p2_id, winner_id in matches:
+            if p2_id is None:
+                lines.append(f"{self.mention(p1_id)} gets a bye")
+            else:
+                lines.append(f"{self.mention(p1_id)} vs {self.mention(p2_id)}")
+        title = f"🔥 HotXO Tournament - Round {round_num}" + (" (resumed)" if restored else "")
+        await self.channel.send(embed=EmbedFactory.create_embed(title, "\n".join(lines), discord.Color.orange()))
+
+        pending = [i for i, match in enumerate(matches) if match[2] is None]
+        if not pending:
+            return await self.advance()
+        await asyncio.gather(*(self.post_match(i) for i in pending))
+
+    async def post_match(self, index: int):
+        p1_id, p2_id, _ = self.rounds[-1][index]
+        p1, p2 = self.member(p1_id), self.member(p2_id)
+        round_num = len(self.rounds)
+        if not p1 or not p2:
+            # Left the server while the bot was down, the opponent goes through
+            missing = p2_id if p1 else p1_id
+            await self.channel.send(embed=EmbedFactory.info_embed(f"{self.mention(missing)} could not be found and forfeits the match."))
+            return await self.finish_match(round_num, index, p1_id if p1 else p2_id)
+
+        async def on_win(game_inter, winner, status):
+            loser = p1 if winner == p2 else p2
+            embed = EmbedFactory.success_embed(f"{status}\n\n🏆 {winner.mention} won the match! {loser.mention} has been eliminated.")
+            await game_inter.response.edit_message(embed=embed, view=None)
+            await self.finish_match(round_num, index, winner.id)
+
+        async def on_draw(game_inter, status):
+            embed = EmbedFactory.info_embed(f"{status}\n\n🤝 Draw! Replaying match...")
+            await game_inter.response.edit_message(embed=embed, view=None)
+            await asyncio.sleep(3)
+            await self.post_match(index)
+
+        # One idle match must not end the whole bracket, its timeout forfeits the player to move
+        view = self.lifecycle.own_view(HotXOView(p1, p2, on_win, on_draw), expires=False)
+        self.views[index] = view
+        embed = EmbedFactory.create_embed(
+            f"HotXO Match - Round {round_num}",
+            f"**{p1.mention} (❌) vs {p2.mention} (⭕)**\n\n**Turn:** {p1.mention}"
+        )
+        message = await self.channel.send(embed=embed, view=view)
+
+        async def on_timeout():
+            if view.game_over:
+                return
+            view.game_over = True
+            idle = view.turn
+            winner = p2 if idle == p1 else p1
+            embed = EmbedFactory.info_embed(f"⏰ {idle.mention} took too long and forfeits the match. {winner.mention} goes through!")
+            await message.edit(embed=embed, view=None)
+            await self.finish_match(round_num, index, winner.id)
+
+        view.on_timeout = on_timeout
+
+    async def finish_match(self, round_num: int, index: int, winner_id: int):
+        if round_num != len(self.rounds) or self.rounds[-1][index][2] is not None:
+            return
+        # Record and check in one step, so only the last match to finish advances the bracket
+        p1_id, p2_id, _ = self.rounds[-1][index]
+        self.rounds[-1][index][2] = winner_id
+        self.views.pop(index, None)
+        round_over = all(match[2] is not None for match in self.rounds[-1])
+        loser = self.member(p2_id if winner_id == p1_id else p1_id)
+        if loser and self.manager:
+            # Frees the loser for other games now rather than when the bracket ends, and saves
+            await self.manager.remove_player(self, loser)
+        else:
+            await self.save_game()
+        if round_over:
+            await asyncio.sleep(3)
+            await self.advance()
+
+    async def advance(self):
+        winners = [match[2] for match in self.rounds[-1]]
+        if len(winners) == 1:
+            embed = EmbedFactory.success_embed(f"🏆 {self.mention(winners[0])} is the HotXO Tournament Champion!")
+            await self.channel.send(embed=embed)
+            # Also unregisters the tournament from the manager
+            await self.end_game()
+            return
+
+        self.build_round(winners)
+        await self.save_game()
+        await self.play_round()
+
+    def find_view(self, user: discord.abc.User) -> Optional[HotXOView]:
+        for view in self.views.values():
+            if user in (view.p1, view.p2) and not view.game_over:
+                return view
+        return None
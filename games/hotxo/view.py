@@ -1,19 +1,22 @@
 import discord
 import random
 from typing import List, Optional, Callable, Dict
+from games.xo.engine import XOBoard
+
+SYMBOLS = ["❌", "⭕"]
 
 class HotXOView(discord.ui.View):
-    def __init__(self, p1: discord.Member, p2: discord.Member, on_win: Callable, on_draw: Callable):
+    def __init__(self, p1: discord.Member, p2: discord.Member, on_win: Callable, on_draw: Callable, ai_table=None):
         super().__init__(timeout=300)
         self.p1 = p1
         self.p2 = p2
         self.turn = p1
-        self.board = [" " for _ in range(9)]
-        # Track history of moves for each player: player_id -> list of board indices
-        self.move_history: Dict[int, List[int]] = {p1.id: [], p2.id: []}
+        # Each player keeps at most 3 marks, the oldest one is removed by the 4th
+        self.board = XOBoard(max_marks=3)
         self.buttons: List[discord.ui.Button] = []
         self.on_win = on_win
         self.on_draw = on_draw
+        self.ai_table = ai_table # solved HotXOTable, p2 is played by the bot when set
         self.game_over = False
 
         for i in range(9):
@@ -26,73 +29,75 @@ class HotXOView(discord.ui.View):
         async def callback(interaction: discord.Interaction):
             if self.game_over:
                 return
-            
+
             if interaction.user != self.turn:
                 return await interaction.response.send_message("It's not your turn!", ephemeral=True)
-            
-            if self.board[index] != " ":
+
+            if not self.board.is_free(index):
                 return await interaction.response.send_message("This spot is already taken!", ephemeral=True)
-            
-            symbol = "❌" if self.turn == self.p1 else "⭕"
-            self.board[index] = symbol
-            
-            # Record move
-            self.move_history[self.turn.id].append(index)
-            
-            msg = ""
-            # Every fourth move, the first is inflamed and deleted
-            if len(self.move_history[self.turn.id]) > 3:
-                old_move = self.move_history[self.turn.id].pop(0)
-                self.board[old_move] = " "
-                msg = f"🔥 Your oldest mark at position {old_move+1} was inflamed and deleted!"
-            
-            self.update_all_buttons()
-            
-            winner_symbol = self.check_winner()
-            if winner_symbol:
-                self.game_over = True
-                self.disable_all()
-                winner = self.p1 if winner_symbol == "❌" else self.p2
-                await self.on_win(interaction, winner, msg)
+
+            msg = await self.play_move(interaction, index)
+            if self.game_over:
                 return
-            
-            self.turn = self.p2 if self.turn == self.p1 else self.p1
+
+            if self.ai_table:
+                board = self.board
+                ai_move = self.ai_table.best_move(board.history(board.turn), board.history(1 - board.turn))
+                ai_msg = await self.play_move(interaction, ai_move)
+                if self.game_over:
+                    return
+                if ai_msg:
+                    msg = f"{msg}\n{ai_msg}".strip()
+
             await self.update_board_status(interaction, msg)
 
         return callback
 
+    async def play_move(self, interaction: discord.Interaction, index: int) -> str:
+        """Plays a move for the current turn and returns the status message."""
+        msg = ""
+        # Every fourth move, the first is inflamed and deleted
+        old_move = self.board.play(index)
+        if old_move is not None:
+            msg = f"🔥 {self.turn.mention}'s oldest mark at position {old_move+1} was inflamed and deleted!"
+
+        self.update_all_buttons()
+
+        if self.board.winner is not None:
+            self.game_over = True
+            self.disable_all()
+            winner = self.p1 if self.board.winner == 0 else self.p2
+            await self.on_win(interaction, winner, msg)
+            return msg
+
+        self.turn = self.p2 if self.turn == self.p1 else self.p1
+        return msg
+
     def update_all_buttons(self):
         for i in range(9):
-            symbol = self.board[i]
+            owner = self.board.cell(i)
             btn = self.buttons[i]
-            
-            # Check if this is the oldest mark of the current player (about to be deleted)
-            # Actually user said "every fourth move the first is inflamed", 
-            # so I'll just show current board state.
-            
-            if symbol == " ":
+
+            if owner is None:
                 btn.label = "\u200b"
                 btn.style = discord.ButtonStyle.secondary
                 btn.disabled = False
             else:
-                btn.label = symbol
-                btn.style = discord.ButtonStyle.danger if symbol == "❌" else discord.ButtonStyle.primary
+                btn.label = SYMBOLS[owner]
+                btn.style = discord.ButtonStyle.danger if owner == 0 else discord.ButtonStyle.primary
                 btn.disabled = True
 
     def check_winner(self) -> Optional[str]:
-        b = self.board
-        lines = [(0,1,2), (3,4,5), (6,7,8), (0,3,6), (1,4,7), (2,5,8), (0,4,8), (2,4,6)]
-        for l in lines:
-            if b[l[0]] == b[l[1]] == b[l[2]] != " ":
-                return b[l[0]]
-        return None
+        if self.board.winner is None:
+            return None
+        return SYMBOLS[self.board.winner]
 
     def disable_all(self):
         for b in self.buttons:
             b.disabled = True
 
     async def update_board_status(self, interaction: discord.Interaction, status: str):
-        symbol = "❌" if self.turn == self.p1 else "⭕"
+        symbol = SYMBOLS[self.board.turn]
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "HotXO Game",
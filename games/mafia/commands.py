@@ -2,23 +2,26 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from core.views import BaseLobbyView
+from core.manager import GameConflict
 from core.embeds import EmbedFactory
 from .game import MafiaGame
+from .state import MafiaState, Phase, Role
 import random
 import asyncio
 from typing import Dict, List
 
 class RoleRevealView(discord.ui.View):
-    def __init__(self, players_roles: dict, role_info: dict):
+    def __init__(self, town: MafiaState, role_info: dict):
         super().__init__(timeout=60)
-        self.players_roles = players_roles
+        self.town = town
         self.role_info = role_info
 
     @discord.ui.button(label="VIEW MY ROLE 🎭", style=discord.ButtonStyle.blurple)
     async def view_role(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_key = self.players_roles.get(interaction.user.id)
-        if not role_key:
+        role = self.town.role(interaction.user.id)
+        if role is None:
             return await interaction.response.send_message("You are not in this game!", ephemeral=True)
+        role_key = role.key
             
         info = self.role_info[role_key]
         embed = EmbedFactory.create_embed(
@@ -47,18 +50,16 @@ class NightActionView(discord.ui.View):
         
         await self.game.record_action(self.player_id)
         
-        member = self.game.channel.guild.get_member(target_id)
-        name = member.display_name if member else f"Unknown User({target_id})"
+        name = self.game.members.name(self.game.channel.guild, target_id)
         await interaction.response.send_message(f"✔️ **Action recorded!** You have chosen {name}.\nYour choice has been noted in the shadows. Now, wait for the dawn...", ephemeral=True)
         self.stop()
 
     async def update_options(self):
         options = []
-        for pid in self.game.alive_players:
+        for pid in self.game.town.alive_ids():
             if self.action_type == "kill" and pid == self.player_id:
                 continue
-            member = self.game.channel.guild.get_member(pid)
-            name = member.display_name if member else f"User({pid})"
+            name = self.game.members.name(self.game.channel.guild, pid)
             options.append(discord.SelectOption(label=name, value=str(pid)))
         self.children[0].options = options
 
@@ -77,28 +78,25 @@ class NightActionPortalView(discord.ui.View):
         if not action_type:
             return await interaction.response.send_message("💤 You are a villager. You must sleep through the night.", ephemeral=True)
             
-        view = NightActionView(self.game, action_type, interaction.user.id)
+        view = self.game.lifecycle.own_view(NightActionView(self.game, action_type, interaction.user.id), expires=False)
         await view.update_options()
         await interaction.response.send_message(f"🌙 **{role.capitalize()} Action**\nChoose your target for tonight!", view=view, ephemeral=True)
 
     @discord.ui.button(label="Mafia Action 🔪", style=discord.ButtonStyle.danger)
     async def mafia_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role = self.game.players_roles.get(interaction.user.id)
-        if role != "mafia":
+        if self.game.town.role(interaction.user.id) != Role.MAFIA:
             return await interaction.response.send_message("❌ You are not the Mafia!", ephemeral=True)
         await self.create_action_view(interaction, "mafia")
 
     @discord.ui.button(label="Doctor Action 🩺", style=discord.ButtonStyle.success)
     async def doctor_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role = self.game.players_roles.get(interaction.user.id)
-        if role != "doctor":
+        if self.game.town.role(interaction.user.id) != Role.DOCTOR:
             return await interaction.response.send_message("❌ You are not the Doctor!", ephemeral=True)
         await self.create_action_view(interaction, "doctor")
 
     @discord.ui.button(label="Detective Action 🔍", style=discord.ButtonStyle.primary)
     async def detective_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role = self.game.players_roles.get(interaction.user.id)
-        if role != "detective":
+        if self.game.town.role(interaction.user.id) != Role.DETECTIVE:
             return await interaction.response.send_message("❌ You are not the Detective!", ephemeral=True)
         await self.create_action_view(interaction, "detective")
 
@@ -123,10 +121,14 @@ class MafiaCommands(commands.Cog):
             # Store the action handler in the game object so it can be called in subsequent nights
             game.action_handler = self.handle_night_actions
             
-            # Register game in the manager
-            await self.bot.game_manager.register_game(game)
+            # The persisted game takes over the lobby's players in the manager
+            try:
+                await self.bot.game_manager.hand_over(lobby.session, game)
+            except GameConflict as e:
+                return await inter.channel.send(str(e))
+            await game.start_game()
             
-            reveal_view = RoleRevealView(game.players_roles, role_info)
+            reveal_view = game.lifecycle.own_view(RoleRevealView(game.town, role_info), expires=False)
             msg = await inter.channel.send("🎭 **ROLE REVEAL PHASE**\nYour secret identity awaits... Click the button below to discover who you are in the shadows!", view=reveal_view)
             
             # Wait 15 seconds for people to see their roles before starting night
@@ -144,11 +146,11 @@ class MafiaCommands(commands.Cog):
             max_players=20,
             rules="1. 5-20 Players.\n2. Roles assigned instantly.\n3. 10 minute phases.\n4. View your role via the button in chat!"
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
     async def handle_night_actions(self, game: MafiaGame):
         # Use the Portal View to let special roles claim their action in the channel
-        view = NightActionPortalView(game, self.handle_night_actions)
+        view = game.lifecycle.own_view(NightActionPortalView(game, self.handle_night_actions), expires=False)
         await game.channel.send("🕵️ **Night Action Portal**\nSpecial roles, please click your respective button below to perform your secret actions!", view=view)
 
     @app_commands.command(name="vote", description="Vote for someone to be eliminated from the Mafia game.")
@@ -156,16 +158,16 @@ class MafiaCommands(commands.Cog):
     async def vote(self, interaction: discord.Interaction, target: discord.Member):
         game = self.bot.game_manager.get_game_in_channel(interaction.channel_id)
         
-        if not game:
+        if not isinstance(game, MafiaGame):
             return await interaction.response.send_message("There is no active Mafia game in this channel!", ephemeral=True)
         
-        if game.phase != "voting":
+        if game.town.phase != Phase.VOTING:
             return await interaction.response.send_message("It is not currently voting time!", ephemeral=True)
         
-        if interaction.user.id not in game.alive_players:
+        if not game.town.is_alive(interaction.user.id):
             return await interaction.response.send_message("You are already dead and cannot vote!", ephemeral=True)
         
-        if target.id not in game.alive_players:
+        if not game.town.is_alive(target.id):
             return await interaction.response.send_message("That person is already dead or not in the game!", ephemeral=True)
             
         if target.id == interaction.user.id:
@@ -180,10 +182,10 @@ class MafiaCommands(commands.Cog):
     async def resolve_vote(self, interaction: discord.Interaction):
         game = self.bot.game_manager.get_game_in_channel(interaction.channel_id)
         
-        if not game:
+        if not isinstance(game, MafiaGame):
             return await interaction.response.send_message("There is no active Mafia game in this channel!", ephemeral=True)
             
-        if game.phase != "voting":
+        if game.town.phase != Phase.VOTING:
             return await interaction.response.send_message("The game is not in the voting phase!", ephemeral=True)
             
         if interaction.user.id != game.host.id:
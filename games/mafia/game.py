@@ -1,25 +1,66 @@
 import discord
 import random
 import asyncio
+import time
 from typing import List, Dict, Optional, Any
 from core.game import BaseGame
 from core.embeds import EmbedFactory
+from core.state import pack, unpack
+from .state import MafiaState, Phase, Role
 
 class MafiaGame(BaseGame):
+    game_type = "mafia"
+    display_name = "Mafia"
+
     def __init__(self, game_id: str, host: discord.Member, channel: discord.TextChannel):
         super().__init__(game_id, host, channel)
-        self.players_roles: Dict[int, str] = {}
-        self.alive_players: List[int] = []
-        self.phase = "setup" # setup, night, day, voting
-        self.night_actions: Dict[str, Any] = {"kill": None, "protect": None, "investigate": None}
-        self.acted_players: set = set()
-        self.votes: Dict[int, int] = {} # voter -> target
+        self.town = MafiaState() # roles, lives, night actions and votes by seat
         self.phase_duration = 600 # 10 minutes
         self.phase_timer: Optional[asyncio.Task] = None
+        self.action_handler = None
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"town": pack(self.town)}
+
+    def from_state(self, state: Dict[str, Any]):
+        if "town" in state:
+            self.town = unpack(MafiaState, state["town"])
+        elif "roles" in state:
+            # Saved before the compact state, JSON turned the int keys into strings
+            roles = {int(pid): Role[role.upper()] for pid, role in state["roles"].items()}
+            self.town = MafiaState(roles, roles.values())
+            for pid in roles:
+                if pid not in state.get("alive", []):
+                    self.town.eliminate(pid)
+            self.town.phase = Phase[state.get("phase", "setup").upper()]
+            self.town.deadline = state.get("deadline") or 0.0
+
+    async def on_restore(self, bot: discord.Client):
+        cog = bot.get_cog("MafiaCommands")
+        if cog:
+            self.action_handler = cog.handle_night_actions
+
+        if self.town.phase == Phase.SETUP:
+            await self.start_night(self.action_handler)
+            return
+
+        callbacks = {Phase.NIGHT: self.start_day, Phase.DAY: self.start_voting, Phase.VOTING: self.resolve_voting}
+        callback = callbacks.get(self.town.phase)
+        if callback:
+            remaining = max(0, self.town.deadline - time.time())
+            await self._start_phase_timer(remaining, callback)
 
-    async def _start_phase_timer(self, delay: int, callback):
-        if self.phase_timer:
+    def _cancel_phase_timer(self):
+        # Phase changes run inside the timer when it fires, it must not cancel itself
+        if self.phase_timer and self.phase_timer is not asyncio.current_task():
             self.phase_timer.cancel()
+        self.phase_timer = None
+
+    async def _start_phase_timer(self, delay: float, callback):
+        self._cancel_phase_timer()
+        self.town.deadline = time.time() + delay
+        # Saved before the new timer exists, so nothing can cancel the write halfway
+        await self.save_game()
         
         async def timer_wrapper():
             try:
@@ -28,11 +69,10 @@ class MafiaGame(BaseGame):
             except asyncio.CancelledError:
                 pass
         
-        self.phase_timer = asyncio.create_task(timer_wrapper())
+        self.phase_timer = self.lifecycle.own_task(asyncio.create_task(timer_wrapper()))
 
     async def start_mafia(self, players: List[discord.Member]) -> Dict[str, Any]:
         self.players = players
-        self.alive_players = [p.id for p in self.players]
         
         # Role distribution
         num_players = len(players)
@@ -41,8 +81,9 @@ class MafiaGame(BaseGame):
         num_detectives = max(1, num_players // 8)
         num_villagers = num_players - num_mafia - num_doctors - num_detectives
         
-        roles = (["mafia"] * num_mafia) + (["doctor"] * num_doctors) + (["detective"] * num_detectives) + (["villager"] * num_villagers)
+        roles = ([Role.MAFIA] * num_mafia) + ([Role.DOCTOR] * num_doctors) + ([Role.DETECTIVE] * num_detectives) + ([Role.VILLAGER] * num_villagers)
         random.shuffle(roles)
+        self.town = MafiaState([p.id for p in self.players], roles)
         
         role_info = {
             "mafia": {"color": discord.Color.red(), "emoji": "🔪", "desc": "You are Mafia. Goal: Kill everyone else."},
@@ -55,17 +96,15 @@ class MafiaGame(BaseGame):
         print("🕵️  MAFIA GAME ROLE ASSIGNMENTS 🕵️")
         print("="*40)
         for i, player in enumerate(self.players):
-            role_key = roles[i]
-            self.players_roles[player.id] = role_key
+            role_key = roles[i].key
             print(f"{player.display_name:<20} | {role_key.upper():<12} {role_info[role_key]['emoji']}")
         print("="*40 + "\n")
             
         return role_info
 
     async def start_night(self, action_callback=None):
-        self.phase = "night"
-        self.night_actions = {"kill": None, "protect": None, "investigate": None}
-        self.acted_players = set()
+        self.town.phase = Phase.NIGHT
+        self.town.reset_night()
         await self.channel.send("🌙 **Night falls.**\nEveryone, please close your eyes. The town is silent... Special roles, check the chat to perform your actions!")
         
         # Trigger action requests if a callback is provided
@@ -76,44 +115,39 @@ class MafiaGame(BaseGame):
         await self._start_phase_timer(60, self.start_day)
 
     def record_kill(self, target_id: int):
-        self.night_actions["kill"] = target_id
+        self.town.record_night("kill", target_id)
 
     def record_protect(self, target_id: int):
-        self.night_actions["protect"] = target_id
+        self.town.record_night("protect", target_id)
 
     def record_investigate(self, target_id: int):
-        self.night_actions["investigate"] = target_id
+        self.town.record_night("investigate", target_id)
 
     async def record_action(self, player_id: int):
-        self.acted_players.add(player_id)
+        self.town.mark_acted(player_id)
+        await self.save_game()
         if await self.check_all_acted():
-            if self.phase_timer:
-                self.phase_timer.cancel()
-                self.phase_timer = None
+            self._cancel_phase_timer()
             await self.channel.send("✨ **All special roles have acted! The sun is rising early...**")
             await self.start_day()
 
     async def check_all_acted(self) -> bool:
-        special_roles = {"mafia", "doctor", "detective"}
-        special_players = [pid for pid in self.alive_players if self.players_roles.get(pid) in special_roles]
-        if not special_players:
-            return False
-        return all(pid in self.acted_players for pid in special_players)
+        return self.town.all_acted()
 
     async def reveal_investigation(self):
-        target_id = self.night_actions["investigate"]
+        target_id = self.town.night_target("investigate")
         if not target_id:
             return
             
-        detective_id = next((pid for pid, role in self.players_roles.items() if role == "detective"), None)
-        if not detective_id or detective_id not in self.alive_players:
+        detective_id = self.town.holder(Role.DETECTIVE)
+        if not detective_id or not self.town.is_alive(detective_id):
             return
             
-        detective = self.channel.guild.get_member(detective_id)
-        target = self.channel.guild.get_member(target_id)
+        detective = await self.members.resolve(self.channel.guild, detective_id)
+        target = await self.members.resolve(self.channel.guild, target_id)
         
         if detective and target:
-            is_mafia = self.players_roles.get(target_id) == "mafia"
+            is_mafia = self.town.role(target_id) == Role.MAFIA
             result = "is Mafia! 🔪" if is_mafia else "is NOT Mafia. 🏘️"
             try:
                 await detective.send(f"🔍 **Investigation Result:** {target.display_name} {result}")
@@ -121,49 +155,37 @@ class MafiaGame(BaseGame):
                 await self.channel.send(f"⚠️ Could not DM the Detective with their result!")
 
     async def record_vote(self, voter_id: int, target_id: int):
-        self.votes[voter_id] = target_id
+        self.town.vote(voter_id, target_id)
+        await self.save_game()
         if await self.check_all_voted():
-            if self.phase_timer:
-                self.phase_timer.cancel()
-                self.phase_timer = None
+            self._cancel_phase_timer()
             await self.channel.send("🗳️ Everyone has voted! The results are being tallied...")
             await self.resolve_voting()
 
     async def check_all_voted(self) -> bool:
-        return len(self.votes) >= len(self.alive_players)
+        return self.town.all_voted()
 
 
     async def resolve_voting(self):
-        if self.phase != "voting":
+        if self.town.phase != Phase.VOTING:
             return
         
-        if self.phase_timer:
-            self.phase_timer.cancel()
-            self.phase_timer = None
+        self._cancel_phase_timer()
             
-        if not self.votes:
+        candidates = self.town.leaders()
+        if not candidates:
             await self.channel.send("🌅 **Morning comes.** No one was voted out due to lack of votes.")
             await self.start_night(self.action_handler)
             return
         
-        # Count votes
-        counts = {}
-        for target in self.votes.values():
-            counts[target] = counts.get(target, 0) + 1
-        
-        max_votes = max(counts.values())
-        candidates = [target for target, count in counts.items() if count == max_votes]
-        
         if len(candidates) > 1:
             await self.channel.send("🌅 **Morning comes.** The town is divided and no one was voted out.")
         else:
             voted_out = candidates[0]
-            if voted_out in self.alive_players:
-                self.alive_players.remove(voted_out)
+            self.town.eliminate(voted_out)
             
-            role = self.players_roles.get(voted_out, "unknown")
-            user = self.channel.guild.get_member(voted_out)
-            mention = user.mention if user else f"User({voted_out})"
+            role = self.town.role(voted_out).key
+            mention = self.members.mention(self.channel.guild, voted_out)
             
             embed = discord.Embed(
                 title="🌅 The Town's Verdict",
@@ -181,18 +203,16 @@ class MafiaGame(BaseGame):
         await self.start_night(self.action_handler)
  
     async def start_day(self):
-        self.phase = "day"
-        killed = self.night_actions["kill"]
-        protected = self.night_actions["protect"]
+        self.town.phase = Phase.DAY
+        killed = self.town.night_target("kill")
+        protected = self.town.night_target("protect")
         
         # Reveal investigation results to the detective first
         await self.reveal_investigation()
         
         if killed and killed != protected:
-            if killed in self.alive_players:
-                self.alive_players.remove(killed)
-            user = self.channel.guild.get_member(killed)
-            mention = user.mention if user else f"User({killed})"
+            self.town.eliminate(killed)
+            mention = self.members.mention(self.channel.guild, killed)
             
             embed = discord.Embed(
                 title="🌅 A Grim Morning",
@@ -213,8 +233,8 @@ class MafiaGame(BaseGame):
         await self._start_phase_timer(60, self.start_voting)
 
     async def start_voting(self):
-        self.phase = "voting"
-        self.votes = {}
+        self.town.phase = Phase.VOTING
+        self.town.clear_votes()
         await self.channel.send("⏳ Discussion time is over! The town must now cast their votes. Who is the traitor?\nUse `/mafia vote` to cast your vote.")
         
         # Wait for voting duration (60 seconds)
@@ -222,13 +242,17 @@ class MafiaGame(BaseGame):
 
 
     async def check_win_condition(self) -> bool:
-        mafia_alive = [p for p in self.alive_players if self.players_roles[p] == "mafia"]
-        town_alive = [p for p in self.alive_players if self.players_roles[p] != "mafia"]
+        mafia_alive = self.town.count_alive(mafia=True)
+        town_alive = self.town.count_alive(mafia=False)
         
         if not mafia_alive:
             await self.channel.send("🏆 **TOWN WINS!** All mafia have been eliminated.")
-            return True
-        if len(mafia_alive) >= len(town_alive):
+        elif mafia_alive >= town_alive:
             await self.channel.send("🩸 **MAFIA WINS!** They have taken over the town.")
-            return True
-        return False
+        else:
+            return False
+
+        self.town.phase = Phase.ENDED
+        # Cancels the phase timer too, unless this is running inside it
+        await self.end_game()
+        return True
@@ -0,0 +1,134 @@
+import array
+import struct
+from enum import IntEnum
+from typing import Iterable, List, Optional
+from core.state import NO_SEAT, Seats, array_bytes, read_array
+
+class Role(IntEnum):
+    VILLAGER = 0
+    MAFIA = 1
+    DOCTOR = 2
+    DETECTIVE = 3
+
+    @property
+    def key(self) -> str:
+        return self.name.lower()
+
+SPECIAL_ROLES = (Role.MAFIA, Role.DOCTOR, Role.DETECTIVE)
+
+class Phase(IntEnum):
+    SETUP = 0
+    NIGHT = 1
+    DAY = 2
+    VOTING = 3
+    ENDED = 4
+
+NIGHT_ACTIONS = ("kill", "protect", "investigate")
+
+class MafiaState:
+    """Roles, lives, night actions and votes of one game, one byte or short per seat."""
+    __slots__ = ("seats", "roles", "alive", "acted", "votes", "night", "phase", "deadline")
+
+    HEADER = struct.Struct("<Bd") # phase, deadline (0 when no timer runs)
+
+    def __init__(self, player_ids: Iterable[int] = (), roles: Iterable[Role] = ()):
+        self.seats = Seats(player_ids)
+        count = len(self.seats)
+        self.roles = bytearray(roles) or bytearray(count)
+        self.alive = bytearray([1]) * count
+        self.acted = bytearray(count)
+        self.votes = array.array("h", [NO_SEAT]) * count # voter seat -> target seat
+        self.night = array.array("h", [NO_SEAT]) * len(NIGHT_ACTIONS) # seat per night action
+        self.phase = Phase.SETUP
+        self.deadline = 0.0
+
+    def role(self, user_id: int) -> Optional[Role]:
+        seat = self.seats.seat(user_id)
+        return None if seat == NO_SEAT else Role(self.roles[seat])
+
+    def holder(self, role: Role) -> Optional[int]:
+        """Id of the first player with the role."""
+        seat = self.roles.find(role)
+        return None if seat == -1 else self.seats.ids[seat]
+
+    def is_alive(self, user_id: int) -> bool:
+        seat = self.seats.seat(user_id)
+        return seat != NO_SEAT and bool(self.alive[seat])
+
+    def alive_ids(self) -> List[int]:
+        return [user_id for user_id, alive in zip(self.seats.ids, self.alive) if alive]
+
+    def eliminate(self, user_id: int):
+        seat = self.seats.seat(user_id)
+        if seat != NO_SEAT:
+            self.alive[seat] = 0
+
+    def count_alive(self, mafia: bool) -> int:
+        return sum(1 for role, alive in zip(self.roles, self.alive) if alive and (role == Role.MAFIA) == mafia)
+
+    def reset_night(self):
+        self.night = array.array("h", [NO_SEAT]) * len(NIGHT_ACTIONS)
+        self.acted = bytearray(len(self.seats))
+
+    def record_night(self, action: str, target_id: int):
+        self.night[NIGHT_ACTIONS.index(action)] = self.seats.seat(target_id)
+
+    def night_target(self, action: str) -> Optional[int]:
+        seat = self.night[NIGHT_ACTIONS.index(action)]
+        return None if seat == NO_SEAT else self.seats.ids[seat]
+
+    def mark_acted(self, user_id: int):
+        seat = self.seats.seat(user_id)
+        if seat != NO_SEAT:
+            self.acted[seat] = 1
+
+    def all_acted(self) -> bool:
+        """Every living special role has acted. False when none are left."""
+        special = [seat for seat, role in enumerate(self.roles) if role in SPECIAL_ROLES and self.alive[seat]]
+        return bool(special) and all(self.acted[seat] for seat in special)
+
+    def vote(self, voter_id: int, target_id: int):
+        voter = self.seats.seat(voter_id)
+        if voter != NO_SEAT:
+            self.votes[voter] = self.seats.seat(target_id)
+
+    def clear_votes(self):
+        self.votes = array.array("h", [NO_SEAT]) * len(self.seats)
+
+    def vote_count(self) -> int:
+        return sum(1 for target in self.votes if target != NO_SEAT)
+
+    def all_voted(self) -> bool:
+        return self.vote_count() >= sum(self.alive)
+
+    def leaders(self) -> List[int]:
+        """Ids of the players with the most votes, empty when nobody voted."""
+        counts = [0] * len(self.seats)
+        for target in self.votes:
+            if target != NO_SEAT:
+                counts[target] += 1
+        top = max(counts, default=0)
+        return [self.seats.ids[seat] for seat, count in enumerate(counts) if top and count == top]
+
+    def to_bytes(self) -> bytes:
+        return b"".join((
+            self.HEADER.pack(self.phase, self.deadline),
+            self.seats.to_bytes(),
+            bytes(self.roles), bytes(self.alive), bytes(self.acted),
+            array_bytes(self.votes),
+            array_bytes(self.night)
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MafiaState":
+        state = cls()
+        phase, state.deadline = cls.HEADER.unpack_from(data, 0)
+        state.phase = Phase(phase)
+        state.seats, offset = Seats.read(data, cls.HEADER.size)
+        count = len(state.seats)
+        state.roles = bytearray(data[offset:offset + count])
+        state.alive = bytearray(data[offset + count:offset + 2 * count])
+        state.acted = bytearray(data[offset + 2 * count:offset + 3 * count])
+        state.votes, offset = read_array("h", data, offset + 3 * count, count)
+        state.night, _ = read_array("h", data, offset, len(NIGHT_ACTIONS))
+        return state
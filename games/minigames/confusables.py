@@ -0,0 +1,169 @@
+"""Look-alike character index for Find Letter and Correct Letter.
+
+Targets are the characters players can type (ASCII letters and digits). Fillers are letters
+and digits from the Latin, Greek, Cyrillic and letterlike blocks. Every (filler, target) pair
+is scored by rendering both glyphs in a monospace font and comparing their ink, then kept in a
+difficulty bucket. Glyphs that render identically are dropped, the odd one out has to be
+visible. data/confusables.bin is built on first use, delete it to rebuild.
+"""
+import mmap
+import os
+import random
+import string
+import struct
+import threading
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+INDEX_PATH = "data/confusables.bin"
+MAGIC = b"CONF"
+TARGETS = string.ascii_letters + string.digits
+FILLER_RANGES = [
+    (0x0030, 0x007A), # ASCII letters and digits
+    (0x00C0, 0x024F), # Latin-1 supplement, Latin extended A and B
+    (0x0370, 0x03FF), # Greek
+    (0x0400, 0x04FF), # Cyrillic
+    (0x1E00, 0x1EFF), # Latin extended additional
+    (0x2100, 0x214F)  # Letterlike symbols
+]
+
+# difficulty -> similarity range, as ink overlap between the two glyphs
+BUCKETS = {
+    "easy": (0.5, 0.6),
+    "normal": (0.6, 0.75),
+    "hard": (0.75, 0.94) # above this the glyphs are too close to tell apart
+}
+DIFFICULTIES = tuple(BUCKETS)
+
+HEADER = struct.Struct("<4s3I")
+# filler code point, target, similarity * 255
+RECORD = struct.Struct("<IBBxx")
+
+GLYPH_SIZE = 32
+FONT_NAMES = ["DejaVuSansMono.ttf", "DejaVuSans.ttf"]
+
+def load_font() -> ImageFont.ImageFont:
+    for name in FONT_NAMES:
+        try:
+            return ImageFont.truetype(name, GLYPH_SIZE)
+        except OSError:
+            continue
+    # The bundled font only covers ASCII, the index then only holds ASCII pairs
+    return ImageFont.load_default(size=GLYPH_SIZE)
+
+def glyph_bits(font: ImageFont.ImageFont, char: str) -> int:
+    """Renders a character on a fixed canvas and packs its ink into an integer bitset."""
+    img = Image.new("1", (GLYPH_SIZE, GLYPH_SIZE * 3 // 2), 0)
+    ImageDraw.Draw(img).text((GLYPH_SIZE // 2, GLYPH_SIZE), char, fill=1, font=font, anchor="ms")
+    return int.from_bytes(img.tobytes(), "big")
+
+def similarity(a: int, b: int) -> float:
+    union = (a | b).bit_count()
+    return (a & b).bit_count() / union if union else 1.0
+
+def candidate_fillers() -> List[str]:
+    chars = []
+    for start, end in FILLER_RANGES:
+        for code in range(start, end + 1):
+            char = chr(code)
+            if unicodedata.category(char)[0] in "LN" and char.isprintable():
+                chars.append(char)
+    return chars
+
+def build_buckets() -> Dict[str, List[Tuple[int, int, int]]]:
+    font = load_font()
+    missing = glyph_bits(font, "\U000F0000") # what the font draws for characters it lacks
+    target_bits = {t: glyph_bits(font, t) for t in TARGETS}
+
+    buckets: Dict[str, List[Tuple[int, int, int]]] = {name: [] for name in BUCKETS}
+    for filler in candidate_fillers():
+        bits = glyph_bits(font, filler)
+        if not bits or bits == missing:
+            continue
+        for target, t_bits in target_bits.items():
+            # Typing the filler must not count as the answer
+            if filler.upper() == target.upper():
+                continue
+            score = similarity(bits, t_bits)
+            for name, (low, high) in BUCKETS.items():
+                if low <= score < high:
+                    buckets[name].append((ord(filler), ord(target), int(score * 255)))
+                    break
+    # Records sharing a filler stay next to each other, so multi-target grids find partners in O(1)
+    for records in buckets.values():
+        records.sort()
+    return buckets
+
+def build(path: str = INDEX_PATH):
+    buckets = build_buckets()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, *(len(buckets[name]) for name in DIFFICULTIES)))
+        for name in DIFFICULTIES:
+            for record in buckets[name]:
+                f.write(RECORD.pack(*record))
+
+class ConfusablesIndex:
+    """Read-only, memory-mapped view of the pair index."""
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, *counts = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a confusables index")
+        self.ranges: Dict[str, Tuple[int, int]] = {}
+        offset = 0
+        for name, count in zip(DIFFICULTIES, counts):
+            self.ranges[name] = (offset, count)
+            offset += count
+
+    def record(self, index: int) -> Tuple[str, str]:
+        filler, target, _ = RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        return chr(filler), chr(target)
+
+    def sample(self, difficulty: str = "normal") -> Tuple[str, str]:
+        """Returns a random (filler, target) pair from a difficulty bucket."""
+        start, count = self.ranges[difficulty]
+        return self.record(start + random.randrange(count))
+
+    def sample_group(self, difficulty: str = "normal", targets: int = 2) -> Tuple[str, List[str]]:
+        """Returns a filler and up to `targets` different characters that can hide among it."""
+        start, count = self.ranges[difficulty]
+        index = start + random.randrange(count)
+        filler, target = self.record(index)
+        found = [target]
+        # Only the neighbours are looked at, a filler with a single partner gives a single target
+        for step in (1, -1):
+            i = index + step
+            while len(found) < targets and start <= i < start + count:
+                other_filler, other_target = self.record(i)
+                if other_filler != filler:
+                    break
+                if other_target.upper() not in (t.upper() for t in found):
+                    found.append(other_target)
+                i += step
+        return filler, found
+
+    def stats(self) -> Dict[str, int]:
+        return {name: count for name, (_, count) in self.ranges.items()}
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+_index: Optional[ConfusablesIndex] = None
+_lock = threading.Lock()
+
+def get_index() -> ConfusablesIndex:
+    """Loads the index once, building it first if needed. Safe to call from puzzle worker threads."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                if not os.path.exists(INDEX_PATH):
+                    build(INDEX_PATH)
+                _index = ConfusablesIndex(INDEX_PATH)
+    return _index
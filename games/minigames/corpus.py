@@ -0,0 +1,248 @@
+"""Word corpus shared by the word minigames.
+
+Plain word lists (one word per line) are compiled into data/words.bin: a header, a bucket
+table, one fixed-size record per word and the letters themselves. Words are sorted by
+difficulty then length, so every (difficulty, length) bucket is a contiguous range and picking
+a word is a couple of struct reads on a memory map, however big the list is. Split points for
+Text Split and Merge Text are worked out once at build time and stored in the records.
+
+The index is rebuilt automatically when a source list is newer than it or it was built by an
+older version.
+
+Only data/wordlist.txt ships for now, a few hundred hand-picked words. The format is meant for
+100k+ word lists, but a dictionary that size cannot be reviewed by hand and the big public ones
+carry slurs and words nobody would guess, so larger lists are added to CORPUS_SOURCES once
+they have been filtered. Until then each channel goes through the whole list before a word
+comes back.
+"""
+import math
+import mmap
+import os
+import random
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+CORPUS_PATH = "data/words.bin"
+# Only lists shipped with the bot, so every host plays the same, reviewed words
+CORPUS_SOURCES = ["data/wordlist.txt"]
+MAGIC = b"WRD2" # bumped when the sources changed, older indexes are rebuilt
+MIN_LENGTH = 3
+MAX_LENGTH = 15
+DIFFICULTIES = ("easy", "normal", "hard")
+MAX_BAGS = 10000 # channels and word ranges whose draws are remembered, least recently used are forgotten
+
+HEADER = struct.Struct("<4sIII") # magic, words, letters, buckets
+BUCKET = struct.Struct("<BBII") # difficulty, length, first word, word count
+# letters offset, length, Text Split point, Merge Text cuts, letter rarity * 1000
+RECORD = struct.Struct("<IBBBBH2x")
+
+# Relative frequency of letters in English text, in percent
+LETTER_FREQUENCY = {
+    "E": 12.7, "T": 9.1, "A": 8.2, "O": 7.5, "I": 7.0, "N": 6.7, "S": 6.3, "H": 6.1, "R": 6.0,
+    "D": 4.3, "L": 4.0, "C": 2.8, "U": 2.8, "M": 2.4, "W": 2.4, "F": 2.2, "G": 2.0, "Y": 2.0,
+    "P": 1.9, "B": 1.5, "V": 1.0, "K": 0.8, "J": 0.15, "X": 0.15, "Q": 0.1, "Z": 0.07
+}
+VOWELS = set("AEIOUY")
+
+def rarity(word: str) -> float:
+    """Mean surprise of the letters, about 1 for common letters and 3 for Q or Z."""
+    return sum(-math.log10(LETTER_FREQUENCY[c] / 100) for c in word) / len(word)
+
+def split_point(word: str, parts: int, index: int, low: int = 1) -> int:
+    """Where the index-th of `parts` cuts should go, moved to a nearby syllable-like boundary.
+
+    A cut before a consonant that is followed by a vowel (RAIN|BOW, ROU|TER) reads naturally.
+    """
+    target = round(len(word) * index / parts)
+    for offset in (0, 1, -1, 2, -2):
+        i = target + offset
+        if low <= i < len(word) - 1 and word[i] not in VOWELS and word[i + 1] in VOWELS:
+            return i
+    return min(max(target, low), len(word) - 1)
+
+def read_sources(paths: List[str]) -> List[str]:
+    words = set()
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                word = line.strip()
+                # Lower case only skips proper nouns, abbreviations and possessives
+                if word.isascii() and word.isalpha() and word.islower() and MIN_LENGTH <= len(word) <= MAX_LENGTH:
+                    words.add(word.upper())
+    return sorted(words)
+
+def build(path: str = CORPUS_PATH, sources: Optional[List[str]] = None):
+    words = read_sources(sources or CORPUS_SOURCES)
+    if not words:
+        raise FileNotFoundError(f"No word list found in {sources or CORPUS_SOURCES}")
+
+    # Difficulty by length and letter rarity, cut at the corpus' own thirds so buckets stay balanced
+    scores = {word: len(word) + 3 * rarity(word) for word in words}
+    ranked = sorted(scores.values())
+    cutoffs = (ranked[len(ranked) // 3], ranked[2 * len(ranked) // 3])
+
+    def difficulty(word: str) -> int:
+        score = scores[word]
+        return 0 if score < cutoffs[0] else 1 if score < cutoffs[1] else 2
+
+    words.sort(key=lambda w: (difficulty(w), len(w), w))
+
+    buckets: List[Tuple[int, int, int, int]] = []
+    records = []
+    letters = bytearray()
+    for i, word in enumerate(words):
+        key = (difficulty(word), len(word))
+        if not buckets or buckets[-1][:2] != key:
+            buckets.append((*key, i, 0))
+        buckets[-1] = (*key, buckets[-1][2], buckets[-1][3] + 1)
+        cut1 = split_point(word, 3, 1)
+        cut2 = split_point(word, 3, 2, low=cut1 + 1)
+        records.append(RECORD.pack(len(letters), len(word), split_point(word, 2, 1), cut1, cut2, int(rarity(word) * 1000)))
+        letters += word.encode("ascii")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(words), len(letters), len(buckets)))
+        for bucket in buckets:
+            f.write(BUCKET.pack(*bucket))
+        f.write(b"".join(records))
+        f.write(letters)
+
+class ShuffleBag:
+    """Walks a random permutation of range(size) without storing it.
+
+    A small Feistel network over the next power of four scrambles the index, values that fall
+    outside the range are walked through again. Memory is constant whatever the size.
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            # Nothing to draw, draw() would walk the permutation forever
+            raise ValueError("A shuffle bag needs at least one value")
+        self.size = size
+        bits = max(2, (size - 1).bit_length() + 1) // 2
+        self.half_bits = bits
+        self.mask = (1 << bits) - 1
+        self.position = 0
+        self.reshuffle()
+
+    def reshuffle(self):
+        self.keys = [random.getrandbits(32) for _ in range(4)]
+        self.position = 0
+
+    def _permute(self, value: int) -> int:
+        left, right = value >> self.half_bits, value & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (hash((key, right)) & self.mask)
+        return (left << self.half_bits) | right
+
+    def draw(self) -> int:
+        if self.position >= self.size:
+            # Every value came out once, start a new permutation
+            self.reshuffle()
+        value = self._permute(self.position)
+        while value >= self.size:
+            value = self._permute(value)
+        self.position += 1
+        return value
+
+class Corpus:
+    """Read-only, memory-mapped view of the compiled word list."""
+
+    def __init__(self, path: str = CORPUS_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, letters, bucket_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a word corpus")
+        # (difficulty, length) -> (first word, count), a few dozen entries at most
+        self.buckets: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        for i in range(bucket_count):
+            level, length, first, count = BUCKET.unpack_from(self._map, HEADER.size + i * BUCKET.size)
+            self.buckets[(DIFFICULTIES[level], length)] = (first, count)
+        self._records = HEADER.size + bucket_count * BUCKET.size
+        self._letters = self._records + self.count * RECORD.size
+        self._bags: "OrderedDict[Hashable, Tuple[ShuffleBag, List[Tuple[int, int]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _record(self, index: int) -> Tuple[int, int, int, int, int, int]:
+        return RECORD.unpack_from(self._map, self._records + index * RECORD.size)
+
+    def word(self, index: int) -> str:
+        offset, length, *_ = self._record(index)
+        start = self._letters + offset
+        return self._map[start:start + length].decode("ascii")
+
+    def split(self, index: int) -> Tuple[str, str]:
+        """The word in two halves for Text Split."""
+        _, _, point, _, _, _ = self._record(index)
+        word = self.word(index)
+        return word[:point], word[point:]
+
+    def fragments(self, index: int) -> List[str]:
+        """The word in three pieces for Merge Text."""
+        _, _, _, cut1, cut2, _ = self._record(index)
+        word = self.word(index)
+        return [word[:cut1], word[cut1:cut2], word[cut2:]]
+
+    def ranges(self, difficulty: str, min_length: int = MIN_LENGTH, max_length: int = MAX_LENGTH) -> List[Tuple[int, int]]:
+        found = [self.buckets[(difficulty, length)] for length in range(min_length, max_length + 1) if (difficulty, length) in self.buckets]
+        if not found:
+            # Small lists may not have this difficulty at these lengths, fall back to any difficulty
+            found = [rng for (_, length), rng in self.buckets.items() if min_length <= length <= max_length]
+        return found
+
+    def draw(self, key: Hashable, difficulty: str = "normal", min_length: int = MIN_LENGTH, max_length: int = MAX_LENGTH) -> int:
+        """Returns a word index. A key, usually a channel id, never sees the same word twice until
+        it has seen them all."""
+        bag_key = (key, difficulty, min_length, max_length)
+        with self._lock:
+            entry = self._bags.get(bag_key)
+            if entry is None:
+                ranges = self.ranges(difficulty, min_length, max_length)
+                if not ranges:
+                    raise ValueError(f"No words of {min_length} to {max_length} letters in {self.path}")
+                entry = self._bags[bag_key] = (ShuffleBag(sum(count for _, count in ranges)), ranges)
+                if len(self._bags) > MAX_BAGS:
+                    self._bags.popitem(last=False)
+            else:
+                self._bags.move_to_end(bag_key)
+            bag, ranges = entry
+            value = bag.draw()
+        for first, count in ranges:
+            if value < count:
+                return first + value
+            value -= count
+        raise IndexError(value)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+_corpus: Optional[Corpus] = None
+_corpus_lock = threading.Lock()
+
+def is_stale(path: str = CORPUS_PATH, sources: Optional[List[str]] = None) -> bool:
+    if not os.path.exists(path):
+        return True
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return True
+    built = os.path.getmtime(path)
+    return any(os.path.exists(src) and os.path.getmtime(src) > built for src in sources or CORPUS_SOURCES)
+
+def get_corpus() -> Corpus:
+    """Loads the corpus once, rebuilding it first if the word lists changed. Thread safe."""
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                if is_stale():
+                    build()
+                _corpus = Corpus()
+    return _corpus
@@ -13,12 +13,15 @@ class CorrectLetterCommands(commands.Cog):
     async def correctletter(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Correct Letter...", embed=None, view=None)
-            game = CorrectLetterGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = CorrectLetterGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Correct Letter", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Correct Letter", interaction.user, [interaction.user], rules="Identify the character that is different from all others.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(CorrectLetterCommands(bot))
@@ -2,26 +2,34 @@ import discord
 import time
 import asyncio
 import random
-import string
 from typing import List, Optional, Callable
+from core.puzzles import Puzzle, register_generator
+from games.minigames.confusables import get_index
+
+@register_generator("correctletter", difficulties=("easy", "normal"))
+def generate_puzzle(difficulty: str) -> Puzzle:
+    char1, char2 = get_index().sample(difficulty)
+
+    length = 50
+    target_pos = random.randint(0, length - 1)
+    return Puzzle(char2.upper(), "".join([char1 if i != target_pos else char2 for i in range(length)]), {"target": char2})
 
 class CorrectLetterGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.different_char = ""
         self.spam = ""
         self.start_time = None
 
     async def start(self):
-        char1, char2 = random.sample(string.ascii_uppercase, 2)
-        
-        length = 50
-        target_pos = random.randint(0, length - 1)
-        self.different_char = char2
-        self.spam = "".join([char1 if i != target_pos else char2 for i in range(length)])
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("correctletter")
+        self.different_char = puzzle.answer
+        self.target = puzzle.data.get("target", puzzle.answer)
+        self.spam = puzzle.display
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
@@ -33,15 +41,19 @@ class CorrectLetterGame:
         self.start_time = time.time()
         
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().upper() == self.different_char
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("correctletter", m)
+            return m.content.strip().upper() == self.different_char
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=30)
             elapsed = time.time() - self.start_time
+            self.bot.anticheat.record("correctletter", msg.author.id, elapsed, len(msg.content.strip()))
             
-            result_embed = EmbedFactory.success_embed(f"{msg.author.mention} identified it in **{elapsed:.2f}s**! The different character was **{self.different_char}**.")
+            result_embed = EmbedFactory.success_embed(f"{msg.author.mention} identified it in **{elapsed:.2f}s**! The different character was **{self.target}**.")
             await self.channel.send(embed=result_embed)
             await self.on_end(msg, msg.author)
         except asyncio.TimeoutError:
-            await self.channel.send(f"Time's up! The different character was **{self.different_char}**.")
+            await self.channel.send(f"Time's up! The different character was **{self.target}**.")
             await self.on_end(None, None)
@@ -2,20 +2,47 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from core.views import BaseLobbyView
+from core.game import GameSession
+from core.manager import GameConflict
 from core.embeds import EmbedFactory
-from .view import FastClickView
+from .view import FastClickView, MassFastClickView
 
 class FastClickCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
     @app_commands.command(name="fastclick", description="Mini game: be the first to click the button!")
-    async def fastclick(self, interaction: discord.Interaction):
+    @app_commands.describe(mass="Open to everyone in the channel, no lobby", top="How many of the fastest clickers to list in mass mode")
+    async def fastclick(self, interaction: discord.Interaction, mass: bool = False, top: app_commands.Range[int, 1, 25] = 10):
+        if mass:
+            # No lobby, but the round is still a game: it counts towards the server's quota and /stopall ends it.
+            # Only the host is registered, anyone may click without leaving their own game.
+            session = GameSession("Fast Click", interaction.user, interaction.channel)
+            try:
+                await self.bot.game_manager.register_game(session)
+            except GameConflict as e:
+                return await interaction.response.send_message(str(e), ephemeral=True)
+            self.bot.members.remember(interaction.user)
+
+            async def on_end(game_inter, results):
+                await session.end_game()
+
+            view = session.lifecycle.own_view(MassFastClickView(interaction.user, on_end, top=top))
+            embed = EmbedFactory.create_embed("Fast Click", "Everyone can play! Get ready... wait for the button to change!")
+            try:
+                await interaction.response.send_message(embed=embed, view=view)
+                await session.start_game()
+                msg = await interaction.original_response()
+                return await view.start_countdown(msg)
+            except Exception as e:
+                await session.lifecycle.error(e)
+                raise
+
         async def start_game(inter, players):
             async def on_end(game_inter, winner):
-                pass
+                await lobby.finish()
 
-            view = FastClickView(players, on_end)
+            view = lobby.own(FastClickView(players, on_end))
             embed = EmbedFactory.create_embed("Fast Click", "Get ready... wait for the button to change!")
             await inter.response.edit_message(embed=embed, view=view)
             
@@ -35,7 +62,7 @@ class FastClickCommands(commands.Cog):
             [interaction.user],
             rules="Reaction timing. First player to click the button when it changes wins."
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(FastClickCommands(bot))
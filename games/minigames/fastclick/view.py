@@ -2,7 +2,9 @@ import discord
 import time
 import asyncio
 import random
+import heapq
 from typing import List, Optional, Callable
+from core.timing import ARBITRATION_WINDOW, datetime_ms, reaction_time
 
 class FastClickView(discord.ui.View):
     def __init__(self, players: List[discord.Member], on_end: Callable):
@@ -10,6 +12,8 @@ class FastClickView(discord.ui.View):
         self.players = players
         self.on_end = on_end
         self.start_time = None
+        self.start_ms: Optional[int] = None # when Discord applied the CLICK! edit
+        self.clicks: List[discord.Interaction] = []
         self.winner = None
 
     @discord.ui.button(label="WAIT...", style=discord.ButtonStyle.secondary, disabled=True)
@@ -17,13 +21,26 @@ class FastClickView(discord.ui.View):
         if interaction.user not in self.players:
             return await interaction.response.send_message("You are not in this game!", ephemeral=True)
         
-        if button.label == "CLICK!":
-            self.winner = interaction.user
-            elapsed = time.time() - self.start_time
-            self.stop()
-            await self.calculate_winner(interaction, elapsed)
-        else:
-            await interaction.response.send_message("Too early!", ephemeral=True)
+        if button.label != "CLICK!":
+            return await interaction.response.send_message("Too early!", ephemeral=True)
+
+        if self.winner:
+            return await interaction.response.send_message("Too slow!", ephemeral=True)
+
+        self.clicks.append(interaction)
+        await interaction.response.defer()
+        if len(self.clicks) > 1:
+            return
+
+        # The first click opens a short window, then the click Discord received first wins
+        host_elapsed = time.time() - self.start_time
+        await asyncio.sleep(ARBITRATION_WINDOW)
+        first = min(self.clicks, key=lambda i: i.id)
+        self.winner = first.user
+        elapsed = reaction_time(self.start_ms, first.id, host_elapsed)
+        first.client.anticheat.record("fastclick", first.user.id, elapsed)
+        self.stop()
+        await self.calculate_winner(first, elapsed)
 
     async def calculate_winner(self, interaction: discord.Interaction, elapsed: float):
         from core.embeds import EmbedFactory
@@ -38,4 +55,89 @@ class FastClickView(discord.ui.View):
         button.style = discord.ButtonStyle.success
         button.disabled = False
         self.start_time = time.time()
-        await message.edit(view=self)
+        self.start_ms = int(self.start_time * 1000)
+        edited = await message.edit(view=self)
+        if edited and edited.edited_at:
+            self.start_ms = datetime_ms(edited.edited_at)
+
+class MassFastClickView(discord.ui.View):
+    """Open Fast Click for a whole server. Anyone can click, each click costs one deferred ack."""
+
+    def __init__(self, host: discord.Member, on_end: Callable, top: int = 10, window: float = 3.0):
+        super().__init__(timeout=120)
+        self.host = host
+        self.on_end = on_end
+        self.top = top
+        self.window = window
+        self.message: Optional[discord.Message] = None
+        self.start_time = None
+        self.start_ms: Optional[int] = None
+        self.clicked = set() # user ids, duplicates are dropped
+        # The top fastest clicks as a min-heap of (-interaction id, user id): negating the ids
+        # puts the slowest kept click at the root, where a faster one replaces it
+        self.fastest = []
+        self.total = 0
+        self.closed = False
+
+    @discord.ui.button(label="WAIT...", style=discord.ButtonStyle.secondary, disabled=True)
+    async def click(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # Every click is acknowledged without a message, the result is posted once for everyone
+        await interaction.response.defer()
+        user_id = interaction.user.id
+        if self.closed or button.label != "CLICK!" or user_id in self.clicked:
+            return
+
+        self.clicked.add(user_id)
+        self.total += 1
+        entry = (-interaction.id, user_id)
+        if len(self.fastest) < self.top:
+            heapq.heappush(self.fastest, entry)
+        elif entry > self.fastest[0]:
+            heapq.heapreplace(self.fastest, entry)
+
+        if self.total == 1:
+            host_elapsed = time.time() - self.start_time
+            await asyncio.sleep(self.window)
+            self.closed = True
+            self.stop()
+            first_id = max(self.fastest)[0]
+            reaction_time(self.start_ms, -first_id, host_elapsed)
+            results = self.results()
+            for ranked_id, elapsed in results:
+                interaction.client.anticheat.record("fastclick", ranked_id, elapsed)
+            await self.post_results(results)
+            await self.on_end(interaction, results)
+
+    def results(self) -> List[tuple]:
+        """Returns (user id, seconds) for the fastest clickers, fastest first."""
+        ranked = sorted(self.fastest, reverse=True)
+        return [(user_id, reaction_time(self.start_ms, -neg_id)) for neg_id, user_id in ranked]
+
+    async def post_results(self, results: List[tuple]):
+        from core.embeds import EmbedFactory
+        medals = ["🥇", "🥈", "🥉"]
+        lines = []
+        for i, (user_id, elapsed) in enumerate(results):
+            rank = medals[i] if i < len(medals) else f"**{i + 1}.**"
+            lines.append(f"{rank} <@{user_id}> - **{elapsed:.3f}s**")
+        embed = EmbedFactory.create_embed(
+            "⚡ Fast Click Results",
+            "\n".join(lines),
+            discord.Color.green(),
+            footer=f"{self.total} players clicked"
+        )
+        # A single edit turns the button message into the results
+        await self.message.edit(embed=embed, view=None)
+
+    async def start_countdown(self, message: discord.Message):
+        self.message = message
+        await asyncio.sleep(random.uniform(2, 5))
+        button = self.children[0]
+        button.label = "CLICK!"
+        button.style = discord.ButtonStyle.success
+        button.disabled = False
+        self.start_time = time.time()
+        self.start_ms = int(self.start_time * 1000)
+        edited = await message.edit(view=self)
+        if edited and edited.edited_at:
+            self.start_ms = datetime_ms(edited.edited_at)
@@ -15,10 +15,10 @@ class FastTypeCommands(commands.Cog):
             await inter.response.edit_message(content="Starting Fast Type...", embed=None, view=None)
             
             async def on_end(msg, winner):
-                pass
+                await lobby.finish()
 
             game = FastTypeGame(self.bot, players, inter.channel, on_end)
-            await game.start()
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(
             host=interaction.user,
@@ -32,7 +32,7 @@ class FastTypeCommands(commands.Cog):
             [interaction.user],
             rules="Speed typing. First player to type the displayed sentence exactly wins."
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(FastTypeCommands(bot))
@@ -2,44 +2,63 @@ import discord
 import time
 import asyncio
 import random
+import io
 from typing import List, Optional, Callable
 from core.storage import Storage
+from core.puzzles import Puzzle, register_generator
+from core.timing import arbitrate, reaction_time, snowflake_ms
+from games.minigames.render import render_text
+from games.minigames.corpus import get_corpus
+
+@register_generator("fasttype", per_channel=True)
+def generate_puzzle(difficulty: str, channel_id: Optional[int] = None) -> Puzzle:
+    corpus = get_corpus()
+    word = corpus.word(corpus.draw(channel_id, difficulty, 4, 12))
+
+    # Anti-copy: the word is only shown as an image
+    return Puzzle(word, word, image=render_text(word))
 
 class FastTypeGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.word = ""
         self.start_time = None
         self.winner = None
 
     async def start(self):
-        # Using a fixed list of single words for now, could be loaded from words.json if updated
-        words = ["DISCORD", "PYTHON", "PROGRAMMING", "CHALLENGE", "INTERACTIVE", "EXPERIENCE", "REACTION", "KEYBOARD", "SYSTEM", "FAST"]
-        self.word = random.choice(words)
-        
-        # Apply anti-copy: Inject zero-width spaces between characters
-        display_word = "\u200B".join(list(self.word))
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("fasttype", channel_id=self.channel.id)
+        self.word = puzzle.answer
+        file = discord.File(io.BytesIO(puzzle.image), filename="prompt.png")
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Fast Type",
-            f"Type the following word as fast as you can!\n\n**{display_word}**",
+            "Type the following word as fast as you can!",
             discord.Color.blue()
         )
-        await self.channel.send(embed=embed)
+        embed.set_image(url="attachment://prompt.png")
+        prompt = await self.channel.send(file=file, embed=embed)
         self.start_time = time.time()
         
         def check(m):
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("fasttype", m)
             # Check for exact match with the original word (without ZWSP)
-            return m.channel == self.channel and m.author in self.players and m.content.strip().upper() == self.word
+            return m.content.strip().upper() == self.word
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=10) # 10 seconds
+            host_elapsed = time.time() - self.start_time
+            # Order near-simultaneous answers by when Discord received them, not when we did
+            msg = await arbitrate(self.bot, msg, check)
+            elapsed = reaction_time(snowflake_ms(prompt.id), msg.id, host_elapsed)
+            self.bot.anticheat.record("fasttype", msg.author.id, elapsed, len(msg.content.strip()))
             self.winner = msg.author
-            elapsed = time.time() - self.start_time
             
             result_embed = EmbedFactory.success_embed(f"{self.winner.mention} typed it in **{elapsed:.2f}s** and won! ⌨️")
             await self.channel.send(embed=result_embed)
@@ -13,12 +13,15 @@ class FindEmojiCommands(commands.Cog):
     async def findemoji(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Find The Emoji...", embed=None, view=None)
-            game = FindEmojiGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = FindEmojiGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Find The Emoji", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Find The Emoji", interaction.user, [interaction.user], rules="Locate the specific emoji hidden in the spam.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(FindEmojiCommands(bot))
@@ -2,61 +2,67 @@ import discord
 import time
 import asyncio
 import random
+import io
 from typing import List, Optional, Callable
+from core.puzzles import Puzzle, register_generator
+from core.timing import arbitrate, reaction_time, snowflake_ms
+from games.minigames.render import render_grid
+
+# (filler, target) faces that differ in a single feature
+EMOJI_PAIRS = [("😀", "😃"), ("😃", "😄"), ("😄", "😁"), ("🙂", "😊"), ("🙂", "😐"), ("😮", "😯"), ("😐", "😶")]
+
+@register_generator("findemoji")
+def generate_puzzle(difficulty: str) -> Puzzle:
+    filler, target = random.choice(EMOJI_PAIRS)
+
+    length = 50
+    target_pos = random.randint(0, length - 1)
+
+    # Anti-copy: the grid is only shown as an image, which is also lighter for clients than 50 emoji
+    spam_list = [filler if i != target_pos else target for i in range(length)]
+    return Puzzle(target, "".join(spam_list), image=render_grid(tuple(spam_list), 10, emoji=True))
 
 class FindEmojiGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.target = ""
         self.spam = ""
         self.start_time = None
 
     async def start(self):
-        # Pairs of identical-looking emojis
-        emoji_pairs = [
-            ("🙂", "🙃"), ("😀", "😃"), ("😆", "😅"), ("😊", "😋"),
-            ("😎", "🕶️"), ("🥺", "🥺"), # Some can be identical if we just want volume
-            ("🍎", "🍎"), ("🍒", "🍒")
-        ]
-        # Better yet, just use a large list and one slightly different or just a specific one
-        base_emojis = ["😀", "😃", "😄", "😁", "😆", "😅", "😂", "🤣"]
-        self.target = random.choice(base_emojis)
-        
-        # We need IDENTICAL emojis as per user request to make it hard
-        # But if they are literally identical, any would work.
-        # User said: "identical to each other so the use must find it hard"
-        # I'll use 49 identical ones and 1 slightly different or just 50 identical ones and user must type it.
-        # Actually, "find the emoji" usually implies one is different.
-        # Let's use 49 'O' and 1 '0' logic but with emojis.
-        
-        filler = "😀"
-        self.target = "😃"
-        
-        length = 50
-        target_pos = random.randint(0, length - 1)
-        
-        # Apply anti-copy (ZWSP) to the spam as well
-        spam_list = [filler if i != target_pos else self.target for i in range(length)]
-        self.spam = "\u200B".join(spam_list)
+        # 50 near identical emojis, one is the target
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("findemoji")
+        self.target = puzzle.answer
+        self.spam = puzzle.display
+        file = discord.File(io.BytesIO(puzzle.image), filename="prompt.png")
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Find The Emoji",
-            f"Find the emoji that is different (or find the target) in this spam:\n\n{self.spam}\n\n**Type the emoji!**",
+            "Find the emoji that is different (or find the target) in this spam:\n\n**Type the emoji!**",
             discord.Color.blue()
         )
-        await self.channel.send(embed=embed)
+        embed.set_image(url="attachment://prompt.png")
+        prompt = await self.channel.send(file=file, embed=embed)
         self.start_time = time.time()
         
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip() == self.target
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("findemoji", m)
+            return m.content.strip() == self.target
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=10) # 10 seconds
-            elapsed = time.time() - self.start_time
+            host_elapsed = time.time() - self.start_time
+            # Order near-simultaneous answers by when Discord received them, not when we did
+            msg = await arbitrate(self.bot, msg, check)
+            elapsed = reaction_time(snowflake_ms(prompt.id), msg.id, host_elapsed)
+            self.bot.anticheat.record("findemoji", msg.author.id, elapsed, len(msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{msg.author.mention} found it in **{elapsed:.2f}s**! The emoji was **{self.target}**.")
             await self.channel.send(embed=result_embed)
@@ -13,12 +13,15 @@ class FindLetterCommands(commands.Cog):
     async def findletter(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Find Letter...", embed=None, view=None)
-            game = FindLetterGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = FindLetterGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Find Letter", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Find Letter", interaction.user, [interaction.user], rules="Locate the specific letter hidden in the text spam.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(FindLetterCommands(bot))
@@ -2,48 +2,72 @@ import discord
 import time
 import asyncio
 import random
+import io
 import string
 from typing import List, Optional, Callable
+from core.puzzles import Puzzle, register_generator
+from games.minigames.confusables import get_index
+from games.minigames.render import render_grid
+from core.timing import arbitrate, reaction_time, snowflake_ms
+
+@register_generator("findletter", difficulties=("easy", "normal", "hard"))
+def generate_puzzle(difficulty: str) -> Puzzle:
+    # Hard grids hide two different characters, to be typed in reading order
+    filler, targets = get_index().sample_group(difficulty, 2 if difficulty == "hard" else 1)
+
+    length = 50
+    positions = sorted(random.sample(range(length), len(targets)))
+    spam_list = [filler] * length
+    for pos, target in zip(positions, targets):
+        spam_list[pos] = target
+
+    # Anti-copy: the grid is only shown as an image
+    answer = "".join(spam_list[pos] for pos in positions)
+    return Puzzle(answer.upper(), "".join(spam_list), {"target": answer}, render_grid(tuple(spam_list), 10))
 
 class FindLetterGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.target = ""
         self.spam = ""
         self.start_time = None
 
     async def start(self):
-        # Pairs of identical-looking characters
-        pairs = [("O", "0"), ("I", "l"), ("1", "l"), ("5", "S"), ("8", "B"), ("2", "Z")]
-        pair = random.choice(pairs)
-        filler = pair[0]
-        self.target = pair[1]
-        
-        length = 50
-        target_pos = random.randint(0, length - 1)
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("findletter")
+        self.target = puzzle.data["target"]
+        self.spam = puzzle.display
+        answer = puzzle.answer
+        file = discord.File(io.BytesIO(puzzle.image), filename="prompt.png")
         
-        # Apply anti-copy (ZWSP)
-        spam_list = [filler if i != target_pos else self.target for i in range(length)]
-        self.spam = "\u200B".join(spam_list)
+        what, how = ("characters that are", "them in order") if len(self.target) > 1 else ("character that is", "the character")
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Find Letter",
-            f"Find the character that is different in this spam:\n\n`{self.spam}`\n\n**Type the character!**",
+            f"Find the {what} different in this spam:\n\n**Type {how}!**",
             discord.Color.blue()
         )
-        await self.channel.send(embed=embed)
+        embed.set_image(url="attachment://prompt.png")
+        prompt = await self.channel.send(file=file, embed=embed)
         self.start_time = time.time()
         
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().upper() == self.target.upper()
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("findletter", m)
+            return m.content.strip().upper() == answer
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=10) # 10 seconds
-            elapsed = time.time() - self.start_time
+            host_elapsed = time.time() - self.start_time
+            # Order near-simultaneous answers by when Discord received them, not when we did
+            msg = await arbitrate(self.bot, msg, check)
+            elapsed = reaction_time(snowflake_ms(prompt.id), msg.id, host_elapsed)
+            self.bot.anticheat.record("findletter", msg.author.id, elapsed, len(msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{msg.author.mention} found it in **{elapsed:.2f}s**! The character was **{self.target}**.")
             await self.channel.send(embed=result_embed)
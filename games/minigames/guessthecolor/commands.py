@@ -13,12 +13,15 @@ class GuessTheColorCommands(commands.Cog):
     async def guessthecolor(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Guess The Color...", embed=None, view=None)
-            game = GuessTheColorGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = GuessTheColorGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Guess The Color", start_game, min_players=2)
-        embed = EmbedFactory.game_lobby_embed("Guess The Color", interaction.user, [interaction.user], rules="Identify the color displayed in the embed.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        embed = EmbedFactory.game_lobby_embed("Guess The Color", interaction.user, [interaction.user], rules="Name the color displayed in the embed. Any color name scores by how close it is.")
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(GuessTheColorCommands(bot))
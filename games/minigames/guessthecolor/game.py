@@ -3,54 +3,109 @@ import time
 import asyncio
 import random
 import io
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from core.storage import Storage
+from core.puzzles import Puzzle, register_generator
+from core.timing import arbitrate, reaction_time, snowflake_ms
 from PIL import Image, ImageDraw
+from .palette import LEVELS, get_palette
+
+# Largest ΔE that still wins the round, obscure survey colors get more leeway
+WIN_DELTA_E = {"easy": 3.0, "normal": 5.0, "hard": 8.0}
+# On timeout the closest guess within this ΔE gets up to half a point
+PARTIAL_DELTA_E = 25.0
+
+def partial_credit(distance: float) -> float:
+    return round(0.5 * max(0.0, 1 - distance / PARTIAL_DELTA_E), 1)
+
+@register_generator("guessthecolor", LEVELS)
+def generate_puzzle(difficulty: str) -> Puzzle:
+    palette = get_palette()
+    row = palette.sample(difficulty)
+
+    # Generate color image using Pillow
+    img = Image.new('RGB', (200, 200), color=palette.hexes[row])
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format='PNG')
+    # Every guess is scored against this table, computed here in a worker thread
+    distances = palette.distances(palette.lab[row])
+    data = {"hex": palette.hexes[row], "row": row, "difficulty": difficulty, "distances": distances}
+    return Puzzle(palette.names[row].lower(), palette.names[row], data, img_byte_arr.getvalue())
 
 class GuessTheColorGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.color_name = ""
         self.hex_code = ""
         self.start_time = None
+        self.credit = 1.0 # share of a point the winner earns, less than 1 for a timeout winner
+        self.guesses: Dict[int, Tuple[float, discord.Message]] = {} # user id -> closest guess
 
     async def start(self):
-        colors = await Storage.load_json("data/colors.json")
-        choice = random.choice(colors)
-        self.color_name = choice["name"]
-        self.hex_code = choice["hex"]
-        
-        # Generate color image using Pillow
-        img = Image.new('RGB', (200, 200), color=self.hex_code)
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='PNG')
-        img_byte_arr.seek(0)
-        file = discord.File(img_byte_arr, filename="color.png")
+        # The color swatch is rendered ahead of time by the puzzle pool
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("guessthecolor")
+        self.color_name = puzzle.display
+        self.hex_code = puzzle.data["hex"]
+        file = discord.File(io.BytesIO(puzzle.image), filename="color.png")
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Guess The Color",
-            "What is the name of this color?",
+            "What is the name of this color? Any color name counts, the closer the better!",
             discord.Color(int(self.hex_code.replace("#", "0x"), 16))
         )
         embed.set_image(url="attachment://color.png")
         
-        await self.channel.send(file=file, embed=embed)
+        prompt = await self.channel.send(file=file, embed=embed)
         self.start_time = time.time()
         
+        palette = get_palette()
+        distances = puzzle.data["distances"]
+        win_distance = WIN_DELTA_E[puzzle.data["difficulty"]]
+
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().lower() == self.color_name.lower()
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("guessthecolor", m)
+            # Any known color name is scored by how close it is to the swatch
+            row = palette.lookup(m.content)
+            if row is None:
+                return False
+            distance = float(distances[row])
+            best = self.guesses.get(m.author.id)
+            if best is None or distance < best[0]:
+                self.guesses[m.author.id] = (distance, m)
+            return distance <= win_distance
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=10) # 10 seconds
-            elapsed = time.time() - self.start_time
+            host_elapsed = time.time() - self.start_time
+            # Order near-simultaneous answers by when Discord received them, not when we did
+            msg = await arbitrate(self.bot, msg, check)
+            elapsed = reaction_time(snowflake_ms(prompt.id), msg.id, host_elapsed)
+            self.bot.anticheat.record("guessthecolor", msg.author.id, elapsed, len(msg.content.strip()))
             
-            result_embed = EmbedFactory.success_embed(f"{msg.author.mention} guessed it in **{elapsed:.2f}s**! It's **{self.color_name}**.")
+            guess = palette.names[palette.lookup(msg.content)]
+            exact = "" if guess == self.color_name else f" (**{guess}** is close enough)"
+            result_embed = EmbedFactory.success_embed(f"{msg.author.mention} guessed it in **{elapsed:.2f}s**! It's **{self.color_name}**{exact}.{self.also_known_as(puzzle)}")
             await self.channel.send(embed=result_embed)
             await self.on_end(msg, msg.author)
         except asyncio.TimeoutError:
-            await self.channel.send(f"Time's up! The color was **{self.color_name}**.")
+            if self.guesses:
+                distance, msg = min(self.guesses.values(), key=lambda guess: guess[0])
+                self.credit = partial_credit(distance)
+                if self.credit:
+                    await self.channel.send(f"Time's up! The color was **{self.color_name}**. Closest guess: {msg.author.mention} with **{palette.names[palette.lookup(msg.content)]}** (ΔE {distance:.1f}), worth **{self.credit:g}** point.{self.also_known_as(puzzle)}")
+                    await self.on_end(msg, msg.author)
+                    return
+            await self.channel.send(f"Time's up! The color was **{self.color_name}**.{self.also_known_as(puzzle)}")
             await self.on_end(None, None)
+
+    def also_known_as(self, puzzle: Puzzle) -> str:
+        palette = get_palette()
+        close = palette.nearest(puzzle.data["distances"], 3, exclude=puzzle.data["row"])
+        return "\nClosest other names: " + ", ".join(palette.names[row] for row in close)
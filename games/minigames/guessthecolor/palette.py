@@ -0,0 +1,132 @@
+"""Named colors for Guess The Color, held as a NumPy array in CIELAB space.
+
+data/colors.json lists about a thousand names from the CSS, X11 and xkcd color survey sets,
+each with a level: easy names are the ones everybody knows (at least ΔE 10 apart, so an easy
+swatch has one obvious name), hard ones come from the survey.
+Any of them is a valid guess. A guess scores by how far its color is from the target
+(CIEDE2000 ΔE, where about 1 is the smallest difference people notice), so "Scarlet" for a
+red swatch still scores.
+"""
+import json
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from core.matching import AnswerIndex
+from games.minigames.corpus import ShuffleBag
+
+COLORS_PATH = "data/colors.json"
+LEVELS = ("easy", "normal", "hard")
+
+# D65 white point and the sRGB -> XYZ matrix
+WHITE = np.array([0.95047, 1.0, 1.08883], dtype=np.float32)
+RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041]
+], dtype=np.float32)
+
+def hex_to_rgb(code: str) -> Tuple[int, int, int]:
+    value = int(code.lstrip("#"), 16)
+    return value >> 16, (value >> 8) & 0xFF, value & 0xFF
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Converts an (..., 3) array of 0-255 sRGB values to CIELAB."""
+    c = np.asarray(rgb, dtype=np.float32) / 255
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ RGB_TO_XYZ.T / WHITE
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack([116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+def delta_e(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """CIEDE2000 color difference, broadcast over arrays of Lab values."""
+    L1, a1, b1 = np.moveaxis(np.asarray(lab1, dtype=np.float64), -1, 0)
+    L2, a2, b2 = np.moveaxis(np.asarray(lab2, dtype=np.float64), -1, 0)
+    c_mean7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_mean7 / (c_mean7 + 25 ** 7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    h1, h2 = np.degrees(np.arctan2(b1, a1)) % 360, np.degrees(np.arctan2(b2, a2)) % 360
+
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(c1 * c2 == 0, 0, dh)
+    dL, dC = L2 - L1, c2 - c1
+    dH = 2 * np.sqrt(c1 * c2) * np.sin(np.radians(dh / 2))
+
+    L_mean, C_mean = (L1 + L2) / 2, (c1 + c2) / 2
+    h_mean = np.where(np.abs(h1 - h2) > 180, (h1 + h2 + 360) / 2, (h1 + h2) / 2) % 360
+    h_mean = np.where(c1 * c2 == 0, h1 + h2, h_mean)
+    t = (1 - 0.17 * np.cos(np.radians(h_mean - 30)) + 0.24 * np.cos(np.radians(2 * h_mean))
+         + 0.32 * np.cos(np.radians(3 * h_mean + 6)) - 0.20 * np.cos(np.radians(4 * h_mean - 63)))
+    sl = 1 + 0.015 * (L_mean - 50) ** 2 / np.sqrt(20 + (L_mean - 50) ** 2)
+    sc = 1 + 0.045 * C_mean
+    sh = 1 + 0.015 * C_mean * t
+    rt = (-2 * np.sqrt(C_mean ** 7 / (C_mean ** 7 + 25 ** 7))
+          * np.sin(np.radians(60 * np.exp(-(((h_mean - 275) / 25) ** 2)))))
+    return np.sqrt((dL / sl) ** 2 + (dC / sc) ** 2 + (dH / sh) ** 2 + rt * (dC / sc) * (dH / sh))
+
+def spellings(name: str) -> List[str]:
+    """Gray and Grey are the same color."""
+    if "Gray" in name:
+        return [name.replace("Gray", "Grey")]
+    if "Grey" in name:
+        return [name.replace("Grey", "Gray")]
+    return []
+
+class Palette:
+    """All named colors: names, hex codes and an (N, 3) float32 Lab array sharing row numbers."""
+
+    def __init__(self, entries: Iterable[dict]):
+        entries = list(entries)
+        self.names: List[str] = [e["name"] for e in entries]
+        self.hexes: List[str] = [e["hex"] for e in entries]
+        self.lab = rgb_to_lab(np.array([hex_to_rgb(e["hex"]) for e in entries], dtype=np.uint8)).astype(np.float32)
+        self.rows: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.levels: Dict[str, np.ndarray] = {
+            level: np.array([i for i, e in enumerate(entries) if e.get("level", "hard") == level], dtype=np.int32)
+            for level in LEVELS
+        }
+        self.answers = AnswerIndex((e["name"], [*e.get("aliases", []), *spellings(e["name"])]) for e in entries)
+        # Targets come out of a shuffle bag per level, no color repeats before the level is used up
+        self.bags: Dict[str, ShuffleBag] = {level: ShuffleBag(len(rows)) for level, rows in self.levels.items() if len(rows)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def sample(self, level: str = "normal") -> int:
+        with self._lock: # puzzles are generated in worker threads
+            index = self.bags[level].draw()
+        return int(self.levels[level][index])
+
+    def lookup(self, text: str) -> Optional[int]:
+        """Row of the color a player typed, typos and aliases included."""
+        name = self.answers.match(text)
+        return None if name is None else self.rows[name]
+
+    def distances(self, lab: Sequence[float]) -> np.ndarray:
+        """ΔE from a Lab point to every named color, in one vectorized pass over the array."""
+        return delta_e(self.lab, lab).astype(np.float32)
+
+    @staticmethod
+    def nearest(distances: np.ndarray, k: int = 1, exclude: Optional[int] = None) -> List[int]:
+        """Rows of the k smallest distances, closest first."""
+        if exclude is not None:
+            distances = distances.copy()
+            distances[exclude] = np.inf
+        k = min(k, len(distances))
+        rows = np.argpartition(distances, k - 1)[:k]
+        return [int(i) for i in rows[np.argsort(distances[rows])]]
+
+_palette: Optional[Palette] = None
+_palette_lock = threading.Lock()
+
+def get_palette() -> Palette:
+    """Loads the palette once. Safe to call from puzzle worker threads."""
+    global _palette
+    if _palette is None:
+        with _palette_lock:
+            if _palette is None:
+                with open(COLORS_PATH, "r", encoding="utf-8") as f:
+                    _palette = Palette(json.load(f))
+    return _palette
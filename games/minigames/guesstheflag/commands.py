@@ -13,12 +13,15 @@ class GuessTheFlagCommands(commands.Cog):
     async def guesstheflag(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Guess The Flag...", embed=None, view=None)
-            game = GuessTheFlagGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = GuessTheFlagGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Guess The Flag", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Guess The Flag", interaction.user, [interaction.user], rules="Identify the country represented by the flag emoji.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(GuessTheFlagCommands(bot))
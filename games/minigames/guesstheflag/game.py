@@ -2,24 +2,41 @@ import discord
 import time
 import asyncio
 import random
+import json
+from functools import lru_cache
 from typing import List, Optional, Callable
 from core.storage import Storage
+from core.puzzles import Puzzle, register_generator
+from core.matching import AnswerIndex, country_index
+
+@lru_cache(maxsize=1)
+def load_flags() -> list:
+    with open("data/flags.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def flag_index() -> AnswerIndex:
+    return country_index(tuple(flag["country"] for flag in load_flags()))
+
+@register_generator("guesstheflag")
+def generate_puzzle(difficulty: str) -> Puzzle:
+    choice = random.choice(load_flags())
+    return Puzzle(choice["country"].lower(), choice["flag"], {"country": choice["country"]})
 
 class GuessTheFlagGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.country = ""
         self.flag = ""
         self.start_time = None
 
     async def start(self):
-        flags = await Storage.load_json("data/flags.json")
-        choice = random.choice(flags)
-        self.country = choice["country"]
-        self.flag = choice["flag"]
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("guesstheflag")
+        self.country = puzzle.data["country"]
+        self.flag = puzzle.display
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
@@ -30,12 +47,19 @@ class GuessTheFlagGame:
         await self.channel.send(embed=embed)
         self.start_time = time.time()
         
+        # Aliases (USA, Türkiye) and small typos count too
+        index = flag_index()
+        
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().lower() == self.country.lower()
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("guesstheflag", m)
+            return index.matches(m.content, self.country)
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=30)
             elapsed = time.time() - self.start_time
+            self.bot.anticheat.record("guesstheflag", msg.author.id, elapsed, len(msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{msg.author.mention} guessed it in **{elapsed:.2f}s**! It's **{self.country}**.")
             await self.channel.send(embed=result_embed)
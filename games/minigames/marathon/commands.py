@@ -0,0 +1,40 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from core.views import BaseLobbyView
+from core.embeds import EmbedFactory
+from .session import MarathonSession, MINIGAMES
+
+class MarathonCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="marathon", description="Play several minigame rounds in a row with one lobby.")
+    @app_commands.describe(rounds="Number of rounds to play.", game="One minigame, or a mixed rotation of all of them.", pause="Seconds between rounds.")
+    @app_commands.choices(game=[app_commands.Choice(name="Mixed rotation", value="mixed")] + [
+        app_commands.Choice(name=name, value=key) for key, (name, _) in MINIGAMES.items()
+    ])
+    async def marathon(
+        self,
+        interaction: discord.Interaction,
+        rounds: app_commands.Range[int, 1, 30] = 5,
+        game: str = "mixed",
+        pause: app_commands.Range[int, 2, 30] = 5
+    ):
+        async def start_game(inter, players):
+            await inter.response.edit_message(content="Starting Minigame Marathon...", embed=None, view=None)
+            session = MarathonSession(self.bot, players, inter.channel, rounds, game, pause)
+            await lobby.run(session.run())
+
+        title = "Minigame Marathon" if game == "mixed" else f"{MINIGAMES[game][0]} Marathon"
+        lobby = BaseLobbyView(interaction.user, title, start_game, min_players=2)
+        embed = EmbedFactory.game_lobby_embed(
+            title,
+            interaction.user,
+            [interaction.user],
+            rules=f"{rounds} rounds, {pause}s apart. Win a round to score a point, the highest score wins!"
+        )
+        await lobby.open(interaction, embed)
+
+async def setup(bot):
+    await bot.add_cog(MarathonCommands(bot))
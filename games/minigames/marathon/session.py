@@ -0,0 +1,124 @@
+import discord
+import asyncio
+import random
+from typing import List, Dict, Optional, Tuple
+from core.embeds import EmbedFactory
+from core.puzzles import Puzzle, PUZZLE_GENERATORS
+from games.minigames.fastclick.view import FastClickView
+from games.minigames.fasttype.game import FastTypeGame
+from games.minigames.textsplit.game import TextSplitGame
+from games.minigames.mergetext.game import MergeTextGame
+from games.minigames.textreverse.game import TextReverseGame
+from games.minigames.findletter.game import FindLetterGame
+from games.minigames.correctletter.game import CorrectLetterGame
+from games.minigames.guesstheflag.game import GuessTheFlagGame
+from games.minigames.guessthecolor.game import GuessTheColorGame
+from games.minigames.findemoji.game import FindEmojiGame
+from games.minigames.sortnumbers.game import SortNumbersGame
+from games.minigames.textreveal.game import TextRevealGame
+from games.guesscountry.game import GuessTheCountryGame
+
+# key -> (display name, game class). Fast Click is a view and has no puzzle.
+MINIGAMES: Dict[str, Tuple[str, Optional[type]]] = {
+    "fastclick": ("Fast Click", None),
+    "fasttype": ("Fast Type", FastTypeGame),
+    "textsplit": ("Text Split", TextSplitGame),
+    "mergetext": ("Merge Text", MergeTextGame),
+    "textreverse": ("Text Reverse", TextReverseGame),
+    "findletter": ("Find Letter", FindLetterGame),
+    "correctletter": ("Correct Letter", CorrectLetterGame),
+    "guesstheflag": ("Guess The Flag", GuessTheFlagGame),
+    "guessthecolor": ("Guess The Color", GuessTheColorGame),
+    "findemoji": ("Find The Emoji", FindEmojiGame),
+    "sortnumbers": ("Sort Numbers", SortNumbersGame),
+    "textreveal": ("Text Reveal", TextRevealGame),
+    "guesscountry": ("Guess The Country", GuessTheCountryGame)
+}
+
+class MarathonSession:
+    """Plays several minigame rounds with one lobby, preparing each round while the previous one runs."""
+
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, rounds: int, game: str = "mixed", pause: int = 5):
+        self.bot = bot
+        self.players = players
+        self.channel = channel
+        self.rounds = rounds
+        self.game = game
+        self.pause = pause
+        self.scores: Dict[int, float] = {p.id: 0 for p in players}
+
+    def build_plan(self) -> List[str]:
+        if self.game != "mixed":
+            return [self.game] * self.rounds
+        # Go through every minigame once before repeating any
+        plan = []
+        while len(plan) < self.rounds:
+            rotation = list(MINIGAMES)
+            random.shuffle(rotation)
+            plan.extend(rotation)
+        return plan[:self.rounds]
+
+    async def prefetch(self, key: str) -> Optional[Puzzle]:
+        if key not in PUZZLE_GENERATORS:
+            return None
+        _, difficulties = PUZZLE_GENERATORS[key]
+        return await self.bot.puzzle_pool.take(key, random.choice(difficulties), channel_id=self.channel.id)
+
+    async def play_round(self, key: str, puzzle: Optional[Puzzle]) -> Tuple[Optional[discord.Member], float]:
+        name, game_cls = MINIGAMES[key]
+        if game_cls is None:
+            view = FastClickView(self.players, self.on_round_end)
+            embed = EmbedFactory.create_embed(name, "Get ready... wait for the button to change!")
+            msg = await self.channel.send(embed=embed, view=view)
+            await view.start_countdown(msg)
+            await view.wait()
+            return view.winner, 1.0
+
+        winner = None
+
+        async def on_end(msg, round_winner):
+            nonlocal winner
+            winner = round_winner
+
+        game = game_cls(self.bot, self.players, self.channel, on_end, puzzle=puzzle)
+        await game.start()
+        # Some games give part of a point: Guess The Color for the closest guess on timeout,
+        # Guess The Country less the later the answer comes
+        return winner, getattr(game, "credit", 1.0)
+
+    async def on_round_end(self, interaction, winner):
+        pass
+
+    async def run(self):
+        plan = self.build_plan()
+        next_puzzle = asyncio.create_task(self.prefetch(plan[0]))
+
+        for i, key in enumerate(plan):
+            puzzle = await next_puzzle
+            if i + 1 < len(plan):
+                # Prepare the next round while this one is being played
+                next_puzzle = asyncio.create_task(self.prefetch(plan[i + 1]))
+
+            name = MINIGAMES[key][0]
+            await self.channel.send(embed=EmbedFactory.create_embed(
+                f"🏁 Marathon - Round {i + 1}/{len(plan)}",
+                f"Next up: **{name}**",
+                discord.Color.blurple()
+            ))
+            winner, credit = await self.play_round(key, puzzle)
+            if winner:
+                self.scores[winner.id] = self.scores.get(winner.id, 0) + credit
+
+            if i + 1 < len(plan):
+                await self.channel.send(embed=EmbedFactory.create_embed(
+                    "📊 Scoreboard",
+                    self.scoreboard() + f"\n\nNext round in **{self.pause}s**...",
+                    discord.Color.gold()
+                ))
+                await asyncio.sleep(self.pause)
+
+        await self.channel.send(embed=EmbedFactory.create_embed("🏆 Marathon Results", self.scoreboard(), discord.Color.gold()))
+
+    def scoreboard(self) -> str:
+        ranking = sorted(self.scores.items(), key=lambda x: x[1], reverse=True)
+        return "\n".join(f"{i + 1}. <@{pid}>: **{score:g}**" for i, (pid, score) in enumerate(ranking))
@@ -13,12 +13,15 @@ class MergeTextCommands(commands.Cog):
     async def mergetext(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Merge Text...", embed=None, view=None)
-            game = MergeTextGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = MergeTextGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Merge Text", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Merge Text", interaction.user, [interaction.user], rules="Combine the shuffled fragments into a single word.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(MergeTextCommands(bot))
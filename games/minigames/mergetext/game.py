@@ -3,41 +3,55 @@ import time
 import asyncio
 import random
 from typing import List, Optional, Callable
+from core.puzzles import Puzzle, register_generator
+from games.minigames.corpus import get_corpus
+
+@register_generator("mergetext", per_channel=True)
+def generate_puzzle(difficulty: str, channel_id: Optional[int] = None) -> Puzzle:
+    corpus = get_corpus()
+    index = corpus.draw(channel_id, difficulty, 6)
+    word = corpus.word(index)
+
+    # Split into 3 fragments, cut when the corpus is built
+    fragments = corpus.fragments(index)
+    random.shuffle(fragments)
+    return Puzzle(word, ", ".join(fragments), {"fragments": fragments})
 
 class MergeTextGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.word = ""
         self.fragments = []
         self.start_time = None
 
     async def start(self):
-        words = ["PROGRAMMING", "DEVELOPER", "CHALLENGE", "INTERACTIVE", "EXPERIENCE", "KNOWLEDGE", "REACTION"]
-        self.word = random.choice(words)
-        
-        # Split into 3 fragments
-        chunk_size = len(self.word) // 3
-        self.fragments = [self.word[:chunk_size], self.word[chunk_size:chunk_size*2], self.word[chunk_size*2:]]
-        random.shuffle(self.fragments)
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("mergetext", channel_id=self.channel.id)
+        self.word = puzzle.answer
+        self.fragments = puzzle.data["fragments"]
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Merge Text",
-            f"Merge these fragments into the correct word:\n\n**{', '.join(self.fragments)}**",
+            f"Merge these fragments into the correct word:\n\n**{puzzle.display}**",
             discord.Color.blue()
         )
         await self.channel.send(embed=embed)
         self.start_time = time.time()
         
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().upper() == self.word
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("mergetext", m)
+            return m.content.strip().upper() == self.word
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=30)
             elapsed = time.time() - self.start_time
+            self.bot.anticheat.record("mergetext", msg.author.id, elapsed, len(msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{msg.author.mention} merged it in **{elapsed:.2f}s**! The word was **{self.word}**.")
             await self.channel.send(embed=result_embed)
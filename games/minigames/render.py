@@ -0,0 +1,177 @@
+"""Renders minigame prompts to images, so they cannot be copied, stripped and pasted back.
+
+Glyphs and emoji are rasterized once into an atlas, each at a few small rotations. A prompt is
+then only pasted together from atlas tiles with some jitter and noise lines. The jitter is seeded
+from the prompt content, so the same prompt always renders the same and is served from the cache.
+"""
+import io
+import random
+import string
+import threading
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+from PIL import Image, ImageDraw, ImageFont
+from games.minigames.confusables import FONT_NAMES
+
+CELL = 40
+PAD = 16
+JITTER = 3
+ANGLES = (-10, -5, 0, 5, 10)
+BACKGROUND = (47, 49, 54)
+TEXT_COLORS = [(235, 235, 235), (220, 221, 222), (242, 243, 245)]
+NOISE_COLOR = (90, 92, 100)
+EMOJI_FONTS = ["NotoColorEmoji.ttf", "seguiemj.ttf", "AppleColorEmoji.ttc"]
+
+# Faces drawn by hand when no emoji font is installed: emoji -> (eyes, mouth)
+FACES = {
+    "😀": ("dot", "grin"),
+    "😃": ("tall", "grin"),
+    "😄": ("arc", "grin"),
+    "😁": ("arc", "teeth"),
+    "🙂": ("dot", "smile"),
+    "😊": ("arc", "smile"),
+    "😐": ("dot", "flat"),
+    "😮": ("dot", "open"),
+    "😯": ("tall", "open"),
+    "😶": ("dot", None)
+}
+FACE_YELLOW = (255, 204, 77)
+FACE_DARK = (102, 69, 0)
+
+def _load_emoji_font() -> Optional[ImageFont.FreeTypeFont]:
+    for name in EMOJI_FONTS:
+        try:
+            # Color emoji fonts only ship bitmaps at this size
+            return ImageFont.truetype(name, 109)
+        except OSError:
+            continue
+    return None
+
+def _draw_face(eyes: str, mouth: Optional[str]) -> Image.Image:
+    # Drawn at 4x and scaled down for smooth edges
+    size = CELL * 4
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse([8, 8, size - 8, size - 8], fill=FACE_YELLOW)
+    for x in (size * 0.36, size * 0.64):
+        if eyes == "dot":
+            draw.ellipse([x - 9, size * 0.36 - 9, x + 9, size * 0.36 + 9], fill=FACE_DARK)
+        elif eyes == "tall":
+            draw.ellipse([x - 8, size * 0.28, x + 8, size * 0.46], fill=FACE_DARK)
+        else:
+            draw.arc([x - 14, size * 0.32, x + 14, size * 0.44], 180, 360, fill=FACE_DARK, width=7)
+    if mouth == "grin":
+        draw.chord([size * 0.26, size * 0.45, size * 0.74, size * 0.8], 0, 180, fill=FACE_DARK)
+    elif mouth == "teeth":
+        draw.chord([size * 0.26, size * 0.45, size * 0.74, size * 0.8], 0, 180, fill=FACE_DARK)
+        draw.rectangle([size * 0.3, size * 0.62, size * 0.7, size * 0.68], fill=(255, 255, 255))
+    elif mouth == "smile":
+        draw.arc([size * 0.3, size * 0.45, size * 0.7, size * 0.75], 20, 160, fill=FACE_DARK, width=8)
+    elif mouth == "flat":
+        draw.line([size * 0.34, size * 0.68, size * 0.66, size * 0.68], fill=FACE_DARK, width=8)
+    elif mouth == "open":
+        draw.ellipse([size * 0.42, size * 0.58, size * 0.58, size * 0.78], fill=FACE_DARK)
+    return img.resize((CELL, CELL), Image.LANCZOS)
+
+class GlyphAtlas:
+    """Pre-rasterized glyph masks and emoji tiles, each at every angle in ANGLES."""
+
+    def __init__(self):
+        self.font = self._load_font()
+        self.emoji_font = _load_emoji_font()
+        self.glyphs: Dict[str, List[Image.Image]] = {}
+        self.emoji: Dict[str, List[Image.Image]] = {}
+        self._lock = threading.Lock()
+        for char in string.ascii_letters + string.digits + string.punctuation:
+            self.glyph(char)
+        for emoji in FACES:
+            self.emoji_tile(emoji)
+
+    @staticmethod
+    def _load_font() -> ImageFont.ImageFont:
+        for name in FONT_NAMES:
+            try:
+                return ImageFont.truetype(name, CELL * 3 // 4)
+            except OSError:
+                continue
+        return ImageFont.load_default(size=CELL * 3 // 4)
+
+    @staticmethod
+    def _rotations(img: Image.Image) -> List[Image.Image]:
+        return [img.rotate(angle, resample=Image.BICUBIC) for angle in ANGLES]
+
+    def glyph(self, char: str) -> List[Image.Image]:
+        variants = self.glyphs.get(char)
+        if variants is None:
+            # Characters outside the prebuilt set (confusables) are added on first use
+            mask = Image.new("L", (CELL, CELL), 0)
+            ImageDraw.Draw(mask).text((CELL // 2, CELL // 2), char, fill=255, font=self.font, anchor="mm")
+            variants = self._rotations(mask)
+            with self._lock:
+                self.glyphs[char] = variants
+        return variants
+
+    def emoji_tile(self, emoji: str) -> List[Image.Image]:
+        variants = self.emoji.get(emoji)
+        if variants is None:
+            if self.emoji_font:
+                tile = Image.new("RGBA", (136, 128), (0, 0, 0, 0))
+                ImageDraw.Draw(tile).text((0, 0), emoji, font=self.emoji_font, embedded_color=True)
+                tile = tile.resize((CELL, CELL), Image.LANCZOS)
+            else:
+                eyes, mouth = FACES.get(emoji, ("dot", None))
+                tile = _draw_face(eyes, mouth)
+            variants = self._rotations(tile)
+            with self._lock:
+                self.emoji[emoji] = variants
+        return variants
+
+_atlas: Optional[GlyphAtlas] = None
+_atlas_lock = threading.Lock()
+
+def get_atlas() -> GlyphAtlas:
+    """Builds the atlas once. Called from the puzzle pool's worker threads, never the event loop."""
+    global _atlas
+    if _atlas is None:
+        with _atlas_lock:
+            if _atlas is None:
+                _atlas = GlyphAtlas()
+    return _atlas
+
+def _compose(cells: Sequence[str], cols: int, emoji: bool) -> bytes:
+    atlas = get_atlas()
+    rng = random.Random(zlib.crc32("\x00".join(cells).encode()))
+    rows = (len(cells) + cols - 1) // cols
+    width, height = PAD * 2 + CELL * min(cols, len(cells)), PAD * 2 + CELL * rows
+    img = Image.new("RGB", (width, height), BACKGROUND)
+
+    for i, char in enumerate(cells):
+        row, col = divmod(i, cols)
+        x = PAD + col * CELL + rng.randint(-JITTER, JITTER)
+        y = PAD + row * CELL + rng.randint(-JITTER, JITTER)
+        if emoji:
+            tile = rng.choice(atlas.emoji_tile(char))
+            img.paste(tile, (x, y), tile)
+        else:
+            mask = rng.choice(atlas.glyph(char))
+            img.paste(rng.choice(TEXT_COLORS), (x, y, x + CELL, y + CELL), mask)
+
+    # A few faint lines across the prompt to throw off text recognition
+    draw = ImageDraw.Draw(img)
+    for _ in range(2 + len(cells) // 10):
+        draw.line([(rng.randint(0, width), rng.randint(0, height)), (rng.randint(0, width), rng.randint(0, height))], fill=NOISE_COLOR, width=1)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+@lru_cache(maxsize=512)
+def render_text(text: str) -> bytes:
+    """Renders a single line of text to PNG bytes."""
+    return _compose(tuple(text), len(text), emoji=False)
+
+@lru_cache(maxsize=512)
+def render_grid(cells: Tuple[str, ...], cols: int, emoji: bool = False) -> bytes:
+    """Renders characters or emoji in a grid, row by row, to PNG bytes."""
+    return _compose(cells, cols, emoji)
@@ -13,12 +13,15 @@ class SortNumbersCommands(commands.Cog):
     async def sortnumbers(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Sort Numbers...", embed=None, view=None)
-            game = SortNumbersGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = SortNumbersGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Sort Numbers", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Sort Numbers", interaction.user, [interaction.user], rules="Sort the given numbers from smallest to largest, separated by commas.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(SortNumbersCommands(bot))
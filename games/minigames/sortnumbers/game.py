@@ -2,52 +2,68 @@ import discord
 import time
 import asyncio
 import random
+import io
 from typing import List, Optional, Callable
+from core.puzzles import Puzzle, register_generator
+from games.minigames.render import render_grid
+
+@register_generator("sortnumbers", ("easy", "hard"))
+def generate_puzzle(difficulty: str) -> Puzzle:
+    count = 20 if difficulty == "hard" else 5
+    numbers = [random.randint(0, 9) for _ in range(count)]
+    ordered = sorted(numbers)
+
+    shuffled = numbers.copy()
+    random.shuffle(shuffled)
+
+    # Anti-copy: the shuffled numbers are only shown as an image
+    image = render_grid(tuple(map(str, shuffled)), 10)
+    return Puzzle(", ".join(map(str, ordered)), " ".join(map(str, shuffled)), {"numbers": numbers, "sorted": ordered}, image)
 
 class SortNumbersGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.numbers = []
         self.sorted_numbers_str = ""
         self.start_time = None
 
     async def start(self):
         # difficulty randomly 5 or 20
-        count = random.choice([5, 20])
-        self.numbers = [random.randint(0, 9) for _ in range(count)]
-        self.sorted_numbers_str = ", ".join(map(str, sorted(self.numbers)))
-        
-        shuffled = self.numbers.copy()
-        random.shuffle(shuffled)
-        
-        # Apply anti-copy (ZWSP) to the shuffled list for display
-        display_shuffled = "\u200B".join(map(str, shuffled))
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("sortnumbers", random.choice(["easy", "hard"]))
+        self.numbers = puzzle.data["numbers"]
+        self.sorted_numbers_str = puzzle.answer
+        ordered = puzzle.data["sorted"]
+        file = discord.File(io.BytesIO(puzzle.image), filename="prompt.png")
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "Sort Numbers",
-            f"Sort these single-digit numbers from smallest to largest. Separate with commas!\n\n**{display_shuffled}**",
+            "Sort these single-digit numbers from smallest to largest. Separate with commas!",
             discord.Color.blue()
         )
-        await self.channel.send(embed=embed)
+        embed.set_image(url="attachment://prompt.png")
+        await self.channel.send(file=file, embed=embed)
         self.start_time = time.time()
         
         def check(m):
             if m.channel != self.channel or m.author not in self.players:
                 return False
+            self.bot.anticheat.inspect("sortnumbers", m)
             try:
                 # User types numbers separated by commas
                 user_numbers = [int(n.strip()) for n in m.content.split(",")]
-                return user_numbers == sorted(self.numbers)
+                return user_numbers == ordered
             except:
                 return False
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=10) # 10 seconds
             elapsed = time.time() - self.start_time
+            self.bot.anticheat.record("sortnumbers", msg.author.id, elapsed, len(msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{msg.author.mention} sorted them in **{elapsed:.2f}s**! Correct order: **{self.sorted_numbers_str}**.")
             await self.channel.send(embed=result_embed)
@@ -13,12 +13,15 @@ class TextRevealCommands(commands.Cog):
     async def textreveal(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Text Reveal...", embed=None, view=None)
-            game = TextRevealGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = TextRevealGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Text Reveal", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Text Reveal", interaction.user, [interaction.user], rules="Guess the word as its letters are slowly revealed.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(TextRevealCommands(bot))
@@ -3,21 +3,32 @@ import time
 import asyncio
 import random
 from typing import List, Optional, Callable
+from core.puzzles import Puzzle, register_generator
+from games.minigames.corpus import get_corpus
+
+@register_generator("textreveal", per_channel=True)
+def generate_puzzle(difficulty: str, channel_id: Optional[int] = None) -> Puzzle:
+    corpus = get_corpus()
+    word = corpus.word(corpus.draw(channel_id, difficulty, 6))
+    order = list(range(len(word)))
+    random.shuffle(order)
+    return Puzzle(word, " ".join("\\_" for _ in word), {"order": order})
 
 class TextRevealGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.word = ""
         self.revealed = []
         self.start_time = None
         self.game_over = False
 
     async def start(self):
-        words = ["PROGRAMMING", "DISCORD", "PYTHON", "DEVELOPER", "INTERFACE", "REACTION", "CHALLENGE"]
-        self.word = random.choice(words)
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("textreveal", channel_id=self.channel.id)
+        self.word = puzzle.answer
         self.revealed = ["\_" for _ in self.word]
         
         from core.embeds import EmbedFactory
@@ -30,9 +41,7 @@ class TextRevealGame:
         self.start_time = time.time()
         
         async def reveal_loop():
-            indices = list(range(len(self.word)))
-            random.shuffle(indices)
-            for idx in indices:
+            for idx in puzzle.data["order"]:
                 if self.game_over:
                     break
                 await asyncio.sleep(3)
@@ -47,12 +56,16 @@ class TextRevealGame:
         reveal_task = asyncio.create_task(reveal_loop())
 
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().upper() == self.word
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("textreveal", m)
+            return m.content.strip().upper() == self.word
 
         try:
             guess_msg = await self.bot.wait_for('message', check=check, timeout=60)
             self.game_over = True
             elapsed = time.time() - self.start_time
+            self.bot.anticheat.record("textreveal", guess_msg.author.id, elapsed, len(guess_msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{guess_msg.author.mention} guessed it in **{elapsed:.2f}s**! The word was **{self.word}**.")
             await self.channel.send(embed=result_embed)
@@ -13,12 +13,15 @@ class TextReverseCommands(commands.Cog):
     async def textreverse(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Text Reverse...", embed=None, view=None)
-            game = TextReverseGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = TextReverseGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Text Reverse", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Text Reverse", interaction.user, [interaction.user], rules="Reverse the shuffled word correctly.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(TextReverseCommands(bot))
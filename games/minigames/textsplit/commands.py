@@ -13,12 +13,15 @@ class TextSplitCommands(commands.Cog):
     async def textsplit(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             await inter.response.edit_message(content="Starting Text Split...", embed=None, view=None)
-            game = TextSplitGame(self.bot, players, inter.channel, lambda m, w: None)
-            await game.start()
+            async def on_end(msg, winner):
+                await lobby.finish()
+
+            game = TextSplitGame(self.bot, players, inter.channel, on_end)
+            await lobby.run(game.start())
 
         lobby = BaseLobbyView(interaction.user, "Text Split", start_game, min_players=2)
         embed = EmbedFactory.game_lobby_embed("Text Split", interaction.user, [interaction.user], rules="Reconstruct the word from split parts.")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(TextSplitCommands(bot))
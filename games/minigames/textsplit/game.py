@@ -4,24 +4,33 @@ import asyncio
 import random
 from typing import List, Optional, Callable
 from core.storage import Storage
+from core.puzzles import Puzzle, register_generator
+from games.minigames.corpus import get_corpus
+
+@register_generator("textsplit", per_channel=True)
+def generate_puzzle(difficulty: str, channel_id: Optional[int] = None) -> Puzzle:
+    corpus = get_corpus()
+    index = corpus.draw(channel_id, difficulty, 5)
+
+    # Split points are worked out when the corpus is built
+    left, right = corpus.split(index)
+    return Puzzle(left + right, left + " " + right)
 
 class TextSplitGame:
-    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable):
+    def __init__(self, bot, players: List[discord.Member], channel: discord.TextChannel, on_end: Callable, puzzle: Optional[Puzzle] = None):
         self.bot = bot
         self.players = players
         self.channel = channel
         self.on_end = on_end
+        self.puzzle = puzzle # prepared ahead of time by a session, taken from the pool otherwise
         self.word = ""
         self.split_word = ""
         self.start_time = None
 
     async def start(self):
-        words = ["HELLO", "WORLD", "DISCORD", "PYTHON", "GAMING", "SERVER", "MINIGAME", "CHALLENGE"]
-        self.word = random.choice(words)
-        
-        # Split word randomly
-        split_idx = random.randint(1, len(self.word) - 1)
-        self.split_word = self.word[:split_idx] + " " + self.word[split_idx:]
+        puzzle = self.puzzle or await self.bot.puzzle_pool.take("textsplit", channel_id=self.channel.id)
+        self.word = puzzle.answer
+        self.split_word = puzzle.display
         
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
@@ -33,11 +42,15 @@ class TextSplitGame:
         self.start_time = time.time()
         
         def check(m):
-            return m.channel == self.channel and m.author in self.players and m.content.strip().upper() == self.word
+            if m.channel != self.channel or m.author not in self.players:
+                return False
+            self.bot.anticheat.inspect("textsplit", m)
+            return m.content.strip().upper() == self.word
 
         try:
             msg = await self.bot.wait_for('message', check=check, timeout=30)
             elapsed = time.time() - self.start_time
+            self.bot.anticheat.record("textsplit", msg.author.id, elapsed, len(msg.content.strip()))
             
             result_embed = EmbedFactory.success_embed(f"{msg.author.mention} reconstructed it in **{elapsed:.2f}s**! The word was **{self.word}**.")
             await self.channel.send(embed=result_embed)
@@ -19,17 +19,15 @@ class ReplicaCommands(commands.Cog):
             
             await inter.response.edit_message(content="Starting Replica...", embed=None, view=None)
             
-            view = ReplicaView(prompt, players, lambda inter, winner: None)
-            embed = EmbedFactory.create_embed(
-                "Replica",
-                f"**Prompt:** {prompt}\n\nEveryone, submit your funniest answer!",
-                discord.Color.blue()
-            )
-            await inter.channel.send(embed=embed, view=view)
+            async def on_end(game_inter, winner):
+                await lobby.finish()
+
+            view = lobby.own(ReplicaView(prompt, players, on_end))
+            await view.start(inter.channel)
 
         lobby = BaseLobbyView(interaction.user, "Replica", start_game, min_players=3)
         embed = EmbedFactory.game_lobby_embed("Replica", interaction.user, [interaction.user], rules="Submit a funny answer to the prompt, then vote for the best one!")
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(ReplicaCommands(bot))
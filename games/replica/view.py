@@ -1,8 +1,70 @@
 import discord
 import asyncio
 import random
+import heapq
 from typing import List, Dict, Optional, Callable
 
+ANSWER_TIME = 90
+VOTE_TIME = 60
+ANSWERS_PER_EMBED = 15
+OPTIONS_PER_SELECT = 25 # Discord limits
+SELECTS_PER_MESSAGE = 5
+EMBEDS_PER_MESSAGE = 10
+EMBED_CHARS_PER_MESSAGE = 6000 # across all of a message's embeds
+RESULTS_SHOWN = 10
+
+def embed_batches(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Groups embeds into messages within Discord's embed count and total character limits."""
+    batches, batch, size = [], [], 0
+    for embed in embeds:
+        if batch and (len(batch) == EMBEDS_PER_MESSAGE or size + len(embed) > EMBED_CHARS_PER_MESSAGE):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(embed)
+        size += len(embed)
+    if batch:
+        batches.append(batch)
+    return batches
+
+class AnswerModal(discord.ui.Modal, title="Your Answer"):
+    answer = discord.ui.TextInput(label="Answer", placeholder="Type your funny answer here...", max_length=100)
+    
+    def __init__(self, parent: "ReplicaView"):
+        super().__init__()
+        self.parent = parent
+
+    async def on_submit(self, inter: discord.Interaction):
+        if self.parent.state != "answering":
+            return await inter.response.send_message("Answering time is over!", ephemeral=True)
+        self.parent.answers[inter.user.id] = self.answer.value
+        await inter.response.send_message("Answer submitted! ✅", ephemeral=True)
+        
+        if len(self.parent.answers) == len(self.parent.players):
+            await self.parent.start_voting()
+
+class BallotView(discord.ui.View):
+    """Select menus covering a slice of the numbered answers."""
+
+    def __init__(self, game: "ReplicaView", start: int, end: int):
+        super().__init__(timeout=VOTE_TIME + 30)
+        self.game = game
+        for first in range(start, end, OPTIONS_PER_SELECT):
+            last = min(first + OPTIONS_PER_SELECT, end)
+            select = discord.ui.Select(
+                placeholder=f"Vote for answer #{first + 1} - #{last}",
+                options=[
+                    discord.SelectOption(label=f"#{i + 1}", value=str(i), description=game.answers[game.ballot[i]][:100])
+                    for i in range(first, last)
+                ]
+            )
+            select.callback = self.make_vote_callback(select)
+            self.add_item(select)
+
+    def make_vote_callback(self, select: discord.ui.Select):
+        async def callback(interaction: discord.Interaction):
+            await self.game.vote(interaction, int(select.values[0]))
+        return callback
+
 class ReplicaView(discord.ui.View):
     def __init__(self, prompt: str, players: List[discord.Member], on_end: Callable):
         super().__init__(timeout=600)
@@ -11,7 +73,34 @@ class ReplicaView(discord.ui.View):
         self.on_end = on_end
         self.answers: Dict[int, str] = {}
         self.votes: Dict[int, int] = {} # voter -> player_id (who wrote the answer)
-        self.state = "answering" # answering, voting
+        self.tally: Dict[int, int] = {} # player_id -> votes received
+        self.leader: Optional[int] = None
+        self.ballot: List[int] = [] # answer number - 1 -> player_id
+        self.channel: Optional[discord.TextChannel] = None
+        self.deadline_task: Optional[asyncio.Task] = None
+        self.lifecycle = None # set when the game owns the view, its timers go through it
+        self.state = "answering" # answering, voting, ended
+
+    async def start(self, channel: discord.TextChannel):
+        from core.embeds import EmbedFactory
+        self.channel = channel
+        embed = EmbedFactory.create_embed(
+            "Replica",
+            f"**Prompt:** {self.prompt}\n\nEveryone, submit your funniest answer! You have {ANSWER_TIME} seconds.",
+            discord.Color.blue()
+        )
+        self.message = await channel.send(embed=embed, view=self)
+        self.deadline_task = self.lifecycle.spawn(self.deadline(ANSWER_TIME, self.start_voting))
+
+    async def deadline(self, seconds: int, action: Callable):
+        await asyncio.sleep(seconds)
+        self.deadline_task = None
+        await action()
+
+    def cancel_deadline(self):
+        if self.deadline_task and self.deadline_task is not asyncio.current_task():
+            self.deadline_task.cancel()
+        self.deadline_task = None
 
     @discord.ui.button(label="Submit Answer", style=discord.ButtonStyle.primary)
     async def submit_answer(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -21,74 +110,90 @@ class ReplicaView(discord.ui.View):
         if self.state != "answering":
             return await interaction.response.send_message("Answering time is over!", ephemeral=True)
 
-        class AnswerModal(discord.ui.Modal, title="Your Answer"):
-            answer = discord.ui.TextInput(label="Answer", placeholder="Type your funny answer here...", max_length=100)
-            
-            def __init__(self, parent):
-                super().__init__()
-                self.parent = parent
-
-            async def on_submit(self, inter: discord.Interaction):
-                self.parent.answers[inter.user.id] = self.answer.value
-                await inter.response.send_message("Answer submitted! ✅", ephemeral=True)
-                
-                if len(self.parent.answers) == len(self.parent.players):
-                    await self.parent.start_voting(interaction.channel)
-
         await interaction.response.send_modal(AnswerModal(self))
 
-    async def start_voting(self, channel: discord.TextChannel):
+    async def start_voting(self):
+        if self.state != "answering":
+            return
         self.state = "voting"
+        self.cancel_deadline()
         self.children[0].disabled = True
+        self.stop()
+        await self.message.edit(view=self)
         
         from core.embeds import EmbedFactory
-        embed = EmbedFactory.create_embed(
-            "Replica - Voting",
-            f"**Prompt:** {self.prompt}\n\nVote for the funniest answer!",
-            discord.Color.blue()
-        )
+        if len(self.answers) < 2:
+            self.state = "ended"
+            await self.channel.send(embed=EmbedFactory.error_embed("Not enough answers were submitted to vote. Game over!"))
+            return await self.on_end(None, None)
         
-        view = discord.ui.View()
         # Shuffle answers
-        ans_list = list(self.answers.items())
-        random.shuffle(ans_list)
+        self.ballot = list(self.answers)
+        random.shuffle(self.ballot)
+        self.tally = {pid: 0 for pid in self.ballot}
         
-        for uid, ans in ans_list:
-            btn = discord.ui.Button(label=ans, style=discord.ButtonStyle.secondary)
-            btn.callback = self.make_vote_callback(uid)
-            view.add_item(btn)
-            
-        await channel.send(embed=embed, view=view)
+        # Answers are listed in numbered pages, the ballot selects only carry the numbers
+        embeds = []
+        for first in range(0, len(self.ballot), ANSWERS_PER_EMBED):
+            lines = [f"**#{i + 1}** {self.answers[self.ballot[i]]}" for i in range(first, min(first + ANSWERS_PER_EMBED, len(self.ballot)))]
+            title = "Replica - Voting" if not first else "Replica - Voting (continued)"
+            header = f"**Prompt:** {self.prompt}\n\n" if not first else ""
+            embeds.append(EmbedFactory.create_embed(title, header + "\n".join(lines), discord.Color.blue()))
+        embeds[-1].set_footer(text=f"Vote for the funniest answer! Voting closes in {VOTE_TIME} seconds.")
+        for batch in embed_batches(embeds):
+            await self.channel.send(embeds=batch)
+        
+        per_message = OPTIONS_PER_SELECT * SELECTS_PER_MESSAGE
+        for first in range(0, len(self.ballot), per_message):
+            # The ballots outlive the vote deadline a little, their timeout must not end the game
+            ballot = self.lifecycle.own_view(BallotView(self, first, min(first + per_message, len(self.ballot))), expires=False)
+            await self.channel.send(view=ballot)
+        
+        self.deadline_task = self.lifecycle.spawn(self.deadline(VOTE_TIME, self.show_results))
 
-    def make_vote_callback(self, player_id: int):
-        async def callback(interaction: discord.Interaction):
-            if interaction.user.id in self.votes:
-                return await interaction.response.send_message("You already voted!", ephemeral=True)
-            
-            if interaction.user.id == player_id:
-                return await interaction.response.send_message("You can't vote for your own answer!", ephemeral=True)
-            
-            self.votes[interaction.user.id] = player_id
-            await interaction.response.send_message("Vote recorded! ✅", ephemeral=True)
-            
-            if len(self.votes) == len(self.players):
-                await self.show_results(interaction.channel)
+    async def vote(self, interaction: discord.Interaction, number: int):
+        # A /stop ends the game without moving the view out of the voting state
+        if self.state != "voting" or self.lifecycle.ended:
+            return await interaction.response.send_message("Voting is over!", ephemeral=True)
         
-        return callback
+        if interaction.user not in self.players:
+            return await interaction.response.send_message("You are not in the game!", ephemeral=True)
+        
+        if interaction.user.id in self.votes:
+            return await interaction.response.send_message("You already voted!", ephemeral=True)
+        
+        player_id = self.ballot[number]
+        if interaction.user.id == player_id:
+            return await interaction.response.send_message("You can't vote for your own answer!", ephemeral=True)
+        
+        self.votes[interaction.user.id] = player_id
+        # Votes are final, so the running leader only changes when someone overtakes it
+        self.tally[player_id] += 1
+        if self.leader is None or self.tally[player_id] > self.tally[self.leader]:
+            self.leader = player_id
+        await interaction.response.send_message(f"Vote for answer **#{number + 1}** recorded! ✅", ephemeral=True)
+        
+        if len(self.votes) == len(self.players):
+            await self.show_results()
 
-    async def show_results(self, channel: discord.TextChannel):
-        scores = {pid: 0 for pid in self.answers.keys()}
-        for voter_id, voted_id in self.votes.items():
-            scores[voted_id] += 1
-            
-        results_text = f"**Prompt:** {self.prompt}\n\n"
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    async def show_results(self):
+        if self.state != "voting" or self.lifecycle.ended:
+            return
+        self.state = "ended"
+        self.cancel_deadline()
         
-        for pid, score in sorted_scores:
-            user = channel.guild.get_member(pid)
-            results_text += f"{user.mention}: {self.answers[pid]} (**{score} votes**)\n"
+        results_text = f"**Prompt:** {self.prompt}\n\n"
+        # Only the top answers are listed, whatever the lobby size
+        top = heapq.nlargest(RESULTS_SHOWN, self.tally.items(), key=lambda x: (x[1], x[0] == self.leader))
+        for pid, score in top:
+            results_text += f"<@{pid}>: {self.answers[pid]} (**{score} votes**)\n"
+        if len(self.tally) > RESULTS_SHOWN:
+            results_text += f"\n...and {len(self.tally) - RESULTS_SHOWN} more answers"
             
         from core.embeds import EmbedFactory
-        embed = EmbedFactory.create_embed("Replica Results", results_text, discord.Color.gold())
-        await channel.send(embed=embed)
-        await self.on_end(None, channel.guild.get_member(sorted_scores[0][0]))
+        embed = EmbedFactory.create_embed("Replica Results", results_text, discord.Color.gold(), footer=f"{len(self.votes)} votes cast")
+        await self.channel.send(embed=embed)
+        
+        winner_id = self.leader or top[0][0]
+        winner = next((p for p in self.players if p.id == winner_id), None)
+        await self.on_end(None, winner)
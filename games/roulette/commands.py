@@ -13,9 +13,9 @@ class RouletteCommands(commands.Cog):
     async def roulette(self, interaction: discord.Interaction):
         async def start_game(inter, players):
             async def on_end(game_inter, results):
-                pass
+                await lobby.finish()
 
-            view = RouletteView(interaction.user, players, on_end)
+            view = lobby.own(RouletteView(interaction.user, players, on_end))
             embed = EmbedFactory.create_embed("Roulette", "Place your bets! The host will spin the wheel when ready.")
             await inter.response.edit_message(embed=embed, view=view)
 
@@ -31,7 +31,7 @@ class RouletteCommands(commands.Cog):
             [interaction.user],
             rules="Classic Casino Roulette. Bet on Red/Black, Even/Odd, or specific numbers. Everyone starts with 1000 credits."
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(RouletteCommands(bot))
@@ -0,0 +1,96 @@
+import array
+from typing import Iterable, Optional
+from core.state import NO_SEAT, Seats, read_counted, write_array
+
+START_CREDITS = 1000
+RED_NUMBERS = frozenset((1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36))
+
+# Bet kinds 0-36 are single numbers, the outside bets follow
+RED, BLACK, EVEN, ODD = 37, 38, 39, 40
+OUTSIDE = {"Red": RED, "Black": BLACK, "Even": EVEN, "Odd": ODD}
+KIND_NAMES = {kind: name for name, kind in OUTSIDE.items()}
+
+def bet_kind(text: str) -> Optional[int]:
+    """The kind for what a player typed (Red, black, 17), None if it is not a bet."""
+    text = text.strip().capitalize()
+    if text in OUTSIDE:
+        return OUTSIDE[text]
+    if text.isdigit() and 0 <= int(text) <= 36:
+        return int(text)
+    return None
+
+def kind_name(kind: int) -> str:
+    return KIND_NAMES.get(kind, str(kind))
+
+def color_of(result: int) -> str:
+    return "Green" if result == 0 else "Red" if result in RED_NUMBERS else "Black"
+
+def payout(kind: int, amount: int, result: int) -> int:
+    if kind < RED:
+        return amount * 36 if kind == result else 0
+    if result == 0:
+        return 0
+    if kind == RED:
+        won = result in RED_NUMBERS
+    elif kind == BLACK:
+        won = result not in RED_NUMBERS
+    else:
+        won = result % 2 == (0 if kind == EVEN else 1)
+    return amount * 2 if won else 0
+
+class RouletteState:
+    """Credits per seat and the open bets as three parallel arrays: seat, kind and amount."""
+    __slots__ = ("seats", "credits", "bet_seats", "bet_kinds", "bet_amounts")
+
+    def __init__(self, player_ids: Iterable[int] = ()):
+        self.seats = Seats(player_ids)
+        self.credits = array.array("i", [START_CREDITS]) * len(self.seats)
+        self.clear_bets()
+
+    def clear_bets(self):
+        self.bet_seats = array.array("H")
+        self.bet_kinds = array.array("B")
+        self.bet_amounts = array.array("I")
+
+    def balance(self, user_id: int) -> int:
+        seat = self.seats.seat(user_id)
+        return 0 if seat == NO_SEAT else self.credits[seat]
+
+    def place(self, user_id: int, kind, amount: int):
+        """Takes the stake from the player's credits. kind may be the typed text."""
+        if isinstance(kind, str):
+            kind = bet_kind(kind)
+        seat = self.seats.seat(user_id)
+        self.bet_seats.append(seat)
+        self.bet_kinds.append(kind)
+        self.bet_amounts.append(amount)
+        self.credits[seat] -= amount
+
+    def settle(self, result: int) -> array.array:
+        """Pays out every bet on a spin and returns what each seat won. The bets are cleared."""
+        won = array.array("i", [0]) * len(self.seats)
+        for seat, kind, amount in zip(self.bet_seats, self.bet_kinds, self.bet_amounts):
+            won[seat] += payout(kind, amount, result)
+        for seat, amount in enumerate(won):
+            self.credits[seat] += amount
+        self.clear_bets()
+        return won
+
+    def to_bytes(self) -> bytes:
+        return b"".join((
+            self.seats.to_bytes(),
+            write_array(self.credits),
+            write_array(self.bet_seats),
+            write_array(self.bet_kinds),
+            write_array(self.bet_amounts)
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RouletteState":
+        state = cls()
+        state.seats, offset = Seats.read(data)
+        state.credits, offset = read_counted("i", data, offset)
+        state.bet_seats, offset = read_counted("H", data, offset)
+        state.bet_kinds, offset = read_counted("B", data, offset)
+        state.bet_amounts, _ = read_counted("I", data, offset)
+        return state
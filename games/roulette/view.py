@@ -1,7 +1,8 @@
 import discord
 import random
 import asyncio
-from typing import List, Dict, Optional, Callable
+from typing import List, Optional, Callable
+from .state import RouletteState, bet_kind, color_of, kind_name
 
 class RouletteView(discord.ui.View):
     def __init__(self, host: discord.Member, players: List[discord.Member], on_end: Callable):
@@ -9,10 +10,13 @@ class RouletteView(discord.ui.View):
         self.host = host
         self.players = players
         self.on_end = on_end
-        self.bets: Dict[int, List[dict]] = {p.id: [] for p in players}
-        self.player_credits: Dict[int, int] = {p.id: 1000 for p in players}
+        self.table = RouletteState(p.id for p in players) # credits and open bets
         self.state = "betting" # betting, spinning, results
 
+    async def on_timeout(self):
+        # Roulette has no last round, the table closes once nobody has played for a while
+        await self.on_end(None, self.table)
+
     @discord.ui.button(label="Place Bet 💰", style=discord.ButtonStyle.primary)
     async def place_bet(self, interaction: discord.Interaction, button: discord.ui.Button):
         if interaction.user not in self.players:
@@ -33,25 +37,20 @@ class RouletteView(discord.ui.View):
                 self.parent = parent
 
             async def on_submit(self, inter: discord.Interaction):
+                table = self.parent.table
                 try:
                     amt = int(self.amount.value)
-                    if amt < 10 or amt > self.parent.player_credits[inter.user.id]:
-                        return await inter.response.send_message(f"Invalid amount! You have {self.parent.player_credits[inter.user.id]} credits.", ephemeral=True)
+                    if amt < 10 or amt > table.balance(inter.user.id):
+                        return await inter.response.send_message(f"Invalid amount! You have {table.balance(inter.user.id)} credits.", ephemeral=True)
                 except ValueError:
                     return await inter.response.send_message("Please enter a valid number for amount.", ephemeral=True)
                 
-                type_val = self.bet_type.value.strip().capitalize()
-                valid_types = ["Red", "Black", "Even", "Odd"]
-                if type_val not in valid_types:
-                    try:
-                        num = int(type_val)
-                        if num < 0 or num > 36: raise ValueError
-                    except ValueError:
-                        return await inter.response.send_message("Invalid type! Use Red, Black, Even, Odd, or 0-36.", ephemeral=True)
+                kind = bet_kind(self.bet_type.value)
+                if kind is None:
+                    return await inter.response.send_message("Invalid type! Use Red, Black, Even, Odd, or 0-36.", ephemeral=True)
                 
-                self.parent.bets[inter.user.id].append({"amount": amt, "type": type_val})
-                self.parent.player_credits[inter.user.id] -= amt
-                await inter.response.send_message(f"✅ Bet of **{amt}** on **{type_val}** placed! Remaining: {self.parent.player_credits[inter.user.id]}", ephemeral=True)
+                table.place(inter.user.id, kind, amt)
+                await inter.response.send_message(f"✅ Bet of **{amt}** on **{kind_name(kind)}** placed! Remaining: {table.balance(inter.user.id)}", ephemeral=True)
 
         await interaction.response.send_modal(BetModal(self))
 
@@ -69,35 +68,15 @@ class RouletteView(discord.ui.View):
         await asyncio.sleep(4)
         
         result = random.randint(0, 36)
-        red_nums = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
-        color = "Green" if result == 0 else "Red" if result in red_nums else "Black"
-        
-        await self.process_winners(interaction, result, color)
+        await self.process_winners(interaction, result, color_of(result))
 
     async def process_winners(self, interaction, result, color):
         results_text = f"🎡 The wheel stops at... **{result} ({color})**!\n\n"
         
-        for pid, p_bets in self.bets.items():
-            player = interaction.guild.get_member(pid)
-            total_won = 0
-            for bet in p_bets:
-                won = False
-                payout = 0
-                if bet["type"] == color:
-                    won = True; payout = bet["amount"] * 2
-                elif bet["type"] == "Even" and result != 0 and result % 2 == 0:
-                    won = True; payout = bet["amount"] * 2
-                elif bet["type"] == "Odd" and result % 2 != 0:
-                    won = True; payout = bet["amount"] * 2
-                elif bet["type"] == str(result):
-                    won = True; payout = bet["amount"] * 36
-                
-                if won: total_won += payout
-            
-            self.player_credits[pid] += total_won
-            results_text += f"{player.mention}: Won **{total_won}** | Credits: **{self.player_credits[pid]}**\n"
+        won = self.table.settle(result)
+        for seat, pid in enumerate(self.table.seats):
+            results_text += f"<@{pid}>: Won **{won[seat]}** | Credits: **{self.table.credits[seat]}**\n"
             
-        self.bets = {p.id: [] for p in self.players}
         self.state = "betting"
         
         from core.embeds import EmbedFactory
@@ -3,20 +3,26 @@ from discord import app_commands
 from discord.ext import commands
 from core.views import BaseLobbyView
 from core.embeds import EmbedFactory
-from .view import RPSView
+from .view import RPSView, RoyaleRPSView
+
+ROYALE_MAX_PLAYERS = 500
 
 class RPSCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
     @app_commands.command(name="rps", description="Challenge someone to Rock Paper Scissors.")
-    async def rps(self, interaction: discord.Interaction):
+    @app_commands.describe(royale="Battle royale for up to 500 players, the winning move survives each round")
+    async def rps(self, interaction: discord.Interaction, royale: bool = False):
+        if royale:
+            return await self.start_royale(interaction)
+
         async def start_game(inter, players):
             p1, p2 = players[0], players[1]
             async def on_end(game_inter, winner):
-                pass
+                await lobby.finish()
 
-            view = RPSView(p1, p2, on_end)
+            view = lobby.own(RPSView(p1, p2, on_end))
             embed = EmbedFactory.create_embed("Rock Paper Scissors", "Both players, choose your move!")
             await inter.response.edit_message(embed=embed, view=view)
 
@@ -34,7 +40,32 @@ class RPSCommands(commands.Cog):
             max_players=2,
             rules="Classic Rock Paper Scissors. Simultaneously choose your move."
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
+
+    async def start_royale(self, interaction: discord.Interaction):
+        async def start_game(inter, players):
+            async def on_end(game_inter, winner):
+                await lobby.finish()
+
+            view = lobby.own(RoyaleRPSView(players, on_end))
+            await inter.response.edit_message(content="Starting Rock Paper Scissors Royale...", embed=None, view=None)
+            await lobby.run(view.run(inter.channel))
+
+        lobby = BaseLobbyView(
+            host=interaction.user,
+            game_name="Rock Paper Scissors Royale",
+            on_start=start_game,
+            min_players=2,
+            max_players=ROYALE_MAX_PLAYERS
+        )
+        embed = EmbedFactory.game_lobby_embed(
+            "Rock Paper Scissors Royale",
+            interaction.user,
+            [interaction.user],
+            max_players=ROYALE_MAX_PLAYERS,
+            rules="Everyone picks a move each round. If exactly two moves are played, only the winning move survives. Last one standing wins."
+        )
+        await lobby.open(interaction, embed)
 
 async def setup(bot):
     await bot.add_cog(RPSCommands(bot))
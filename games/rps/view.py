@@ -1,5 +1,7 @@
 import discord
-from typing import List, Dict, Optional, Callable
+import asyncio
+import time
+from typing import List, Dict, Optional, Callable, Tuple
 
 class RPSView(discord.ui.View):
     def __init__(self, p1: discord.Member, p2: discord.Member, on_end: Callable):
@@ -56,3 +58,127 @@ class RPSView(discord.ui.View):
         embed = EmbedFactory.create_embed("Rock Paper Scissors Results", desc, discord.Color.gold() if winner else discord.Color.blue())
         await interaction.channel.send(embed=embed)
         await self.on_end(interaction, winner)
+
+SYMBOLS = ("Rock", "Paper", "Scissors")
+EMOJI = ("✊", "✋", "✌️")
+BEATS = (2, 0, 1) # Rock beats Scissors, Paper beats Rock, Scissors beats Paper
+ROUND_TIME = 20 # seconds
+MAX_MENTIONS = 20 # survivors listed by name in a round summary
+
+class RoyaleRPSView(discord.ui.View):
+    """Battle royale Rock Paper Scissors for 2-500 players.
+
+    Choices go into three buckets. A round with exactly two symbols in play is won by every
+    player on the winning symbol, a single symbol is a draw. With all three in play the symbol
+    with the best head-to-head record wins, otherwise big rounds would almost never end. Either
+    way the outcome is decided from the three bucket sizes alone. Players who pick nothing are out.
+    """
+
+    def __init__(self, players: List[discord.Member], on_end: Callable):
+        super().__init__(timeout=None)
+        self.players = {p.id: p for p in players}
+        self.on_end = on_end
+        self.alive = set(self.players)
+        self.buckets = (set(), set(), set())
+        self.choices: Dict[int, int] = {} # user id -> symbol index
+        self.everyone_chose = asyncio.Event()
+        self.round_num = 0
+        self.message: Optional[discord.Message] = None
+        self.lifecycle = None # set when the session owns the view
+        for i, (symbol, emoji) in enumerate(zip(SYMBOLS, EMOJI)):
+            button = discord.ui.Button(label=f"{symbol} {emoji}", style=discord.ButtonStyle.secondary)
+            button.callback = self.make_callback(i)
+            self.add_item(button)
+
+    def make_callback(self, symbol: int):
+        async def callback(interaction: discord.Interaction):
+            await self.handle_choice(interaction, symbol)
+        return callback
+
+    async def handle_choice(self, interaction: discord.Interaction, symbol: int):
+        user_id = interaction.user.id
+        if user_id not in self.alive:
+            return await interaction.response.send_message("You are not in this round!", ephemeral=True)
+
+        previous = self.choices.get(user_id)
+        if previous is not None:
+            self.buckets[previous].discard(user_id)
+        self.buckets[symbol].add(user_id)
+        self.choices[user_id] = symbol
+        if len(self.choices) == len(self.alive):
+            self.everyone_chose.set()
+        # A single ephemeral reply is the whole acknowledgement, the shared message is never edited for it
+        await interaction.response.send_message(f"{EMOJI[symbol]} {SYMBOLS[symbol]}", ephemeral=True)
+
+    def resolve(self) -> Tuple[Optional[int], set]:
+        """Returns the winning symbol (None for a draw) and the players still in."""
+        counts = [len(bucket) for bucket in self.buckets]
+        present = [i for i in range(3) if counts[i]]
+        if len(present) == 2:
+            a, b = present
+            winner = a if BEATS[a] == b else b
+            return winner, self.buckets[winner]
+        if len(present) == 3:
+            # With every symbol in play, as if everyone played everyone: the symbol with the best
+            # record (players beaten minus players lost to) wins, a shared best record is a draw
+            records = [counts[BEATS[i]] - counts[BEATS.index(i)] for i in range(3)]
+            best = max(records)
+            if records.count(best) == 1:
+                winner = records.index(best)
+                return winner, self.buckets[winner]
+        # Nobody chose, a single symbol or a tied record: a draw for everyone who chose
+        return None, set(self.choices)
+
+    def summary(self, winner: Optional[int], survivors: set) -> str:
+        counts = " · ".join(f"{EMOJI[i]} **{len(self.buckets[i])}**" for i in range(3))
+        idle = len(self.alive) - len(self.choices)
+        if winner is None:
+            result = "Draw! Everyone who chose stays in."
+        else:
+            result = f"**{SYMBOLS[winner]}** wins! {len(self.choices) - len(survivors)} knocked out."
+        if idle:
+            result += f"\n{idle} didn't choose and {'are' if idle > 1 else 'is'} out."
+        names = ", ".join(f"<@{uid}>" for uid in list(survivors)[:MAX_MENTIONS])
+        more = f" and {len(survivors) - MAX_MENTIONS} more" if len(survivors) > MAX_MENTIONS else ""
+        return f"{counts}\n\n{result}\n\n**Remaining ({len(survivors)}):** {names}{more}"
+
+    async def run(self, channel: discord.TextChannel):
+        from core.embeds import EmbedFactory
+        ends = int(time.time()) + ROUND_TIME
+        embed = EmbedFactory.create_embed(
+            "Rock Paper Scissors Royale",
+            f"**{len(self.alive)}** players. Pick a move each round, only the winning move survives!\nRound 1 ends <t:{ends}:R>",
+            discord.Color.blurple()
+        )
+        self.message = await channel.send(embed=embed, view=self)
+
+        while len(self.alive) > 1:
+            self.round_num += 1
+            try:
+                await asyncio.wait_for(self.everyone_chose.wait(), timeout=ROUND_TIME)
+            except asyncio.TimeoutError:
+                pass
+
+            winner, survivors = self.resolve()
+            text = self.summary(winner, survivors)
+            # Knocked out players are free to join other games while the royale goes on
+            for user_id in self.alive - survivors:
+                await self.lifecycle.release(self.players[user_id])
+            self.alive = set(survivors)
+            self.buckets = (set(), set(), set())
+            self.choices = {}
+            self.everyone_chose.clear()
+
+            if len(self.alive) > 1:
+                text += f"\n\nRound {self.round_num + 1} ends <t:{int(time.time()) + ROUND_TIME}:R>"
+            # One message per round whatever the player count
+            await channel.send(embed=EmbedFactory.create_embed(f"Round {self.round_num}", text, discord.Color.gold() if winner is not None else discord.Color.blue()))
+
+        self.stop()
+        await self.message.edit(view=None)
+        champion = self.players[next(iter(self.alive))] if self.alive else None
+        if champion:
+            await channel.send(embed=EmbedFactory.success_embed(f"🏆 {champion.mention} wins the Rock Paper Scissors Royale after {self.round_num} rounds!"))
+        else:
+            await channel.send("Nobody chose a move, the royale ends without a winner.")
+        await self.on_end(None, champion)
@@ -3,29 +3,60 @@ from discord import app_commands
 from discord.ext import commands
 from core.views import BaseLobbyView
 from core.embeds import EmbedFactory
-from .view import XOView
+from .view import XOView, GridXOView, ImageXOView
+from .engine import warm_up, GridBoard, VARIANTS
 
 class XOCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_load(self):
+        # Solve the board up front so AI moves are instant
+        warm_up()
+
     @app_commands.command(name="xo", description="Play a game of Tic Tac Toe.")
-    async def xo(self, interaction: discord.Interaction):
+    @app_commands.describe(vs_ai="Play alone against the bot (3x3 only).", variant="Board size, larger boards need more marks in a row.")
+    @app_commands.choices(variant=[
+        app_commands.Choice(name=f"{name} - connect {k}", value=name) for name, (_, _, k) in VARIANTS.items()
+    ])
+    async def xo(self, interaction: discord.Interaction, vs_ai: bool = False, variant: str = "3x3"):
+        lobby = None # games against the bot have no lobby
+
+        async def on_win(game_inter, winner, board):
+            embed = EmbedFactory.success_embed(f"{winner.mention} won the game!")
+            await self.show_result(game_inter, embed, board)
+            if lobby:
+                await lobby.finish()
+            
+        async def on_draw(game_inter, board):
+            embed = EmbedFactory.info_embed("The game is a draw!")
+            await self.show_result(game_inter, embed, board)
+            if lobby:
+                await lobby.finish()
+
+        if vs_ai:
+            view = XOView(interaction.user, self.bot.user, on_win, on_draw, ai=True)
+            embed = EmbedFactory.create_embed("XO Game", f"**{interaction.user.mention} (❌) vs {self.bot.user.mention} (⭕)**\n\n**Turn:** {interaction.user.mention} (❌)")
+            return await interaction.response.send_message(embed=embed, view=view)
+
+        width, height, k = VARIANTS.get(variant, VARIANTS["3x3"])
+
         async def start_game(inter, players):
             p1, p2 = players[0], players[1]
-            
-            async def on_win(game_inter, winner, board):
-                embed = EmbedFactory.success_embed(f"{winner.mention} won the game!")
-                await game_inter.response.edit_message(embed=embed, view=None)
-                # Here we would unregister from manager
-                
-            async def on_draw(game_inter, board):
-                embed = EmbedFactory.info_embed("The game is a draw!")
-                await game_inter.response.edit_message(embed=embed, view=None)
-
-            view = XOView(p1, p2, on_win, on_draw)
-            embed = EmbedFactory.create_embed("XO Game", f"**Turn:** {p1.mention} (❌)")
-            await inter.response.edit_message(embed=embed, view=view)
+            if variant == "3x3":
+                view = lobby.own(XOView(p1, p2, on_win, on_draw))
+                embed = EmbedFactory.create_embed("XO Game", f"**Turn:** {p1.mention} (❌)")
+                return await inter.response.edit_message(embed=embed, view=view)
+
+            board = GridBoard(width, height, k)
+            if width <= 5 and height <= 5:
+                view = lobby.own(GridXOView(p1, p2, board, on_win, on_draw))
+                embed = EmbedFactory.create_embed(f"XO {variant} - Connect {k}", f"**Turn:** {p1.mention} (❌)")
+                return await inter.response.edit_message(embed=embed, view=view)
+
+            view = lobby.own(ImageXOView(p1, p2, board, on_win, on_draw))
+            board_file = await view.render()
+            await inter.response.edit_message(embed=view.status_embed(), attachments=[board_file], view=view)
 
         lobby = BaseLobbyView(
             host=interaction.user,
@@ -39,9 +70,16 @@ class XOCommands(commands.Cog):
             interaction.user,
             [interaction.user],
             max_players=2,
-            rules="3x3 board. Align 3 marks (❌ or ⭕) to win."
+            rules=f"{width}x{height} board. Align {k} marks (❌ or ⭕) to win."
         )
-        await interaction.response.send_message(embed=embed, view=lobby)
+        await lobby.open(interaction, embed)
+
+    async def show_result(self, interaction: discord.Interaction, embed: discord.Embed, board):
+        # Image boards hand over the final board as a file so it stays visible
+        if isinstance(board, discord.File):
+            embed.set_image(url=f"attachment://{board.filename}")
+            return await interaction.response.edit_message(embed=embed, attachments=[board], view=None)
+        await interaction.response.edit_message(embed=embed, view=None)
 
 async def setup(bot):
     await bot.add_cog(XOCommands(bot))
@@ -0,0 +1,237 @@
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Board cells are numbered 0-8, row by row. Each player's marks are a 9-bit integer.
+LINES = [(0,1,2), (3,4,5), (6,7,8), (0,3,6), (1,4,7), (2,5,8), (0,4,8), (2,4,6)]
+WIN_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in LINES)
+FULL_BOARD = (1 << 9) - 1
+WIN_SCORE = 100
+
+def is_win(bits: int) -> bool:
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+def iter_cells(bits: int) -> Iterator[int]:
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+class MoveQueue:
+    """Fixed size ring buffer of a player's marks, oldest first."""
+
+    def __init__(self, size: int):
+        self.cells = [0] * size
+        self.head = 0
+        self.count = 0
+
+    def push(self, cell: int) -> Optional[int]:
+        """Adds a mark and returns the evicted oldest mark if the queue was full."""
+        size = len(self.cells)
+        if self.count < size:
+            self.cells[(self.head + self.count) % size] = cell
+            self.count += 1
+            return None
+        evicted = self.cells[self.head]
+        self.cells[self.head] = cell
+        self.head = (self.head + 1) % size
+        return evicted
+
+    def __iter__(self) -> Iterator[int]:
+        size = len(self.cells)
+        for i in range(self.count):
+            yield self.cells[(self.head + i) % size]
+
+    def __len__(self) -> int:
+        return self.count
+
+class XOBoard:
+    """Tic Tac Toe board. With max_marks set (HotXO), a player's oldest mark is removed past that count."""
+
+    def __init__(self, max_marks: int = 0):
+        self.marks = [0, 0]
+        self.turn = 0
+        self.max_marks = max_marks
+        self.queues: List[MoveQueue] = [MoveQueue(max_marks), MoveQueue(max_marks)] if max_marks else []
+        self.winner: Optional[int] = None
+
+    def occupied(self) -> int:
+        return self.marks[0] | self.marks[1]
+
+    def is_free(self, cell: int) -> bool:
+        return not self.occupied() >> cell & 1
+
+    def is_full(self) -> bool:
+        return self.occupied() == FULL_BOARD
+
+    def cell(self, cell: int) -> Optional[int]:
+        """Returns the player (0 or 1) owning a cell, or None if it is empty."""
+        if self.marks[0] >> cell & 1:
+            return 0
+        if self.marks[1] >> cell & 1:
+            return 1
+        return None
+
+    def play(self, cell: int) -> Optional[int]:
+        """Places a mark for the player to move and returns the removed cell, if any."""
+        player = self.turn
+        self.marks[player] |= 1 << cell
+        removed = None
+        if self.max_marks:
+            removed = self.queues[player].push(cell)
+            if removed is not None:
+                self.marks[player] &= ~(1 << removed)
+
+        if is_win(self.marks[player]):
+            self.winner = player
+        self.turn = 1 - player
+        return removed
+
+    def history(self, player: int) -> Tuple[int, ...]:
+        if self.max_marks:
+            return tuple(self.queues[player])
+        return ()
+
+# Larger boards: width x height, k marks in a row win. Cell index is row * width + col.
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+COLUMNS = "ABCDEFGHIJKLMNO"
+
+# name -> (width, height, k)
+VARIANTS = {
+    "3x3": (3, 3, 3),
+    "4x4": (4, 4, 3),
+    "5x5": (5, 5, 4),
+    "7x7": (7, 7, 4),
+    "10x10": (10, 10, 5),
+    "15x15": (15, 15, 5)
+}
+
+class GridBoard:
+    """K-in-a-row board of any size up to 15x15, one bitboard per player."""
+
+    def __init__(self, width: int, height: int, k: int):
+        self.width = width
+        self.height = height
+        self.k = k
+        self.marks = [0, 0]
+        self.turn = 0
+        self.winner: Optional[int] = None
+        self.last_move: Optional[int] = None
+        self.full = (1 << (width * height)) - 1
+
+    def occupied(self) -> int:
+        return self.marks[0] | self.marks[1]
+
+    def is_free(self, cell: int) -> bool:
+        return not self.occupied() >> cell & 1
+
+    def is_full(self) -> bool:
+        return self.occupied() == self.full
+
+    def cell(self, cell: int) -> Optional[int]:
+        if self.marks[0] >> cell & 1:
+            return 0
+        if self.marks[1] >> cell & 1:
+            return 1
+        return None
+
+    def play(self, cell: int):
+        player = self.turn
+        self.marks[player] |= 1 << cell
+        self.last_move = cell
+        if self.wins_through(self.marks[player], cell):
+            self.winner = player
+        self.turn = 1 - player
+
+    def wins_through(self, bits: int, cell: int) -> bool:
+        # Only the 4 lines through the last move can have changed, walk at most k-1 cells each way
+        width, height, k = self.width, self.height, self.k
+        row, col = divmod(cell, width)
+        for dr, dc in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + dr * sign, col + dc * sign
+                while count < k and 0 <= r < height and 0 <= c < width and bits >> (r * width + c) & 1:
+                    count += 1
+                    r += dr * sign
+                    c += dc * sign
+            if count >= k:
+                return True
+        return False
+
+    def label(self, cell: int) -> str:
+        row, col = divmod(cell, self.width)
+        return f"{COLUMNS[col]}{row + 1}"
+
+    def parse(self, text: str) -> Optional[int]:
+        """Parses a coordinate such as "H8" into a cell, or None if it is off the board."""
+        text = text.strip().upper()
+        if len(text) < 2 or text[0] not in COLUMNS[:self.width] or not text[1:].isdigit():
+            return None
+        row = int(text[1:]) - 1
+        if not 0 <= row < self.height:
+            return None
+        return row * self.width + COLUMNS.index(text[0])
+
+# Transposition tables are shared by every game, keyed by max_marks
+_TABLES: Dict[int, Dict[tuple, int]] = {}
+
+def _place(bits: int, history: Tuple[int, ...], cell: int, max_marks: int) -> Tuple[int, Tuple[int, ...]]:
+    bits |= 1 << cell
+    if max_marks:
+        history = history + (cell,)
+        if len(history) > max_marks:
+            bits &= ~(1 << history[0])
+            history = history[1:]
+    return bits, history
+
+def _negamax(me: int, opp: int, me_hist: tuple, opp_hist: tuple, max_marks: int, depth: int, table: dict) -> int:
+    # Scores are from the point of view of the side to move and shrink by one per ply,
+    # so faster wins and slower losses are preferred without keying the table on the ply.
+    if is_win(opp):
+        return -WIN_SCORE
+    free = FULL_BOARD & ~(me | opp)
+    if not free or depth == 0:
+        return 0
+
+    key = (me_hist, opp_hist, depth) if max_marks else (me, opp)
+    cached = table.get(key)
+    if cached is not None:
+        return cached
+
+    best = -WIN_SCORE
+    for cell in iter_cells(free):
+        new_me, new_hist = _place(me, me_hist, cell, max_marks)
+        score = -_negamax(opp, new_me, opp_hist, new_hist, max_marks, depth - 1, table)
+        score -= (score > 0) - (score < 0)
+        if score > best:
+            best = score
+    table[key] = best
+    return best
+
+def score_moves(board: XOBoard, depth: int = 9) -> Dict[int, int]:
+    """Scores every free cell for the player to move. Classic boards are always solved fully."""
+    player = board.turn
+    me, opp = board.marks[player], board.marks[1 - player]
+    me_hist, opp_hist = board.history(player), board.history(1 - player)
+    if not board.max_marks:
+        depth = 9
+    table = _TABLES.setdefault(board.max_marks, {})
+
+    scores = {}
+    for cell in iter_cells(FULL_BOARD & ~(me | opp)):
+        new_me, new_hist = _place(me, me_hist, cell, board.max_marks)
+        score = -_negamax(opp, new_me, opp_hist, new_hist, board.max_marks, depth - 1, table)
+        scores[cell] = score - (score > 0) + (score < 0)
+    return scores
+
+def best_move(board: XOBoard, depth: int = 9) -> int:
+    scores = score_moves(board, depth)
+    top = max(scores.values())
+    return random.choice([cell for cell, score in scores.items() if score == top])
+
+def warm_up():
+    """Solves the classic board once so later AI moves are table lookups."""
+    score_moves(XOBoard())
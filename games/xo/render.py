@@ -0,0 +1,65 @@
+import io
+from functools import lru_cache
+from typing import Optional
+from PIL import Image, ImageDraw, ImageFont
+from .engine import COLUMNS
+
+CELL = 36
+MARGIN = 28
+GRID_COLOR = (90, 90, 100)
+BACKGROUND = (235, 222, 190)
+PLAYER_COLORS = [(214, 48, 49), (9, 132, 227)]
+LAST_MOVE = (253, 203, 110)
+
+@lru_cache(maxsize=16)
+def _background(width: int, height: int) -> Image.Image:
+    # Grid and coordinates never change for a board size, draw them once
+    img = Image.new("RGB", (MARGIN * 2 + CELL * width, MARGIN * 2 + CELL * height), BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    for i in range(width + 1):
+        x = MARGIN + i * CELL
+        draw.line([(x, MARGIN), (x, MARGIN + CELL * height)], fill=GRID_COLOR, width=1)
+    for i in range(height + 1):
+        y = MARGIN + i * CELL
+        draw.line([(MARGIN, y), (MARGIN + CELL * width, y)], fill=GRID_COLOR, width=1)
+    for col in range(width):
+        x = MARGIN + col * CELL + CELL // 2
+        draw.text((x, MARGIN // 2), COLUMNS[col], fill=GRID_COLOR, font=font, anchor="mm")
+    for row in range(height):
+        y = MARGIN + row * CELL + CELL // 2
+        draw.text((MARGIN // 2, y), str(row + 1), fill=GRID_COLOR, font=font, anchor="mm")
+    return img
+
+@lru_cache(maxsize=2)
+def _piece(player: int) -> Image.Image:
+    img = Image.new("RGBA", (CELL, CELL), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    pad = CELL // 5
+    color = PLAYER_COLORS[player]
+    if player == 0:
+        draw.line([(pad, pad), (CELL - pad, CELL - pad)], fill=color, width=4)
+        draw.line([(pad, CELL - pad), (CELL - pad, pad)], fill=color, width=4)
+    else:
+        draw.ellipse([pad, pad, CELL - pad, CELL - pad], outline=color, width=4)
+    return img
+
+@lru_cache(maxsize=256)
+def render_board(width: int, height: int, x_bits: int, o_bits: int, last_move: Optional[int] = None) -> bytes:
+    """Renders a board to PNG bytes. Results are cached by board content."""
+    img = _background(width, height).copy()
+    if last_move is not None:
+        row, col = divmod(last_move, width)
+        x, y = MARGIN + col * CELL, MARGIN + row * CELL
+        ImageDraw.Draw(img).rectangle([x + 1, y + 1, x + CELL - 1, y + CELL - 1], fill=LAST_MOVE)
+    for player, bits in enumerate((x_bits, o_bits)):
+        piece = _piece(player)
+        while bits:
+            low = bits & -bits
+            row, col = divmod(low.bit_length() - 1, width)
+            img.paste(piece, (MARGIN + col * CELL, MARGIN + row * CELL), piece)
+            bits ^= low
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
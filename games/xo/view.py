@@ -1,16 +1,23 @@
 import discord
+import io
+import asyncio
 from typing import List, Optional, Callable
+from .engine import XOBoard, GridBoard, best_move
+from .render import render_board
+
+SYMBOLS = ["❌", "⭕"]
 
 class XOView(discord.ui.View):
-    def __init__(self, p1: discord.Member, p2: discord.Member, on_win: Callable, on_draw: Callable):
+    def __init__(self, p1: discord.Member, p2: discord.Member, on_win: Callable, on_draw: Callable, ai: bool = False):
         super().__init__(timeout=300)
         self.p1 = p1
         self.p2 = p2
         self.turn = p1
-        self.board = [" " for _ in range(9)]
+        self.board = XOBoard()
         self.buttons: List[discord.ui.Button] = []
         self.on_win = on_win
         self.on_draw = on_draw
+        self.ai = ai # p2 is played by the bot
         self.game_over = False
 
         for i in range(9):
@@ -23,54 +30,197 @@ class XOView(discord.ui.View):
         async def callback(interaction: discord.Interaction):
             if self.game_over:
                 return
-            
+
             if interaction.user != self.turn:
                 return await interaction.response.send_message("It's not your turn!", ephemeral=True)
-            
-            symbol = "❌" if self.turn == self.p1 else "⭕"
-            self.board[index] = symbol
-            
-            button = self.buttons[index]
-            button.label = symbol
-            button.style = discord.ButtonStyle.danger if symbol == "❌" else discord.ButtonStyle.primary
-            button.disabled = True
-            
-            winner_symbol = self.check_winner()
-            if winner_symbol:
-                self.game_over = True
-                self.disable_all()
-                winner = self.p1 if winner_symbol == "❌" else self.p2
-                await self.on_win(interaction, winner, self.board)
-                return
-            
-            if " " not in self.board:
-                self.game_over = True
-                self.disable_all()
-                await self.on_draw(interaction, self.board)
+
+            if await self.play_move(interaction, index):
                 return
-            
-            self.turn = self.p2 if self.turn == self.p1 else self.p1
+
+            if self.ai:
+                if await self.play_move(interaction, best_move(self.board)):
+                    return
+
             await self.update_board(interaction)
 
         return callback
 
+    async def play_move(self, interaction: discord.Interaction, index: int) -> bool:
+        """Plays a move for the current turn. Returns True if the game ended."""
+        player = self.board.turn
+        self.board.play(index)
+
+        button = self.buttons[index]
+        button.label = SYMBOLS[player]
+        button.style = discord.ButtonStyle.danger if player == 0 else discord.ButtonStyle.primary
+        button.disabled = True
+
+        if self.board.winner is not None:
+            self.game_over = True
+            self.disable_all()
+            winner = self.p1 if self.board.winner == 0 else self.p2
+            await self.on_win(interaction, winner, self.board)
+            return True
+
+        if self.board.is_full():
+            self.game_over = True
+            self.disable_all()
+            await self.on_draw(interaction, self.board)
+            return True
+
+        self.turn = self.p2 if self.turn == self.p1 else self.p1
+        return False
+
     def check_winner(self) -> Optional[str]:
-        b = self.board
-        lines = [(0,1,2), (3,4,5), (6,7,8), (0,3,6), (1,4,7), (2,5,8), (0,4,8), (2,4,6)]
-        for l in lines:
-            if b[l[0]] == b[l[1]] == b[l[2]] != " ":
-                return b[l[0]]
-        return None
+        if self.board.winner is None:
+            return None
+        return SYMBOLS[self.board.winner]
 
     def disable_all(self):
         for b in self.buttons:
             b.disabled = True
 
     async def update_board(self, interaction: discord.Interaction):
-        symbol = "❌" if self.turn == self.p1 else "⭕"
+        symbol = SYMBOLS[self.board.turn]
         from core.embeds import EmbedFactory
         embed = EmbedFactory.create_embed(
             "XO Game",
             f"**Turn:** {self.turn.mention} ({symbol})"
         )
         await interaction.response.edit_message(embed=embed, view=self)
+
+class GridXOView(discord.ui.View):
+    """Button board for variants that fit Discord's 5x5 component grid."""
+
+    def __init__(self, p1: discord.Member, p2: discord.Member, board: GridBoard, on_win: Callable, on_draw: Callable):
+        super().__init__(timeout=600)
+        self.p1 = p1
+        self.p2 = p2
+        self.turn = p1
+        self.board = board
+        self.buttons: List[discord.ui.Button] = []
+        self.on_win = on_win
+        self.on_draw = on_draw
+        self.game_over = False
+
+        for i in range(board.width * board.height):
+            button = discord.ui.Button(label="\u200b", style=discord.ButtonStyle.secondary, row=i // board.width)
+            button.callback = self.make_callback(i)
+            self.buttons.append(button)
+            self.add_item(button)
+
+    def make_callback(self, index: int):
+        async def callback(interaction: discord.Interaction):
+            if self.game_over:
+                return
+
+            if interaction.user != self.turn:
+                return await interaction.response.send_message("It's not your turn!", ephemeral=True)
+
+            player = self.board.turn
+            self.board.play(index)
+            button = self.buttons[index]
+            button.label = SYMBOLS[player]
+            button.style = discord.ButtonStyle.danger if player == 0 else discord.ButtonStyle.primary
+            button.disabled = True
+
+            if self.board.winner is not None:
+                self.game_over = True
+                self.disable_all()
+                winner = self.p1 if self.board.winner == 0 else self.p2
+                return await self.on_win(interaction, winner, self.board)
+
+            if self.board.is_full():
+                self.game_over = True
+                self.disable_all()
+                return await self.on_draw(interaction, self.board)
+
+            self.turn = self.p2 if self.turn == self.p1 else self.p1
+            from core.embeds import EmbedFactory
+            embed = EmbedFactory.create_embed(
+                f"XO {self.board.width}x{self.board.height} - Connect {self.board.k}",
+                f"**Turn:** {self.turn.mention} ({SYMBOLS[self.board.turn]})"
+            )
+            await interaction.response.edit_message(embed=embed, view=self)
+
+        return callback
+
+    def disable_all(self):
+        for b in self.buttons:
+            b.disabled = True
+
+class MoveModal(discord.ui.Modal, title="Your Move"):
+    coordinate = discord.ui.TextInput(label="Coordinate", placeholder="e.g. H8", max_length=3)
+
+    def __init__(self, parent: "ImageXOView"):
+        super().__init__()
+        self.parent = parent
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await self.parent.play_coordinate(interaction, self.coordinate.value)
+
+class ImageXOView(discord.ui.View):
+    """Image board with coordinate input, for variants larger than 5x5."""
+
+    def __init__(self, p1: discord.Member, p2: discord.Member, board: GridBoard, on_win: Callable, on_draw: Callable):
+        super().__init__(timeout=900)
+        self.p1 = p1
+        self.p2 = p2
+        self.turn = p1
+        self.board = board
+        self.on_win = on_win
+        self.on_draw = on_draw
+        self.game_over = False
+
+    async def render(self) -> discord.File:
+        board = self.board
+        # Rendering runs off the event loop, repeated positions come from the cache
+        png = await asyncio.to_thread(render_board, board.width, board.height, board.marks[0], board.marks[1], board.last_move)
+        return discord.File(io.BytesIO(png), filename="board.png")
+
+    def status_embed(self, status: str = "") -> discord.Embed:
+        from core.embeds import EmbedFactory
+        embed = EmbedFactory.create_embed(
+            f"XO {self.board.width}x{self.board.height} - Connect {self.board.k}",
+            f"**{self.p1.mention} (❌) vs {self.p2.mention} (⭕)**\n{status}\n**Turn:** {self.turn.mention} ({SYMBOLS[self.board.turn]})\nPress **Play Move** and enter a coordinate like `H8`."
+        )
+        embed.set_image(url="attachment://board.png")
+        return embed
+
+    @discord.ui.button(label="Play Move", style=discord.ButtonStyle.primary)
+    async def play_move(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.game_over:
+            return
+        if interaction.user != self.turn:
+            return await interaction.response.send_message("It's not your turn!", ephemeral=True)
+        await interaction.response.send_modal(MoveModal(self))
+
+    async def play_coordinate(self, interaction: discord.Interaction, text: str):
+        if self.game_over or interaction.user != self.turn:
+            return await interaction.response.send_message("It's not your turn!", ephemeral=True)
+
+        cell = self.board.parse(text)
+        if cell is None:
+            return await interaction.response.send_message(f"`{text}` is not on the board!", ephemeral=True)
+        if not self.board.is_free(cell):
+            return await interaction.response.send_message("This spot is already taken!", ephemeral=True)
+
+        label = self.board.label(cell)
+        self.board.play(cell)
+        # Settle the turn before rendering, a second submit during the await must not move again
+        if self.board.winner is not None or self.board.is_full():
+            self.game_over = True
+            self.stop()
+        else:
+            self.turn = self.p2 if self.turn == self.p1 else self.p1
+        board_file = await self.render()
+
+        if self.board.winner is not None:
+            winner = self.p1 if self.board.winner == 0 else self.p2
+            return await self.on_win(interaction, winner, board_file)
+
+        if self.board.is_full():
+            return await self.on_draw(interaction, board_file)
+
+        embed = self.status_embed(f"Last move: **{label}**")
+        await interaction.response.edit_message(embed=embed, attachments=[board_file], view=self)
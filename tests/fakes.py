@@ -0,0 +1,26 @@
+"""Stand-ins for the Discord objects the games touch, so they run without a gateway."""
+from types import SimpleNamespace
+from core.members import MemberResolver
+
+class User(SimpleNamespace):
+    def __hash__(self):
+        return self.id
+
+class Channel(SimpleNamespace):
+    """Takes messages and keeps their text, or the embed title."""
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content or kwargs["embed"].title)
+
+def guild_with(count: int, guild_id: int = 1):
+    """A guild and its members, ids 1 to count."""
+    guild = SimpleNamespace(id=guild_id)
+    players = [User(id=i, mention=f"<@{i}>", display_name=f"P{i}", guild=guild) for i in range(1, count + 1)]
+    guild.get_member = {p.id: p for p in players}.get
+    return guild, players
+
+def client(channel=None, **config):
+    """The bot as the manager and games see it: members only from the fake guild."""
+    bot = SimpleNamespace(config=config, get_channel=lambda cid: channel, fetch_channel=None, get_cog=lambda name: None)
+    bot.members = MemberResolver(bot)
+    return bot
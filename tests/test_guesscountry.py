@@ -0,0 +1,61 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from core.timing import DISCORD_EPOCH
+from games.guesscountry import game
+from games.guesscountry.clues import COUNTRIES_PATH, CONTINENTS, CountryTable, build, clue_texts
+from games.minigames.marathon.session import MarathonSession
+from tests.fakes import guild_with
+
+def test_table_holds_every_country_and_its_clues(tmp_path):
+    path = str(tmp_path / "countries.bin")
+    build(path)
+    table = CountryTable(path)
+    with open(COUNTRIES_PATH, "r", encoding="utf-8") as f:
+        countries = json.load(f)
+
+    assert table.names == [country["name"] for country in countries]
+    assert sum(len(ids) for ids in table.by_continent.values()) == len(table)
+    for i, country in enumerate(countries):
+        assert table.continent(i) == country["continent"]
+        assert [text for _, text in table.clues(i)] == [text for _, text in clue_texts(country)]
+    for continent in CONTINENTS:
+        if table.by_continent[continent]:
+            assert table.continent(table.sample(continent)) == continent
+
+def snowflake(ms: int) -> int:
+    return ms - DISCORD_EPOCH << 22
+
+def test_a_late_answer_is_worth_less_in_a_marathon(tmp_path, monkeypatch):
+    path = str(tmp_path / "countries.bin")
+    build(path)
+    table = CountryTable(path)
+    monkeypatch.setattr(game, "get_table", lambda: table)
+    _, (player,) = guild_with(1)
+    prompt_ms = int(time.time() * 1000)
+
+    async def edit(**kwargs):
+        pass
+
+    async def send(content=None, **kwargs):
+        return SimpleNamespace(id=snowflake(prompt_ms), edit=edit)
+
+    channel = SimpleNamespace(id=10, send=send)
+    answered = []
+
+    async def wait_for(event, check, timeout):
+        if answered:
+            raise asyncio.TimeoutError # nobody else answers during arbitration
+        # The right answer, 30 seconds into the round as Discord saw it
+        for name in table.names:
+            msg = SimpleNamespace(id=snowflake(prompt_ms + 30000), channel=channel, author=player, content=name)
+            if check(msg):
+                answered.append(msg)
+                return msg
+
+    bot = SimpleNamespace(wait_for=wait_for, anticheat=SimpleNamespace(inspect=lambda game, message: None))
+    session = MarathonSession(bot, [player], channel, rounds=1)
+    winner, credit = asyncio.run(session.play_round("guesscountry", None))
+    assert winner is player
+    assert credit == game.points_at(30) / game.MAX_POINTS < 1
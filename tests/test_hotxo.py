@@ -0,0 +1,34 @@
+import random
+import pytest
+from games.hotxo.solver import DRAW, LOSS, WIN, HotXOTable, moves, play, to_bits
+from games.xo.engine import is_win
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    table = HotXOTable.load_or_build(str(tmp_path_factory.mktemp("hotxo") / "hotxo_table.bin"))
+    yield table
+    table.close()
+
+def test_counts_cover_every_reachable_position(table):
+    report = table.fairness_report()
+    assert report["win"] and report["loss"] and report["draw"]
+    assert report["opening_result"] in (WIN, LOSS, DRAW)
+    assert table.counts == HotXOTable(table.path).counts
+
+def test_results_agree_with_the_positions_they_lead_to(table):
+    rng = random.Random(1)
+    for _ in range(200):
+        me, opp = (), ()
+        for _ in range(rng.randrange(12)):
+            next_me, next_opp = play(me, opp, rng.choice(moves(me, opp)))
+            if is_win(to_bits(next_opp)):
+                break # game over, the table only holds positions still in play
+            me, opp = next_me, next_opp
+        result, _ = table.lookup(me, opp)
+        outcomes = {score[0] for score in table.score_moves(me, opp).values()}
+        # The side to move wins with one winning move, loses only if every move loses
+        assert result == (WIN if WIN in outcomes else DRAW if DRAW in outcomes else LOSS)
+
+def test_best_move_completes_a_line(table):
+    # My marks on 0 and 1 (oldest first), theirs on 3 and 4
+    assert table.best_move((0, 1), (3, 4)) == 2
@@ -0,0 +1,75 @@
+import asyncio
+import gc
+import tracemalloc
+from types import SimpleNamespace
+from core.game import GameSession
+from core.lifecycle import live_objects
+from core.manager import GameManager
+from tests.fakes import User
+
+class FakeView:
+    # Stands in for discord.ui.View, which needs a running client to be useful
+    timeout = 600
+
+    def __init__(self, players):
+        self.players = players
+        self.finished = False
+
+    def is_finished(self):
+        return self.finished
+
+    def stop(self):
+        self.finished = True
+
+    async def on_timeout(self):
+        pass
+
+async def soak(manager: GameManager, games: int):
+    guild = SimpleNamespace(id=1)
+    for i in range(games):
+        channel = SimpleNamespace(id=i, guild=guild)
+        session = GameSession("Soak", User(id=i * 4, mention=""), channel)
+        await manager.register_game(session)
+        for j in range(1, 4):
+            await manager.add_player(session, User(id=i * 4 + j, mention=""))
+        session.lifecycle.own_view(FakeView(session.players))
+        session.lifecycle.spawn(asyncio.sleep(3600))
+        await manager.set_state(session, "active")
+    await asyncio.sleep(0)
+    for game in list(manager.active_games.values()):
+        await game.end_game()
+    for _ in range(3): # let the cancelled tasks unwind
+        await asyncio.sleep(0)
+
+def test_ended_games_release_everything(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        manager = GameManager(SimpleNamespace(config={"max_games_per_guild": 10 ** 9}))
+        tracemalloc.start()
+        try:
+            retained = []
+            for _ in range(3):
+                await soak(manager, 1000)
+                gc.collect()
+                assert not manager.active_games and not manager.user_games
+                assert not manager.channel_games and not manager.guild_games and not manager.state_games
+                assert not {key: count for key, count in live_objects.snapshot().items() if key[0] == "Soak"}
+                retained.append(tracemalloc.get_traced_memory()[0])
+        finally:
+            tracemalloc.stop()
+        # The first round warms up caches and interned objects, after that memory stays flat
+        assert retained[2] - retained[1] < 64 * 1024, retained
+
+    asyncio.run(scenario())
+
+def test_ending_twice_is_a_no_op():
+    async def scenario():
+        ended = []
+        session = GameSession("Twice", User(id=1, mention=""), SimpleNamespace(id=1, guild=None))
+        session.lifecycle.on_cleanup(lambda: ended.append(True))
+        await session.end_game()
+        await session.end_game()
+        return ended
+
+    assert asyncio.run(scenario()) == [True]
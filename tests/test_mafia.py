@@ -0,0 +1,61 @@
+import asyncio
+import json
+import time
+from core.manager import GameManager
+from core.state import unpack
+from games.mafia.game import MafiaGame
+from games.mafia.state import MafiaState, Phase
+from tests.fakes import Channel, client, guild_with
+
+async def restart(game: MafiaGame) -> MafiaGame:
+    """The process dies with the phase deadline passed, a fresh manager brings the game back."""
+    game.town.deadline = time.time() - 1
+    await game.save_game()
+    game.phase_timer.cancel() # the file stays
+    manager = GameManager(client(game.channel))
+    await manager.restore_games()
+    restored = manager.get_game(game.game_id)
+    assert isinstance(restored, MafiaGame)
+    await asyncio.sleep(0.2) # the re-armed timer fires right away
+    return restored
+
+def saved_phase(game: MafiaGame) -> Phase:
+    with open(f"storage/active_games/{game.game_id}.json") as f:
+        return unpack(MafiaState, json.load(f)["type_state"]["town"]).phase
+
+def test_restart_mid_phase_carries_on(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        guild, players = guild_with(5)
+        channel = Channel(id=10, guild=guild, sent=[])
+        game = MafiaGame(None, players[0], channel)
+        await GameManager(client(channel)).register_game(game)
+        await game.start_mafia(players)
+        await game.start_game()
+        await game.start_night()
+        roles = bytes(game.town.roles)
+
+        for expected in (Phase.DAY, Phase.VOTING, Phase.NIGHT):
+            game = await restart(game)
+            assert bytes(game.town.roles) == roles
+            assert game.town.alive_ids() == [p.id for p in players]
+            assert game.town.phase == expected
+            assert saved_phase(game) == expected, "the phase change was not saved"
+        await game.end_game()
+
+    asyncio.run(scenario())
+
+def test_untyped_saves_are_dropped_on_restore(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saves = tmp_path / "storage" / "active_games"
+    saves.mkdir(parents=True)
+    # Saved before games had a type, nothing can resume it
+    (saves / "1210.json").write_text(json.dumps({"game_id": "1210", "host_id": 1, "player_ids": [1, 2], "channel_id": 10, "state": "lobby", "game_data": {}}))
+    guild, _ = guild_with(2)
+    manager = GameManager(client(Channel(id=10, guild=guild, sent=[])))
+
+    asyncio.run(manager.restore_games())
+    assert manager.get_user_game(1) is None
+    assert not manager.active_games
+    assert not list(saves.iterdir())
@@ -0,0 +1,66 @@
+import random
+from core.matching import AnswerIndex, country_index, load_country_aliases, max_typos, normalize, typo_distance
+
+def brute_force(index: AnswerIndex, text: str):
+    """What AnswerIndex.match should return, found by scoring every alias."""
+    key = normalize(text)
+    if key in index.aliases or not key:
+        return index.aliases.get(key)
+    tolerance = max_typos(key)
+    if not tolerance:
+        return None
+    scored = [(typo_distance(key, alias), alias) for alias in index.aliases if abs(len(alias) - len(key)) <= tolerance]
+    scored = [(distance, alias) for distance, alias in scored if distance <= tolerance]
+    if not scored:
+        return None
+    best = min(distance for distance, _ in scored)
+    names = {index.aliases[alias] for distance, alias in scored if distance == best}
+    return names.pop() if len(names) == 1 else None
+
+def typo(word: str, rng: random.Random) -> str:
+    letters = list(word)
+    for _ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(letters))
+        op = rng.random()
+        if op < 0.4 and i < len(letters) - 1:
+            letters[i], letters[i + 1] = letters[i + 1], letters[i]
+        elif op < 0.6 and len(letters) > 1:
+            del letters[i]
+        elif op < 0.8:
+            letters.insert(i, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+        else:
+            letters[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(letters)
+
+def test_normalize_folds_case_accents_and_punctuation():
+    assert normalize("  Côte d'Ivoire ") == "cote divoire"
+    assert normalize("The Netherlands") == "netherlands"
+    assert normalize("Türkiye") == normalize("TURKIYE")
+
+def test_typo_distance_counts_a_swap_once():
+    assert typo_distance("france", "frnace") == 1
+    assert typo_distance("france", "frnace", 0) == 1
+    assert typo_distance("kitten", "sitting") == 3
+    assert typo_distance("kitten", "sitting", 1) == 2
+
+def test_aliases_and_typos_match_the_country():
+    index = country_index(tuple(load_country_aliases()))
+    assert index.match("U.S.A.") == "United States"
+    assert index.match("Türkiye") == "Turkey"
+    assert index.match("Germnay") == "Germany"
+    assert index.match("Frnace") == "France"
+    # Too short to allow a typo, and no alias
+    assert index.match("Ira") is None
+
+def test_an_equally_close_typo_matches_neither():
+    index = AnswerIndex([("Iran", []), ("Iraq", [])])
+    assert index.match("Irak") is None
+    assert index.match("Iraq") == "Iraq"
+
+def test_index_agrees_with_brute_force():
+    index = country_index(tuple(load_country_aliases()))
+    rng = random.Random(3)
+    keys = list(index.aliases)
+    for _ in range(500):
+        typed = typo(rng.choice(keys), rng)
+        assert index.match(typed) == brute_force(index, typed), typed
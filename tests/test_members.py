@@ -0,0 +1,40 @@
+import asyncio
+from types import SimpleNamespace
+from core.members import QUERY_BATCH, MemberResolver
+from tests.fakes import User
+
+def remote_guild(count: int, gateway: bool):
+    """A guild whose members are only known to the API, not to the local cache."""
+    guild = SimpleNamespace(id=1, get_member=lambda user_id: None, queries=0, fetches=0)
+    members = {i: User(id=i, display_name=f"P{i}", guild=guild) for i in range(1, count + 1)}
+
+    async def query_members(user_ids, limit, cache):
+        guild.queries += 1
+        if not gateway:
+            raise RuntimeError("no gateway")
+        return [members[i] for i in user_ids if i in members]
+
+    async def fetch_member(user_id):
+        guild.fetches += 1
+        return members[user_id]
+
+    guild.query_members, guild.fetch_member = query_members, fetch_member
+    return guild
+
+def resolver():
+    return MemberResolver(SimpleNamespace(ws=object()))
+
+def test_prefetch_counts_each_fetched_member_once():
+    for gateway in (True, False):
+        members, guild = resolver(), remote_guild(QUERY_BATCH + 20, gateway)
+        found = asyncio.run(members.prefetch(guild, range(1, QUERY_BATCH + 21)))
+        assert len(found) == members.fetched == QUERY_BATCH + 20
+        assert guild.queries == 2
+        assert guild.fetches == (0 if gateway else QUERY_BATCH + 20)
+
+def test_prefetch_only_asks_for_unknown_members():
+    members, guild = resolver(), remote_guild(5, gateway=True)
+    asyncio.run(members.prefetch(guild, [1, 2, 3]))
+    found = asyncio.run(members.prefetch(guild, [1, 2, 3, 4, 5]))
+    assert sorted(found) == [1, 2, 3, 4, 5]
+    assert members.fetched == 5 and members.hits == 3
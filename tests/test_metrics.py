@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+import aiohttp
+from aiohttp import web
+import discord
+from core import metrics
+
+def test_registry_renders_prometheus_text():
+    registry = metrics.Registry()
+    sent = registry.counter("test_sent_total", "Messages sent.", ("kind",))
+    lobbies = registry.gauge("test_lobbies", "Open lobbies.")
+    latency = registry.histogram("test_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.collector(lambda: lobbies.set(3))
+    sent.labels("channel").inc()
+    sent.labels("channel").inc(2)
+    sent.labels('say "hi"').inc()
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    assert registry.render().splitlines() == [
+        "# HELP test_sent_total Messages sent.",
+        "# TYPE test_sent_total counter",
+        'test_sent_total{kind="channel"} 3',
+        'test_sent_total{kind="say \\"hi\\""} 1',
+        "# HELP test_lobbies Open lobbies.",
+        "# TYPE test_lobbies gauge",
+        "test_lobbies 3",
+        "# HELP test_seconds Latency.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{le="0.1"} 1',
+        'test_seconds_bucket{le="1"} 2',
+        'test_seconds_bucket{le="+Inf"} 3',
+        "test_seconds_sum 5.55",
+        "test_seconds_count 3",
+    ]
+
+def test_failing_collector_does_not_break_the_scrape():
+    registry = metrics.Registry()
+    registry.gauge("test_up", "Up.").set(1)
+    registry.collector(lambda: 1 / 0)
+    assert "test_up 1" in registry.render()
+
+def test_interactions_are_timed_and_only_replies_count_as_messages():
+    async def callback(request: web.Request) -> web.Response:
+        kind = (await request.json())["type"]
+        return web.json_response({"interaction": {"id": request.match_info["id"]}, "resource": {"type": kind}})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_post("/api/v10/interactions/{id}/{token}/callback", callback)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with aiohttp.ClientSession(trace_configs=[metrics.http_trace()]) as session:
+                replies = []
+                for interaction_id, kind in ((1, discord.InteractionResponseType.deferred_message_update),
+                                             (2, discord.InteractionResponseType.message_update),
+                                             (3, discord.InteractionResponseType.channel_message)):
+                    interaction = SimpleNamespace(id=interaction_id, type=discord.InteractionType.component, command=None)
+                    metrics.interaction_timer.received(interaction)
+                    url = f"http://127.0.0.1:{port}/api/v10/interactions/{interaction_id}/token/callback"
+                    async with session.post(url, json={"type": kind.value}) as response:
+                        # The trace read the body first, the caller must still get it
+                        replies.append((await response.json())["resource"]["type"])
+                return replies
+        finally:
+            await runner.cleanup()
+
+    timed = metrics.INTERACTIONS.labels("component")
+    count_before = timed.counts.tolist()
+    sent_before = metrics.SENT_INTERACTION.cell[0]
+
+    assert asyncio.run(scenario()) == [6, 7, 4]
+    assert sum(timed.counts) - sum(count_before) == 3
+    assert metrics.SENT_INTERACTION.cell[0] - sent_before == 1
+    assert not metrics.interaction_timer.pending
+
+def test_unanswered_interactions_are_forgotten():
+    timer = metrics.InteractionTimer()
+    for interaction_id in range(metrics.MAX_PENDING + 10):
+        timer.received(SimpleNamespace(id=interaction_id, type=discord.InteractionType.component, command=None))
+    assert len(timer.pending) == metrics.MAX_PENDING
+    assert next(iter(timer.pending)) == 10
+
+def test_endpoint_serves_the_registry():
+    async def scrape():
+        server = metrics.MetricsServer(port=0)
+        await server.start()
+        try:
+            port = server.runner.addresses[0][1]
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"http://127.0.0.1:{port}/metrics") as response:
+                    return response.status, response.content_type, await response.text()
+        finally:
+            await server.stop()
+
+    status, content_type, text = asyncio.run(scrape())
+    assert (status, content_type) == (200, "text/plain")
+    assert "# TYPE bot_interaction_seconds histogram" in text
+    assert text.endswith("\n")
@@ -0,0 +1,88 @@
+import io
+import os
+import pytest
+from PIL import Image
+from games.minigames import render
+from games.minigames.confusables import DIFFICULTIES, ConfusablesIndex, build as build_confusables
+from games.minigames.corpus import Corpus, ShuffleBag, build as build_corpus, is_stale
+from games.minigames.guessthecolor.palette import LEVELS, get_palette
+
+def test_shuffle_bag_walks_a_permutation():
+    for size in (1, 2, 7, 64, 1000):
+        bag = ShuffleBag(size)
+        assert sorted(bag.draw() for _ in range(size)) == list(range(size))
+        # The next pass is a fresh permutation of the same values
+        assert sorted(bag.draw() for _ in range(size)) == list(range(size))
+
+def test_empty_shuffle_bag_is_rejected():
+    with pytest.raises(ValueError):
+        ShuffleBag(0)
+
+@pytest.fixture
+def corpus(tmp_path):
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(["apple", "banana", "cherry", "damson", "elderberry", "fig", "grape", "Paris", "it's"]))
+    path = str(tmp_path / "words.bin")
+    build_corpus(path, [str(source)])
+    corpus = Corpus(path)
+    yield corpus
+    corpus.close()
+
+def test_corpus_keeps_only_plain_lower_case_words(corpus):
+    words = {corpus.word(i) for i in range(corpus.count)}
+    assert words == {"APPLE", "BANANA", "CHERRY", "DAMSON", "ELDERBERRY", "FIG", "GRAPE"}
+    for i in range(corpus.count):
+        assert "".join(corpus.split(i)) == "".join(corpus.fragments(i)) == corpus.word(i)
+
+def test_corpus_draws_do_not_repeat_within_a_channel(corpus):
+    ranges = corpus.ranges("normal", 5)
+    total = sum(count for _, count in ranges)
+    for channel in (1, 2):
+        assert len({corpus.draw(channel, "normal", 5) for _ in range(total)}) == total
+
+def test_corpus_without_matching_words_says_so(corpus):
+    with pytest.raises(ValueError):
+        corpus.draw(1, "normal", 14, 15)
+
+def test_corpus_is_rebuilt_when_the_source_changes(corpus, tmp_path):
+    source = tmp_path / "words.txt"
+    assert not is_stale(corpus.path, [str(source)])
+    built = os.path.getmtime(corpus.path)
+    os.utime(source, (built + 10, built + 10))
+    assert is_stale(corpus.path, [str(source)])
+
+def test_palette_levels_do_not_repeat_until_used_up():
+    palette = get_palette()
+    for level in LEVELS:
+        size = len(palette.levels[level])
+        assert len({palette.sample(level) for _ in range(size)}) == size
+
+def test_palette_matches_typos_and_scores_by_distance():
+    palette = get_palette()
+    purple = palette.lookup("Purple")
+    assert palette.lookup("purpel") == purple
+    table = palette.distances(palette.lab[purple])
+    assert table[purple] == 0
+    nearest = palette.nearest(table, 3, exclude=purple)
+    assert purple not in nearest and list(table[nearest]) == sorted(table[nearest])
+
+def test_confusables_pairs_differ(tmp_path):
+    path = str(tmp_path / "confusables.bin")
+    build_confusables(path)
+    index = ConfusablesIndex(path)
+    try:
+        for difficulty in DIFFICULTIES:
+            assert index.stats()[difficulty]
+            for _ in range(50):
+                filler, target = index.sample(difficulty)
+                assert filler != target
+    finally:
+        index.close()
+
+def test_rendering_is_deterministic_png():
+    first = render.render_text("HELLO")
+    render.render_text.cache_clear()
+    assert render.render_text("HELLO") == first
+    image = Image.open(io.BytesIO(first))
+    assert image.format == "PNG" and image.width > image.height
+    assert Image.open(io.BytesIO(render.render_grid(tuple("abcd"), 2))).format == "PNG"
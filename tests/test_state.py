@@ -0,0 +1,95 @@
+import json
+import random
+import tracemalloc
+from core.state import pack, unpack
+from games.hideseek.state import HideSeekState
+from games.mafia.state import MafiaState, Role
+from games.roulette.state import RouletteState
+
+GAMES = 1000
+rng = random.Random(1)
+
+def user_ids(count: int):
+    return [rng.getrandbits(62) | 1 << 56 for _ in range(count)]
+
+# The state the games kept before, as dicts, lists and sets keyed by user id
+def mafia_dicts(ids):
+    roles = ["mafia", "doctor", "detective"] + ["villager"] * (len(ids) - 3)
+    return {
+        "players_roles": dict(zip(ids, roles)),
+        "alive_players": list(ids),
+        "night_actions": {"kill": ids[0], "protect": ids[1], "investigate": None},
+        "acted_players": set(ids[:2]),
+        "votes": {voter: ids[0] for voter in ids[1:]},
+    }
+
+def mafia_model(ids):
+    state = MafiaState(ids, [Role.MAFIA, Role.DOCTOR, Role.DETECTIVE] + [Role.VILLAGER] * (len(ids) - 3))
+    state.record_night("kill", ids[0])
+    state.record_night("protect", ids[1])
+    for voter in ids[:2]:
+        state.mark_acted(voter)
+    for voter in ids[1:]:
+        state.vote(voter, ids[0])
+    return state
+
+def roulette_dicts(ids):
+    return {
+        "bets": {pid: [{"amount": 50, "type": "Red"}, {"amount": 10, "type": "17"}] for pid in ids},
+        "player_credits": {pid: 940 for pid in ids},
+    }
+
+def roulette_model(ids):
+    state = RouletteState(ids)
+    for pid in ids:
+        state.place(pid, "Red", 50)
+        state.place(pid, "17", 10)
+    return state
+
+def hideseek_dicts(ids):
+    spots = {pid: f"Spot {i % 5}" for i, pid in enumerate(ids[1:])}
+    spot_hiders = {}
+    for pid, spot in spots.items():
+        spot_hiders.setdefault(spot, set()).add(pid)
+    return {"hider_locations": spots, "spot_hiders": spot_hiders}
+
+def hideseek_model(ids):
+    state = HideSeekState(ids, seeker=ids[0], spot_count=5)
+    for i, pid in enumerate(ids[1:]):
+        state.hide(pid, i % 5)
+    return state
+
+CASES = [(10, mafia_dicts, mafia_model), (6, roulette_dicts, roulette_model), (8, hideseek_dicts, hideseek_model)]
+
+def bytes_per_game(build, lobbies) -> float:
+    tracemalloc.start()
+    try:
+        states = [build(ids) for ids in lobbies]
+        return tracemalloc.get_traced_memory()[0] / len(states)
+    finally:
+        tracemalloc.stop()
+
+def test_models_round_trip():
+    for players, _, build in CASES:
+        state = build(user_ids(players))
+        assert type(state).from_bytes(state.to_bytes()).to_bytes() == state.to_bytes()
+        assert unpack(type(state), pack(state)).to_bytes() == state.to_bytes()
+
+def test_models_are_smaller_than_the_dicts_they_replace():
+    for players, before, after in CASES:
+        lobbies = [user_ids(players) for _ in range(GAMES)]
+        assert bytes_per_game(after, lobbies) < 0.75 * bytes_per_game(before, lobbies), after.__name__
+        assert len(after(lobbies[0]).to_bytes()) < len(json.dumps(before(lobbies[0]), default=list))
+
+def test_hideseek_search_finds_only_that_spot():
+    ids = user_ids(6)
+    state = hideseek_model(ids)
+    hidden = state.hidden_count()
+    found = state.search(2)
+    assert sorted(found) == sorted(pid for i, pid in enumerate(ids[1:]) if i % 5 == 2)
+    assert state.hidden_count() == hidden - len(found)
+    assert not any(state.is_hidden(pid) for pid in found)
+    # Moving a player between spots keeps the index consistent through a save
+    state.hide(ids[1], 3)
+    restored = HideSeekState.from_bytes(state.to_bytes())
+    assert sorted(restored.search(3)) == sorted(state.search(3))
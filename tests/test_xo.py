@@ -0,0 +1,64 @@
+import asyncio
+import random
+from types import SimpleNamespace
+from games.xo import engine
+from games.xo.engine import FULL_BOARD, GridBoard, XOBoard, best_move, iter_cells, score_moves
+from games.xo.view import ImageXOView
+from tests.fakes import guild_with
+
+def positions(games: int = 50):
+    """Boards with the AI to move, taken from random games."""
+    found = []
+    rng = random.Random(1)
+    for _ in range(games):
+        board = XOBoard()
+        while board.winner is None and not board.is_full():
+            if board.turn == 1:
+                found.append((list(board.marks), board.turn))
+            board.play(rng.choice(list(iter_cells(FULL_BOARD & ~board.occupied()))))
+    return found
+
+def board_of(marks, turn) -> XOBoard:
+    board = XOBoard()
+    board.marks, board.turn = list(marks), turn
+    return board
+
+def test_warm_table_scores_like_a_cold_one():
+    boards = positions()
+    engine._TABLES.clear()
+    cold = [score_moves(board_of(marks, turn)) for marks, turn in boards]
+    engine.warm_up()
+    assert [score_moves(board_of(marks, turn)) for marks, turn in boards] == cold
+
+def test_ai_takes_a_win_and_blocks_one():
+    board = XOBoard()
+    for cell in (0, 3, 1):
+        board.play(cell)
+    # O to move: X threatens 2, O cannot win yet
+    assert best_move(board) == 2
+    board.play(4)
+    board.play(8)
+    # O has 3 and 4, 5 wins on the spot
+    assert best_move(board) == 5
+
+def interaction(user, replies):
+    async def reply(content=None, **kwargs):
+        replies.append(content)
+    return SimpleNamespace(user=user, response=SimpleNamespace(send_message=reply, edit_message=reply))
+
+def test_image_board_takes_one_move_per_turn():
+    async def main():
+        _, (p1, p2) = guild_with(2)
+        view = ImageXOView(p1, p2, GridBoard(7, 7, 5), None, None)
+        replies = []
+        # Two modal submits from the same player land while the first board renders
+        await asyncio.gather(
+            view.play_coordinate(interaction(p1, replies), "A1"),
+            view.play_coordinate(interaction(p1, replies), "B1"),
+        )
+        return view, replies
+
+    view, replies = asyncio.run(main())
+    assert bin(view.board.marks[0]).count("1") == 1 and view.board.marks[1] == 0
+    assert view.turn == view.p2
+    assert "It's not your turn!" in replies